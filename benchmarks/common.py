@@ -0,0 +1,137 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks run against a throwaway database in a temporary directory and
+never touch the user's notes.
+"""
+
+import random
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import gi
+
+gi.require_version("Gom", "1.0")
+
+# Add the parent directory to sys.path to import norka modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import nanoid  # noqa: E402
+
+from norka.models import DatabaseManager  # noqa: E402
+from norka.models.database import (  # noqa: E402
+    DEFAULT_DATABASE_PROFILE,
+    execute_sql,
+)
+
+WORDS = (
+    "alpha beta gamma delta epsilon zeta theta kappa lambda sigma omega "
+    "meeting notes project roadmap budget design review draft release plan "
+    "research idea summary travel recipe journal todo archive backlog"
+).split()
+
+
+@contextmanager
+def temporary_database(profile: str = DEFAULT_DATABASE_PROFILE):
+    """Yield a DatabaseManager backed by a fresh database file."""
+    with tempfile.TemporaryDirectory(prefix="norka-bench-") as directory:
+        database = DatabaseManager(str(Path(directory) / "bench.db"), profile)
+        try:
+            yield database
+        finally:
+            database.close()
+
+
+def random_text(words: int) -> str:
+    return " ".join(random.choice(WORDS) for _ in range(words))
+
+
+def populate_pages(
+    database: DatabaseManager,
+    workspace_id: str,
+    count: int,
+    words_per_page: int = 200,
+    fanout: int = 0,
+) -> list[str]:
+    """
+    Insert pages in a single transaction.
+
+    Args:
+        database: Database to fill
+        workspace_id: Workspace the pages belong to
+        count: Number of pages
+        words_per_page: Length of the generated page text
+        fanout: Children per page; 0 puts every page at the root
+
+    Returns:
+        List of the inserted page ids in insertion order
+    """
+    ids = [nanoid.generate() for _ in range(count)]
+    now = int(time.time())
+
+    def insert(adapter):
+        execute_sql(adapter, "BEGIN")
+        for i, page_id in enumerate(ids):
+            parent_id = ids[(i - 1) // fanout] if fanout and i else None
+            execute_sql(
+                adapter,
+                'INSERT INTO pages (id, "workspace-id", title, '
+                '"parent-page-id", "sort-order", "created-at", "updated-at", '
+                '"last-accessed") VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    page_id,
+                    workspace_id,
+                    random_text(4).title(),
+                    parent_id,
+                    i,
+                    now,
+                    now,
+                    now - i,
+                ),
+            )
+            execute_sql(
+                adapter,
+                "INSERT INTO page_contents (page_id, text) VALUES (?, ?)",
+                (page_id, random_text(words_per_page)),
+            )
+        execute_sql(adapter, "COMMIT")
+
+    database.run_in_adapter(insert)
+    return ids
+
+
+def measure(func, repeat: int = 5) -> float:
+    """Return the best wall time of func in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
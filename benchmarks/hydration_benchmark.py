@@ -0,0 +1,79 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Measure loading every page of a workspace through Gom.
+
+Reports the time of get_workspace_pages(), the memory blocks allocated by
+the Python side of hydrating the pages, and the same after turning on
+change tracking for every page, which is what each page paid on load
+before hydration skipped it. Run it on both sides of a change to
+compare.
+
+Usage: python benchmarks/hydration_benchmark.py [page counts...]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from common import populate_pages, temporary_database
+
+from norka.services import PageService
+
+
+def load(database, track: bool):
+    # A fresh service each time, so no page is served from the identity map
+    service = PageService(database=database)
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    pages = service.get_workspace_pages("bench")
+    if track:
+        for page in pages:
+            page.track_changes()
+    elapsed = (time.perf_counter() - started) * 1000
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    size = sum(stat.size for stat in snapshot.statistics("filename"))
+    return elapsed, blocks, size // 1024
+
+
+def run(count: int):
+    with temporary_database() as database:
+        populate_pages(database, "bench", count, words_per_page=50)
+
+        print(f"\n{count} pages")
+        print(f"{'pages':<12}{'ms':>10}{'blocks':>12}{'KiB':>10}")
+        for name, track in (("hydrated", False), ("tracked", True)):
+            elapsed, blocks, size = load(database, track)
+            print(f"{name:<12}{elapsed:>10.1f}{blocks:>12}{size:>10}")
+
+
+if __name__ == "__main__":
+    for count in [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000]:
+        run(count)
@@ -0,0 +1,76 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Compare listing full Page rows with listing PageSummary metadata.
+
+Memory is the growth of the resident set while the result is alive, since
+Gom keeps the column values of loaded resources outside the Python heap.
+
+Usage: python benchmarks/page_listing_benchmark.py [page counts...]
+"""
+
+import gc
+import os
+import sys
+from functools import partial
+
+from common import measure, populate_pages, temporary_database
+
+from norka.services import PageService
+
+
+def resident_kib() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def retained_kib(func) -> int:
+    gc.collect()
+    before = resident_kib()
+    result = func()  # noqa: F841
+    return resident_kib() - before
+
+
+def run(count: int):
+    with temporary_database() as database:
+        service = PageService(database=database)
+        populate_pages(database, "bench", count, words_per_page=1000, fanout=8)
+
+        full = partial(service.get_workspace_pages, "bench")
+        summary = partial(service.get_workspace_page_summaries, "bench")
+
+        print(f"\n{count} pages")
+        print(f"{'listing':<10}{'ms':>10}{'KiB':>12}")
+        # Measure the summaries first, so they cannot reuse memory freed by
+        # the full listing
+        for name, func in (("summary", summary), ("full", full)):
+            memory = retained_kib(func)
+            latency = measure(func, repeat=3)
+            print(f"{name:<10}{latency:>10.1f}{memory:>12}")
+
+
+if __name__ == "__main__":
+    for count in [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000]:
+        run(count)
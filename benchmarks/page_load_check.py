@@ -0,0 +1,107 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Check that a page loaded in chunks ends up with all of its tags.
+
+Replays the steps of plan_page_load() into a TagRangeTracker the way the
+editor applies them to its buffer, for pages whose tag ranges end in
+several text chunks, and compares the result with the saved tag table.
+The script exits with a non-zero status when a range is dropped, applied
+twice or stretched by the text loaded after it.
+
+Registered as the ``page-load`` meson test.
+
+Usage: python benchmarks/page_load_check.py
+"""
+
+import random
+import sys
+
+import common  # noqa: F401  # puts norka on sys.path
+
+from norka.models import TagRangeTracker, plan_page_load
+from norka.models.page_load import LOAD_CHUNK_CHARS, LOAD_TAG_BATCH
+
+TAGS = ("bold", "italic", "underline", "strikethrough", "code")
+
+# (name, text length, ranges, chunk chars)
+CASES = (
+    ("small chunks", 1_000, 390, 128),
+    ("default chunks", LOAD_CHUNK_CHARS * 3 + 500, 390, LOAD_CHUNK_CHARS),
+    ("range per chunk end", LOAD_CHUNK_CHARS * 4, 4 * LOAD_TAG_BATCH, LOAD_CHUNK_CHARS),
+)
+
+
+def make_ranges(rng: random.Random, length: int, count: int) -> list:
+    """Random (start, end, tag) ranges spread over the whole text."""
+    ranges = []
+    for _ in range(count):
+        start = rng.randrange(length - 1)
+        end = min(length, start + rng.randint(1, 40))
+        ranges.append((start, end, rng.choice(TAGS)))
+    return ranges
+
+
+def replay(text: str, ranges: list, chunk_chars: int) -> tuple:
+    """Load the text the way the editor does, tracking the applied tags."""
+    tracker = TagRangeTracker()
+    loaded = 0
+    applied = 0
+    for step in plan_page_load(text, ranges, chunk_chars=chunk_chars):
+        if step.text:
+            tracker.insert(loaded, len(step.text))
+            loaded += len(step.text)
+        for start, end, tag in step.ranges:
+            tracker.add(tag, start, end)
+            applied += 1
+    return tracker.to_dict(), loaded, applied
+
+
+def main() -> int:
+    rng = random.Random(42)
+    failures = 0
+    for name, length, count, chunk_chars in CASES:
+        text = "x" * length
+        ranges = make_ranges(rng, length, count)
+        if name == "range per chunk end":
+            # Ranges ending right where a chunk ends are the easiest to stretch
+            ends = range(chunk_chars, length, chunk_chars)
+            ranges += [(end - 10, end, "bold") for end in ends]
+
+        expected = TagRangeTracker()
+        for start, end, tag in ranges:
+            expected.add(tag, start, end)
+
+        tags, loaded, applied = replay(text, ranges, chunk_chars)
+        ok = tags == expected.to_dict() and loaded == length and applied == len(ranges)
+        status = "ok" if ok else "FAIL"
+        print(f"{status:<6}{name:<24}{applied}/{len(ranges)} ranges, {loaded} chars")
+        failures += not ok
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
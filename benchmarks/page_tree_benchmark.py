@@ -0,0 +1,117 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Measure page tree building for flat and nested workspaces.
+
+The builders only read id, parent_page_id, sort_order, title and icon, so the
+benchmark feeds them lightweight stand-ins instead of database rows. Memory
+is what the built structure retains, without the input pages.
+
+Usage: python benchmarks/page_tree_benchmark.py [node counts...]
+"""
+
+import random
+import sys
+import tracemalloc
+
+from common import measure
+
+from norka.models import PageNode, PageTreeIndex
+
+# Above this size the old builder takes minutes on a flat workspace
+LEGACY_LIMIT = 10_000
+
+
+class FakePage:
+    __slots__ = ("id", "parent_page_id", "sort_order", "title", "icon")
+
+    def __init__(self, page_id, parent_page_id, sort_order, title):
+        self.id = page_id
+        self.parent_page_id = parent_page_id
+        self.sort_order = sort_order
+        self.title = title
+        self.icon = None
+
+
+def make_pages(count: int, fanout: int) -> list[FakePage]:
+    pages = []
+    for i in range(count):
+        parent_id = str((i - 1) // fanout) if fanout and i else None
+        pages.append(FakePage(str(i), parent_id, random.randint(0, 100), f"Page {i}"))
+    random.shuffle(pages)
+    return pages
+
+
+def retained_kib(func) -> float:
+    """Return the memory still held by the result of func in KiB."""
+    tracemalloc.start()
+    result = func()  # noqa: F841
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / 1024
+
+
+def legacy_build_tree(pages: list[FakePage]) -> list[PageNode]:
+    """The get_page_tree implementation that re-sorted on every insert."""
+    node_map = {page.id: PageNode(page) for page in pages}
+    root_nodes = []
+    for page in pages:
+        node = node_map[page.id]
+        if page.parent_page_id and page.parent_page_id in node_map:
+            parent_node = node_map[page.parent_page_id]
+            node.parent = parent_node
+            parent_node.children.append(node)
+            parent_node.children.sort(key=lambda x: (x.page.sort_order, x.page.title))
+        else:
+            root_nodes.append(node)
+    root_nodes.sort(key=lambda x: (x.page.sort_order, x.page.title))
+    return root_nodes
+
+
+def run(count: int):
+    print(f"\n{count} nodes")
+    print(
+        f"{'shape':<10}{'legacy, ms':>14}{'bulk, ms':>12}{'index, ms':>12}"
+        f"{'bulk, KiB':>12}{'index, KiB':>12}"
+    )
+    for shape, fanout in (("flat", 0), ("nested", 8)):
+        pages = make_pages(count, fanout)
+        bulk = measure(lambda: PageNode.build_tree(pages), repeat=3)
+        index = measure(lambda: PageTreeIndex.build(pages), repeat=3)
+        if count <= LEGACY_LIMIT:
+            legacy = f"{measure(lambda: legacy_build_tree(pages), repeat=1):>14.1f}"
+        else:
+            legacy = f"{'skipped':>14}"
+        bulk_memory = retained_kib(lambda: PageNode.build_tree(pages))
+        index_memory = retained_kib(lambda: PageTreeIndex.build(pages))
+        print(
+            f"{shape:<10}{legacy}{bulk:>12.1f}{index:>12.1f}"
+            f"{bulk_memory:>12.0f}{index_memory:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    for count in [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]:
+        run(count)
@@ -0,0 +1,208 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+"""
+Check that the hot service queries are served by indexes.
+
+Gom lookups are checked with the SELECT statements Gom's command builder
+writes for them: every mapped column, quoted as ``'table'.'column'``, and
+the LIMIT/OFFSET of a fetched window. Raw service queries are checked with
+the SQL the services run. The script exits with a non-zero status when any
+of them falls back to a full table scan or a temporary sort.
+
+Registered as the ``query-plans`` meson test.
+
+Usage: python benchmarks/query_plan_check.py
+"""
+
+import sys
+
+from common import populate_pages, temporary_database
+from gi.repository import Gom
+
+from norka.models import Page, Workspace
+from norka.models.page import PAGE_BODY_PROPERTIES
+from norka.services.page_service import PAGE_SUMMARY_QUERY
+
+
+def gom_select(
+    resource_type: type,
+    table: str,
+    where: tuple = (),
+    order: str = None,
+    descending: bool = False,
+) -> str:
+    """
+    Build the SELECT of a Gom find as its command builder writes it.
+
+    Args:
+        resource_type: Gom.Resource subclass
+        table: Table of the resource
+        where: Filtered columns, as Gom.Filter.new_eq() or new_is_null()
+            joined with new_and(); None values stand for IS NULL
+        order: Column of the Gom.Sorting, if any
+        descending: Whether the sorting is descending
+    """
+    # Unmapped properties are left out, property names use dashes
+    unmapped = PAGE_BODY_PROPERTIES if resource_type is Page else ()
+    skipped = {name.replace("_", "-") for name in unmapped}
+    columns = [
+        pspec.name
+        for pspec in resource_type.list_properties()
+        if pspec.owner_type != Gom.Resource.__gtype__ and pspec.name not in skipped
+    ]
+    sql = "SELECT " + ", ".join(f"'{table}'.'{name}' AS '{name}'" for name in columns)
+    sql += f" FROM '{table}'"
+
+    conditions = [
+        f"('{table}'.'{column}' IS NULL)"
+        if value is None
+        else f"('{table}'.'{column}' == ?)"
+        for column, value in where
+    ]
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    if order:
+        sql += f" ORDER BY '{table}'.'{order}' {'DESC' if descending else 'ASC'}"
+    return sql + " LIMIT ? OFFSET ?"
+
+
+def gom_params(where: tuple) -> tuple:
+    return tuple(value for _, value in where if value is not None) + (100, 0)
+
+
+GOM_LOOKUPS = {
+    "get_page": (Page, "pages", (("id", "page"),), None, False),
+    "get_page_by_title": (
+        Page,
+        "pages",
+        (("title", "Title"), ("workspace-id", "bench")),
+        None,
+        False,
+    ),
+    "get_workspace_pages": (
+        Page,
+        "pages",
+        (("workspace-id", "bench"),),
+        "sort-order",
+        False,
+    ),
+    "get_root_pages": (
+        Page,
+        "pages",
+        (("workspace-id", "bench"), ("parent-page-id", None)),
+        "sort-order",
+        False,
+    ),
+    "get_child_pages": (
+        Page,
+        "pages",
+        (("parent-page-id", "parent"),),
+        "sort-order",
+        False,
+    ),
+    "get_favorite_pages": (
+        Page,
+        "pages",
+        (("workspace-id", "bench"), ("is-favorite", True)),
+        "updated-at",
+        True,
+    ),
+    "get_recent_pages": (
+        Page,
+        "pages",
+        (("workspace-id", "bench"), ("is-archived", False)),
+        "last-accessed",
+        True,
+    ),
+    "get_workspace": (Workspace, "workspaces", (("id", "bench"),), None, False),
+    "get_all_workspaces": (Workspace, "workspaces", (), "name", True),
+}
+
+SERVICE_QUERIES = {
+    "get_workspace_page_summaries": (
+        PAGE_SUMMARY_QUERY.format(where='"workspace-id" = ?'),
+        ("bench",),
+    ),
+    "get_root_page_summaries": (
+        PAGE_SUMMARY_QUERY.format(
+            where='"workspace-id" = ? AND "parent-page-id" IS NULL'
+        ),
+        ("bench",),
+    ),
+    "get_child_page_summaries": (
+        PAGE_SUMMARY_QUERY.format(where='"parent-page-id" = ?'),
+        ("parent",),
+    ),
+    "page_body": (
+        "SELECT text, content, tag_table FROM page_contents WHERE page_id = ?",
+        ("page",),
+    ),
+    "subtree": (
+        "SELECT descendant_id FROM page_closure WHERE ancestor_id = ?",
+        ("parent",),
+    ),
+    "tree_position": (
+        """
+        SELECT COUNT(*) FROM pages
+        WHERE "workspace-id" = ? AND "parent-page-id" IS ? AND id != ?
+        AND ("sort-order", title) < (?, ?)
+        """,
+        ("bench", "parent", "page", 0, "title"),
+    ),
+    "is_descendant": (
+        "SELECT 1 FROM page_closure WHERE ancestor_id = ? AND descendant_id = ?",
+        ("parent", "child"),
+    ),
+}
+
+
+def is_full_scan(detail: str) -> bool:
+    if detail.startswith("SCAN ") and "USING" not in detail:
+        return True
+    return "USE TEMP B-TREE" in detail
+
+
+def main() -> int:
+    queries = {
+        name: (gom_select(resource_type, table, where, order, desc), gom_params(where))
+        for name, (resource_type, table, where, order, desc) in GOM_LOOKUPS.items()
+    }
+    queries.update(SERVICE_QUERIES)
+
+    failures = 0
+    with temporary_database() as database:
+        populate_pages(database, "bench", 1000, words_per_page=1, fanout=8)
+
+        for name, (sql, params) in queries.items():
+            plan = database.explain_query_plan(sql, params)
+            bad = [detail for detail in plan if is_full_scan(detail)]
+            status = "FAIL" if bad else "ok"
+            print(f"{status:<6}{name:<30}{' | '.join(plan)}")
+            failures += bool(bad)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Compare FTS5 page search with the previous in-Python substring scan.
+
+Usage: python benchmarks/search_benchmark.py [page counts...]
+"""
+
+import sys
+
+from common import measure, populate_pages, temporary_database
+
+from norka.services import PageService
+
+QUERIES = ("roadmap", "rel", "budget review", "nothingmatches")
+
+
+def legacy_search(service: PageService, workspace_id: str, query: str):
+    """The search_pages implementation that predates the FTS5 index."""
+    query_lower = query.lower()
+    rows = service._database.query(
+        """
+        SELECT p.id, p.title, c.text FROM pages AS p
+        LEFT JOIN page_contents AS c ON c.page_id = p.id
+        WHERE p."workspace-id" = ?
+        """,
+        (workspace_id,),
+    )
+    return [
+        page_id
+        for page_id, title, text in rows
+        if query_lower in title.lower() or (text and query_lower in text.lower())
+    ]
+
+
+def run(count: int):
+    with temporary_database() as database:
+        service = PageService(database=database)
+        populate_pages(database, "bench", count)
+
+        print(f"\n{count} pages")
+        print(f"{'query':<16}{'scan, ms':>12}{'fts5, ms':>12}")
+        for query in QUERIES:
+            scan = measure(lambda: legacy_search(service, "bench", query), repeat=1)
+            fts = measure(lambda: service.search_pages("bench", query))
+            print(f"{query:<16}{scan:>12.1f}{fts:>12.1f}")
+
+
+if __name__ == "__main__":
+    for count in [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]:
+        run(count)
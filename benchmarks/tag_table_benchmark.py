@@ -0,0 +1,79 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Compare the binary tag table encoding with the JSON one it replaces.
+
+Usage: python benchmarks/tag_table_benchmark.py [range counts...]
+"""
+
+import json
+import random
+import sys
+
+from common import measure
+
+from norka.models import decode_tag_table, encode_tag_table
+
+TAGS = ("bold", "italic", "underline", "strikethrough", "code", "link", "heading2")
+
+
+def random_tag_table(ranges: int) -> dict:
+    """Spread non-overlapping ranges per tag over a page of prose."""
+    tag_table = {}
+    for name in TAGS:
+        offset = 0
+        tag_ranges = []
+        for _ in range(ranges // len(TAGS)):
+            offset += random.randint(5, 400)
+            length = random.randint(1, 60)
+            tag_ranges.append((offset, offset + length))
+            offset += length
+        tag_table[name] = tag_ranges
+    return tag_table
+
+
+def run(ranges: int):
+    tag_table = random_tag_table(ranges)
+    as_json = json.dumps(tag_table)
+    as_binary = encode_tag_table(tag_table)
+    assert decode_tag_table(as_binary) == tag_table
+
+    print(f"\n{ranges} ranges")
+    print(f"{'format':<10}{'bytes':>10}{'encode, ms':>14}{'decode, ms':>14}")
+    print(
+        f"{'json':<10}{len(as_json.encode()):>10}"
+        f"{measure(lambda: json.dumps(tag_table)):>14.3f}"
+        f"{measure(lambda: json.loads(as_json)):>14.3f}"
+    )
+    print(
+        f"{'binary':<10}{len(as_binary):>10}"
+        f"{measure(lambda: encode_tag_table(tag_table)):>14.3f}"
+        f"{measure(lambda: decode_tag_table(as_binary)):>14.3f}"
+    )
+
+
+if __name__ == "__main__":
+    for count in [int(arg) for arg in sys.argv[1:]] or [100, 1_000, 10_000]:
+        run(count)
@@ -0,0 +1,69 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Compare write throughput of the database tuning profiles.
+
+Every create is its own transaction, so those numbers are dominated by
+journal and sync costs. Updates go through the write queue and are
+committed in groups.
+
+Usage: python benchmarks/write_benchmark.py [saves...]
+"""
+
+import sys
+import time
+
+from common import random_text, temporary_database
+
+from norka.models.database import DATABASE_PROFILES
+from norka.services import PageService
+
+
+def run(count: int):
+    print(f"\n{count} saves")
+    print(f"{'profile':<14}{'create/s':>12}{'update/s':>12}")
+    for profile in DATABASE_PROFILES:
+        with temporary_database(profile) as database:
+            service = PageService(database=database)
+
+            started = time.perf_counter()
+            pages = [
+                service.create_page("bench", f"Page {i}", random_text(200))
+                for i in range(count)
+            ]
+            created = count / (time.perf_counter() - started)
+
+            started = time.perf_counter()
+            for page in pages:
+                service.update_page(page.id, text=random_text(200))
+            database.write_queue.flush()
+            updated = count / (time.perf_counter() - started)
+
+        print(f"{profile:<14}{created:>12.0f}{updated:>12.0f}")
+
+
+if __name__ == "__main__":
+    for count in [int(arg) for arg in sys.argv[1:]] or [1_000]:
+        run(count)
@@ -29,6 +29,7 @@ from gi.events import GLibEventLoopPolicy
 from gi.repository import Adw, Gdk, Gio, GLib, Gtk
 from loguru import logger
 
+from norka.models import close_database
 from norka.services import WorkspaceService
 from norka.window import NorkaWindow
 
@@ -87,6 +88,11 @@ class NorkaApplication(Adw.Application):
                 "/com/tenderowl/norka/icons"
             )
 
+    def do_shutdown(self):
+        # Commits queued writes before the connection goes away
+        close_database()
+        Adw.Application.do_shutdown(self)
+
     def on_about_action(self, *args):
         """Callback for the app.about action."""
         about = Adw.AboutDialog(
@@ -108,7 +114,7 @@ class NorkaApplication(Adw.Application):
     def on_delete_workspace_action(self, action, param: GLib.Variant):
         workspace_id = param.get_string()
         logger.debug("delete workspace {}", workspace_id)
-        GLib.idle_add(self._workspace_service.delete_workspace, workspace_id)
+        self._workspace_service.delete_workspace_async(workspace_id)
 
     def create_action(self, name, callback, shortcuts=None, parameter_type=None):
         """Add an application action.
@@ -24,8 +24,17 @@
 
 from .database import DatabaseManager, close_database, get_database_manager
 from .page import Page
+from .page_breadcrumb import PageBreadcrumb
+from .page_load import PageLoadStep, plan_page_load
 from .page_node import PageNode
+from .page_search_result import PageSearchResult
+from .page_summary import PageSummary
+from .page_tree_change import PageTreeChange, PageTreeChangeKind
+from .page_tree_index import PageTreeIndex
 from .page_tree_item import PageTreeItem
+from .resource_list_model import ResourceListModel
+from .tag_range_tracker import TagRangeTracker
+from .tag_table import TagRanges, decode_tag_table, encode_tag_table
 from .workspace import Workspace
 
 __all__ = [
@@ -35,5 +44,18 @@ __all__ = [
     "get_database_manager",
     "close_database",
     "PageNode",
+    "PageLoadStep",
+    "plan_page_load",
+    "PageTreeIndex",
     "PageTreeItem",
+    "PageSearchResult",
+    "PageSummary",
+    "PageBreadcrumb",
+    "PageTreeChange",
+    "PageTreeChangeKind",
+    "ResourceListModel",
+    "TagRanges",
+    "TagRangeTracker",
+    "encode_tag_table",
+    "decode_tag_table",
 ]
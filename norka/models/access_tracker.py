@@ -0,0 +1,197 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+from gi.repository import GLib, Gom
+from loguru import logger
+
+if TYPE_CHECKING:
+    from .database import DatabaseManager
+
+# Delay between the first recorded access and the flush, in milliseconds
+ACCESS_FLUSH_INTERVAL_MS = 30_000
+# Rows per UPDATE statement, each row binds two values
+ACCESS_BATCH_ROWS = 400
+
+
+class AccessTracker:
+    """
+    Last access times kept in memory and written in batches.
+
+    Opening a page or activating a workspace only records the time here.
+    The times are written with one UPDATE per table on a long timer, and
+    whenever DatabaseManager flushes its writes, e.g. on shutdown. Until
+    then, queries listing recent rows merge in the unflushed times.
+    """
+
+    def __init__(
+        self, database: "DatabaseManager", interval: int = ACCESS_FLUSH_INTERVAL_MS
+    ):
+        """
+        Args:
+            database: Database the access times go to
+            interval: Flush delay in milliseconds
+        """
+        self._database = database
+        self._interval = interval
+        # Table name -> row id -> last access timestamp
+        self._pending: Dict[str, Dict[str, int]] = {}
+        # Times being written, still visible to readers until committed
+        self._flushing: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._timer_id = 0
+
+    def touch(self, table: str, row_id: str, timestamp: Optional[int] = None) -> int:
+        """
+        Record an access to a row.
+
+        Args:
+            table: Table name
+            row_id: Row ID
+            timestamp: Access time, now by default
+
+        Returns:
+            The recorded access time
+        """
+        if timestamp is None:
+            timestamp = int(time.time())
+        with self._lock:
+            self._pending.setdefault(table, {})[row_id] = timestamp
+            if not self._timer_id:
+                self._timer_id = GLib.timeout_add(self._interval, self._on_timeout)
+        return timestamp
+
+    def get(self, table: str, row_id: str) -> Optional[int]:
+        """Get the unflushed access time of a row, if any."""
+        with self._lock:
+            if (timestamp := self._pending.get(table, {}).get(row_id)) is None:
+                timestamp = self._flushing.get(table, {}).get(row_id)
+            return timestamp
+
+    def pending(self, table: str) -> Dict[str, int]:
+        """
+        Get the unflushed access times of a table.
+
+        Returns:
+            Row IDs mapped to their last access time
+        """
+        with self._lock:
+            return {**self._flushing.get(table, {}), **self._pending.get(table, {})}
+
+    def discard(self, table: str, row_ids: Iterable[str]):
+        """Forget the access times of rows, e.g. ones being deleted."""
+        with self._lock:
+            if rows := self._pending.get(table):
+                for row_id in row_ids:
+                    rows.pop(row_id, None)
+
+    def flush(self) -> int:
+        """
+        Write all unflushed access times.
+
+        Returns:
+            Number of rows written
+        """
+        # Waits for a transaction open on another thread to end
+        with self._database.transaction_lock, self._flush_lock:
+            with self._lock:
+                self._flushing, self._pending = self._pending, {}
+                flushing = self._flushing
+            if not flushing:
+                return 0
+
+            def commit(adapter: Gom.Adapter):
+                adapter.execute_sql("SAVEPOINT access_tracker")
+                try:
+                    for table, rows in flushing.items():
+                        self._write(adapter, table, list(rows.items()))
+                except Exception:
+                    adapter.execute_sql(
+                        "ROLLBACK TO access_tracker; RELEASE access_tracker"
+                    )
+                    raise
+                adapter.execute_sql("RELEASE access_tracker")
+
+            try:
+                self._database.run_in_adapter(commit)
+            except Exception:
+                # Keep the times for the next flush, newer ones win
+                with self._lock:
+                    for table, rows in flushing.items():
+                        pending = self._pending.setdefault(table, {})
+                        for row_id, timestamp in rows.items():
+                            pending.setdefault(row_id, timestamp)
+                raise
+            finally:
+                with self._lock:
+                    self._flushing = {}
+
+            count = sum(len(rows) for rows in flushing.values())
+            logger.debug("Flushed {} access times", count)
+            return count
+
+    @staticmethod
+    def _write(adapter: Gom.Adapter, table: str, rows: list):
+        # database imports this module
+        from .database import execute_sql
+
+        for start in range(0, len(rows), ACCESS_BATCH_ROWS):
+            batch = rows[start : start + ACCESS_BATCH_ROWS]
+            values = ", ".join("(?, ?)" for _ in batch)
+            execute_sql(
+                adapter,
+                f"""
+                WITH access (id, timestamp) AS (VALUES {values})
+                UPDATE {table} SET "last-accessed" = MAX(
+                    "last-accessed",
+                    (SELECT timestamp FROM access WHERE access.id = {table}.id)
+                )
+                WHERE id IN (SELECT id FROM access)
+                """,
+                [value for row in batch for value in row],
+            )
+
+    def close(self):
+        """Stop the timer and write what is still pending."""
+        with self._lock:
+            if self._timer_id:
+                GLib.source_remove(self._timer_id)
+                self._timer_id = 0
+        self.flush()
+
+    def _on_timeout(self) -> bool:
+        with self._lock:
+            self._timer_id = 0
+        self._database.submit(self._flush_logged)
+        return GLib.SOURCE_REMOVE
+
+    def _flush_logged(self):
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error("Failed to flush access times: {}", e)
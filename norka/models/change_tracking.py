@@ -0,0 +1,85 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+from typing import FrozenSet, Set
+
+# Guards the change sets of all objects; a flush takes the changes on the
+# adapter thread while other threads may record new ones
+_changes_lock = threading.Lock()
+
+
+class ChangeTracking:
+    """
+    Records which stored properties were given new values.
+
+    Only assignments made from Python are recorded. Gom assigns the columns
+    of loaded rows from C, which does not go through __setattr__, so
+    objects fresh from the database start without changes. Assigning the
+    value a property already holds is not a change and is skipped.
+    """
+
+    # Names of the properties whose changes are recorded
+    tracked_properties: FrozenSet[str] = frozenset()
+
+    def __setattr__(self, name: str, value):
+        if name in self.tracked_properties:
+            if getattr(self, name) == value:
+                return
+            super().__setattr__(name, value)
+            with _changes_lock:
+                self.__dict__.setdefault("_changes", set()).add(name)
+            return
+        super().__setattr__(name, value)
+
+    @property
+    def changed_properties(self) -> FrozenSet[str]:
+        """Properties changed since the last take_changes()."""
+        with _changes_lock:
+            return frozenset(self.__dict__.get("_changes", ()))
+
+    def take_changes(self) -> Set[str]:
+        """
+        Get the changed properties and start over.
+
+        Returns:
+            Names of the properties changed since the previous call
+        """
+        with _changes_lock:
+            return self.__dict__.pop("_changes", None) or set()
+
+    def mark_changed(self, *names: str):
+        """Record properties as changed, e.g. to retry a failed write."""
+        with _changes_lock:
+            self.__dict__.setdefault("_changes", set()).update(names)
+
+    def set_untracked(self, name: str, value):
+        """Assign a property without recording it, e.g. one stored some other way."""
+        super().__setattr__(name, value)
+
+    def discard_changes(self, *names: str):
+        """Forget changes that are stored some other way."""
+        with _changes_lock:
+            if changes := self.__dict__.get("_changes"):
+                changes.difference_update(names)
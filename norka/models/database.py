@@ -22,13 +22,173 @@
 #
 # SPDX-License-Identifier: MIT
 
+import asyncio
+import functools
+import threading
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
 
-from gi.repository import GLib, GObject, Gom
+from gi.repository import Gio, GLib, GObject, Gom
+from loguru import logger
 
+from .access_tracker import AccessTracker
+from .migrations import SCHEMA_VERSION, migrate
 from .page import Page
 from .workspace import Workspace
+from .write_queue import WriteQueue
+
+SETTINGS_SCHEMA_ID = "com.tenderowl.norka"
+# Name prefix of the database worker thread
+WORKER_THREAD_PREFIX = "norka-db"
+
+# SQLite PRAGMAs applied when the database is opened, by tuning profile.
+# "safe" matches the SQLite defaults the app used to run with.
+DATABASE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "safe": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+    },
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 64 * 1024 * 1024,
+        # Negative sizes are in KiB
+        "cache_size": -16 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+DEFAULT_DATABASE_PROFILE = "balanced"
+
+
+def get_database_profile() -> str:
+    """
+    Get the tuning profile selected in GSettings.
+
+    Falls back to the default profile when the schema is not installed,
+    e.g. when running from the source tree.
+
+    Returns:
+        Name of a DATABASE_PROFILES entry
+    """
+    source = Gio.SettingsSchemaSource.get_default()
+    if source is None or source.lookup(SETTINGS_SCHEMA_ID, True) is None:
+        return DEFAULT_DATABASE_PROFILE
+
+    profile = Gio.Settings(schema_id=SETTINGS_SCHEMA_ID).get_string("database-profile")
+    return profile if profile in DATABASE_PROFILES else DEFAULT_DATABASE_PROFILE
+
+
+def _get_column_bytes(cursor: Gom.Cursor, index: int) -> Optional[GLib.Bytes]:
+    value = GObject.Value(GLib.Bytes)
+    cursor.get_column(index, value)
+    return value.get_value()
+
+
+_COLUMN_GETTERS = {
+    str: Gom.Cursor.get_column_string,
+    int: Gom.Cursor.get_column_int64,
+    float: Gom.Cursor.get_column_double,
+    bool: Gom.Cursor.get_column_boolean,
+    GLib.Bytes: _get_column_bytes,
+}
+
+
+def _bind_param(command: Gom.Command, index: int, value: Any):
+    if value is None:
+        command.set_param_string(index, None)
+    elif isinstance(value, bool):
+        command.set_param_int(index, int(value))
+    elif isinstance(value, int):
+        command.set_param_int64(index, value)
+    elif isinstance(value, float):
+        command.set_param_double(index, value)
+    elif isinstance(value, (bytes, GLib.Bytes)):
+        if isinstance(value, bytes):
+            value = GLib.Bytes.new(value)
+        command.set_param(index, GObject.Value(GLib.Bytes, value))
+    else:
+        command.set_param_string(index, str(value))
+
+
+def execute_sql(
+    adapter: Gom.Adapter,
+    sql: str,
+    params: Sequence[Any] = (),
+    columns: Optional[Sequence[type]] = None,
+) -> List[tuple]:
+    """
+    Execute a single SQL statement and return its result rows.
+
+    Must be called on the adapter thread, i.e. from a migrator or a callback
+    passed to DatabaseManager.run_in_adapter().
+
+    Args:
+        adapter: Opened Gom adapter
+        sql: SQL statement with ``?`` placeholders
+        params: Values bound to the placeholders in order
+        columns: Python types of the result columns; all columns are read
+            as strings when omitted
+
+    Returns:
+        List of result rows as tuples
+    """
+    command = Gom.Command(adapter=adapter, sql=sql)
+    for index, value in enumerate(params):
+        _bind_param(command, index, value)
+
+    _, cursor = command.execute()
+    rows = []
+    if cursor is None:
+        return rows
+
+    if columns is None:
+        columns = (str,) * cursor.get_n_columns()
+    getters = [_COLUMN_GETTERS[column_type] for column_type in columns]
+    while cursor.next():
+        rows.append(tuple(getter(cursor, i) for i, getter in enumerate(getters)))
+    return rows
+
+
+def _log_failure(func: Callable, future: Future | asyncio.Future):
+    """Log the exception of a finished database call, if it raised."""
+    if future.cancelled():
+        return
+    if (error := future.exception()) is not None:
+        name = getattr(func, "__qualname__", repr(func))
+        logger.opt(exception=error).error("Database call {} failed", name)
+
+
+def update_row(adapter: Gom.Adapter, table: str, row_id: str, values: Dict[str, Any]):
+    """
+    Update some columns of a single row.
+
+    Must be called on the adapter thread, like execute_sql().
+
+    Args:
+        adapter: Opened Gom adapter
+        table: Table name
+        row_id: Value of the id column of the row
+        values: Column names mapped to their new values
+    """
+    assignments = ", ".join(f'"{column}" = ?' for column in values)
+    execute_sql(
+        adapter,
+        f"UPDATE {table} SET {assignments} WHERE id = ?",
+        (*values.values(), row_id),
+    )
 
 
 class DatabaseManager:
@@ -41,15 +201,21 @@ class DatabaseManager:
 
     _repository: Gom.Repository | None = None
     _adapter: Gom.Adapter | None = None
+    _executor: ThreadPoolExecutor | None = None
+    _write_queue: WriteQueue | None = None
+    _access_tracker: AccessTracker | None = None
 
     _database_path: str
 
-    def __init__(self, database_path: Optional[str] = None):
+    def __init__(
+        self, database_path: Optional[str] = None, profile: Optional[str] = None
+    ):
         """
         Initialize the database manager.
 
         Args:
             database_path: Optional custom database path
+            profile: Optional tuning profile, read from GSettings by default
         """
 
         if database_path is None:
@@ -59,6 +225,7 @@ class DatabaseManager:
             database_path = str(data_dir / "norka.db")
 
         self._database_path = database_path
+        self._profile = profile or get_database_profile()
         self._setup_database()
 
     def _setup_database(self):
@@ -66,17 +233,225 @@ class DatabaseManager:
         # Connect to the database
         self._adapter = Gom.Adapter()
         self._adapter.open_sync(self._database_path)
+        self._apply_profile()
 
         # Create the table
         self._repository = Gom.Repository(adapter=self._adapter)
         self._repository.automatic_migrate_sync(2, [Workspace, Page])
+        # Hand-written migrations on top of the automatic Gom schema
+        self._repository.migrate_sync(SCHEMA_VERSION, migrate, None)
+
+        # Dedicated worker thread for blocking database calls. A single worker
+        # keeps operations ordered the same way they were submitted.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=WORKER_THREAD_PREFIX
+        )
+        # Held by transaction() for its whole block and by every flush, so
+        # writes of other threads never join an open transaction
+        self._transaction_lock = threading.RLock()
+        self._write_queue = WriteQueue(self)
+        self._access_tracker = AccessTracker(self)
+
+    def _apply_profile(self):
+        """Apply the PRAGMAs of the tuning profile to the open connection."""
+        pragmas = DATABASE_PROFILES[self._profile]
+
+        def apply(adapter):
+            for name, value in pragmas.items():
+                execute_sql(adapter, f"PRAGMA {name} = {value}")
+
+        self.run_in_adapter(apply)
+        logger.debug("Database opened with the {} profile", self._profile)
 
     @property
     def database_path(self):
         return self._database_path
 
+    @property
+    def profile(self) -> str:
+        return self._profile
+
+    def run_async(self, func: Callable[..., Any], *args, **kwargs) -> asyncio.Future:
+        """
+        Run a blocking database call on the database worker thread.
+
+        Args:
+            func: Callable performing synchronous database I/O
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Future resolved on the event loop with the result of func
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+        # Many callers fire and forget, their errors would go unnoticed
+        future.add_done_callback(functools.partial(_log_failure, func))
+        return future
+
+    def submit(self, func: Callable[..., Any], *args) -> Future:
+        """
+        Run a blocking database call on the database worker thread.
+
+        Unlike run_async(), this does not need an event loop.
+
+        Returns:
+            concurrent.futures.Future with the result of func
+        """
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(functools.partial(_log_failure, func))
+        return future
+
+    @property
+    def write_queue(self) -> WriteQueue:
+        return self._write_queue
+
+    @property
+    def access_tracker(self) -> AccessTracker:
+        return self._access_tracker
+
+    @property
+    def transaction_lock(self) -> threading.RLock:
+        """Lock held by transaction() and by the write queue and tracker flushes."""
+        return self._transaction_lock
+
+    def flush_writes(self):
+        """
+        Commit queued writes and access times, including those of calls
+        already submitted to the worker thread, and wait until they are on
+        disk.
+        """
+        if self._executor:
+            self._executor.submit(self._flush_all).result()
+        elif self._write_queue:
+            self._flush_all()
+
+    def _flush_all(self):
+        self._write_queue.flush()
+        self._access_tracker.flush()
+
+    def run_in_adapter(self, func: Callable[[Gom.Adapter], Any], write: bool = True):
+        """
+        Run a callable on the Gom adapter thread and wait for its result.
+
+        Gom serializes all access to the SQLite connection through its own
+        thread, so raw statements have to be queued there as well.
+
+        Args:
+            func: Callable receiving the Gom adapter
+            write: Queue as a write operation, otherwise as a read
+
+        Returns:
+            Result of func
+        """
+        done = threading.Event()
+        outcome = {}
+
+        def callback(adapter, *_args):
+            try:
+                outcome["result"] = func(adapter)
+            except Exception as e:
+                outcome["error"] = e
+            finally:
+                done.set()
+
+        if write:
+            self._adapter.queue_write(callback, None)
+        else:
+            self._adapter.queue_read(callback, None)
+        done.wait()
+
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome.get("result")
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Run the enclosed database calls in a single transaction.
+
+        Writes queued inside the block are committed with it. When the block
+        raises, everything since its start is rolled back, including the
+        writes it queued, and the exception propagates. Transactions nest.
+
+        Transactions run on the database worker thread. Flushes from other
+        threads wait until the block ends instead of joining it.
+
+        Gom's save_sync() and delete_sync() open transactions of their own,
+        so use raw statements inside the block.
+        """
+        if not threading.current_thread().name.startswith(WORKER_THREAD_PREFIX):
+            raise RuntimeError("Transactions run on the database worker thread")
+
+        with self._transaction_lock:
+            self._write_queue.flush_logged()
+            self._execute_script("SAVEPOINT norka_transaction")
+            with self._write_queue.recording() as queued:
+                try:
+                    yield
+                    self._write_queue.flush()
+                except BaseException:
+                    self._write_queue.discard(queued)
+                    self._execute_script(
+                        "ROLLBACK TO norka_transaction; RELEASE norka_transaction"
+                    )
+                    raise
+            self._execute_script("RELEASE norka_transaction")
+
+    def _execute_script(self, sql: str):
+        self.run_in_adapter(lambda adapter: adapter.execute_sql(sql))
+
+    def execute(
+        self,
+        sql: str,
+        params: Sequence[Any] = (),
+        columns: Optional[Sequence[type]] = None,
+    ) -> List[tuple]:
+        """Execute a modifying SQL statement. See execute_sql()."""
+        self._write_queue.flush_logged()
+        return self.run_in_adapter(
+            lambda adapter: execute_sql(adapter, sql, params, columns), write=True
+        )
+
+    def query(
+        self,
+        sql: str,
+        params: Sequence[Any] = (),
+        columns: Optional[Sequence[type]] = None,
+    ) -> List[tuple]:
+        """Execute a read-only SQL query. See execute_sql()."""
+        self._write_queue.flush_logged()
+        return self.run_in_adapter(
+            lambda adapter: execute_sql(adapter, sql, params, columns), write=False
+        )
+
+    def explain_query_plan(self, sql: str, params: Sequence[Any] = ()) -> List[str]:
+        """
+        Get the SQLite query plan for a statement.
+
+        Args:
+            sql: Statement to explain
+            params: Values for its placeholders
+
+        Returns:
+            The detail column of every plan step
+        """
+        rows = self.query(
+            f"EXPLAIN QUERY PLAN {sql}", params, columns=(int, int, int, str)
+        )
+        return [row[3] for row in rows]
+
     def close(self):
         """Close the database connection."""
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._write_queue:
+            self._write_queue.close()
+        if self._access_tracker:
+            self._access_tracker.close()
         self._adapter.close_sync()
 
     def __enter__(self):
@@ -98,6 +473,9 @@ class DatabaseManager:
 
     @GObject.Property()
     def repository(self):
+        # Gom reads and saves must see the queued writes
+        if self._write_queue:
+            self._write_queue.flush_logged()
         return self._repository
 
 
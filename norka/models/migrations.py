@@ -0,0 +1,448 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Versioned schema migrations.
+
+Versions 1 and 2 are created by Gom's automatic migrator from the resource
+classes. Everything above that is applied here, one function per version,
+inside the transaction opened by Gom.Repository.migrate_sync().
+
+Gom names columns after the canonical GObject property names, so columns
+such as ``workspace-id`` have to be quoted in raw SQL.
+
+Gom tables have text primary keys, so their rowids are implicit and may be
+renumbered by VACUUM. Anything keyed by rowid, like the full-text index,
+has to use a table declaring an ``INTEGER PRIMARY KEY`` instead.
+"""
+
+from typing import Callable, Dict
+
+from gi.repository import Gom
+from loguru import logger
+
+SCHEMA_VERSION = 9
+
+# Body columns of pages, kept for upgrades from schema versions before 6
+_PAGE_BODY_COLUMNS = (("text", "TEXT"), ("content", "BLOB"), ('"tag-table"', "TEXT"))
+
+
+def _has_column(adapter: Gom.Adapter, table: str, column: str) -> bool:
+    command = Gom.Command(
+        adapter=adapter,
+        sql=f"SELECT 1 FROM pragma_table_info('{table}') WHERE name = ?",
+    )
+    command.set_param_string(0, column)
+    _, cursor = command.execute()
+    return cursor is not None and cursor.next()
+
+
+def _add_page_body_columns(adapter: Gom.Adapter):
+    """
+    Body columns of pages for versions 3 to 5.
+
+    Page no longer maps them, so fresh databases lack the columns the
+    original full-text index reads. Applied right before version 3.
+    """
+    for column, column_type in _PAGE_BODY_COLUMNS:
+        if not _has_column(adapter, "pages", column.strip('"')):
+            adapter.execute_sql(f"ALTER TABLE pages ADD COLUMN {column} {column_type}")
+
+
+def _migrate_v3(adapter: Gom.Adapter):
+    """Full-text index over page titles and text."""
+    adapter.execute_sql(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(
+            title,
+            text,
+            content='pages',
+            content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS pages_fts_insert AFTER INSERT ON pages BEGIN
+            INSERT INTO pages_fts(rowid, title, text)
+            VALUES (new.rowid, new.title, new.text);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS pages_fts_delete AFTER DELETE ON pages BEGIN
+            INSERT INTO pages_fts(pages_fts, rowid, title, text)
+            VALUES ('delete', old.rowid, old.title, old.text);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS pages_fts_update
+        AFTER UPDATE OF title, text ON pages BEGIN
+            INSERT INTO pages_fts(pages_fts, rowid, title, text)
+            VALUES ('delete', old.rowid, old.title, old.text);
+            INSERT INTO pages_fts(rowid, title, text)
+            VALUES (new.rowid, new.title, new.text);
+        END;
+
+        INSERT INTO pages_fts(pages_fts) VALUES ('rebuild');
+        """
+    )
+
+
+def _migrate_v4(adapter: Gom.Adapter):
+    """Secondary indexes for the filters and orderings used by the services."""
+    adapter.execute_sql(
+        """
+        CREATE INDEX IF NOT EXISTS pages_workspace_sort
+            ON pages ("workspace-id", "sort-order");
+        CREATE INDEX IF NOT EXISTS pages_workspace_parent_sort
+            ON pages ("workspace-id", "parent-page-id", "sort-order");
+        CREATE INDEX IF NOT EXISTS pages_parent_sort
+            ON pages ("parent-page-id", "sort-order");
+        CREATE INDEX IF NOT EXISTS pages_workspace_favorite_updated
+            ON pages ("workspace-id", "is-favorite", "updated-at");
+        CREATE INDEX IF NOT EXISTS pages_workspace_archived_accessed
+            ON pages ("workspace-id", "is-archived", "last-accessed");
+        CREATE INDEX IF NOT EXISTS pages_workspace_title
+            ON pages ("workspace-id", title);
+
+        CREATE INDEX IF NOT EXISTS workspaces_name ON workspaces (name);
+        CREATE INDEX IF NOT EXISTS workspaces_last_accessed
+            ON workspaces ("last-accessed");
+        CREATE INDEX IF NOT EXISTS workspaces_favorite_name
+            ON workspaces ("is-favorite", name);
+        """
+    )
+
+
+def _migrate_v5(adapter: Gom.Adapter):
+    """
+    Closure table for the page hierarchy.
+
+    page_closure holds one row for every (ancestor, descendant) pair,
+    including each page paired with itself at depth 0. Triggers keep it in
+    sync when pages are inserted, re-parented or deleted, so subtree and
+    ancestor lookups are a single indexed query.
+    """
+    adapter.execute_sql(
+        """
+        CREATE TABLE IF NOT EXISTS page_closure (
+            ancestor_id TEXT NOT NULL,
+            descendant_id TEXT NOT NULL,
+            depth INTEGER NOT NULL,
+            PRIMARY KEY (ancestor_id, descendant_id)
+        ) WITHOUT ROWID;
+
+        CREATE INDEX IF NOT EXISTS page_closure_descendant
+            ON page_closure (descendant_id, depth);
+
+        CREATE TRIGGER IF NOT EXISTS page_closure_insert AFTER INSERT ON pages BEGIN
+            INSERT INTO page_closure (ancestor_id, descendant_id, depth)
+            VALUES (new.id, new.id, 0);
+            INSERT INTO page_closure (ancestor_id, descendant_id, depth)
+            SELECT ancestor_id, new.id, depth + 1
+            FROM page_closure
+            WHERE descendant_id = new."parent-page-id";
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS page_closure_move
+        AFTER UPDATE OF "parent-page-id" ON pages
+        WHEN old."parent-page-id" IS NOT new."parent-page-id" BEGIN
+            DELETE FROM page_closure
+            WHERE descendant_id IN (
+                SELECT descendant_id FROM page_closure WHERE ancestor_id = new.id
+            )
+            AND ancestor_id IN (
+                SELECT ancestor_id FROM page_closure
+                WHERE descendant_id = new.id AND depth > 0
+            );
+            INSERT INTO page_closure (ancestor_id, descendant_id, depth)
+            SELECT above.ancestor_id, below.descendant_id, above.depth + below.depth + 1
+            FROM page_closure AS above, page_closure AS below
+            WHERE above.descendant_id = new."parent-page-id"
+            AND below.ancestor_id = new.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS page_closure_delete AFTER DELETE ON pages BEGIN
+            DELETE FROM page_closure
+            WHERE descendant_id = old.id OR ancestor_id = old.id;
+        END;
+
+        WITH RECURSIVE tree (ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM pages
+            UNION ALL
+            SELECT parent.id, tree.descendant_id, tree.depth + 1
+            FROM tree
+            JOIN pages AS child ON child.id = tree.ancestor_id
+            JOIN pages AS parent ON parent.id = child."parent-page-id"
+            WHERE tree.depth < 1000
+        )
+        INSERT OR IGNORE INTO page_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, depth FROM tree;
+        """
+    )
+
+
+def _migrate_v6(adapter: Gom.Adapter):
+    """
+    Page bodies in a separate table.
+
+    Text, content and tag table move from pages to page_contents, so scans
+    over page metadata no longer pull large overflow pages through the
+    page cache. The body columns of pages are cleared but not dropped.
+
+    The full-text index is rebuilt over the pages_fts_source view, which
+    joins the title from pages with the text from page_contents. Its rowids
+    are page_contents rowids.
+    """
+    adapter.execute_sql(
+        """
+        CREATE TABLE IF NOT EXISTS page_contents (
+            page_id TEXT PRIMARY KEY NOT NULL,
+            text TEXT,
+            content BLOB,
+            tag_table TEXT
+        );
+
+        INSERT OR IGNORE INTO page_contents (page_id, text, content, tag_table)
+        SELECT id, text, content, "tag-table" FROM pages;
+
+        DROP TRIGGER IF EXISTS pages_fts_insert;
+        DROP TRIGGER IF EXISTS pages_fts_delete;
+        DROP TRIGGER IF EXISTS pages_fts_update;
+        DROP TABLE IF EXISTS pages_fts;
+
+        UPDATE pages SET text = NULL, content = NULL, "tag-table" = NULL;
+
+        CREATE VIEW IF NOT EXISTS pages_fts_source AS
+        SELECT c.rowid AS doc_id, p.title AS title, c.text AS text
+        FROM page_contents AS c
+        JOIN pages AS p ON p.id = c.page_id;
+
+        CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(
+            title,
+            text,
+            content='pages_fts_source',
+            content_rowid='doc_id',
+            tokenize='unicode61 remove_diacritics 2'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS page_contents_fts_insert
+        AFTER INSERT ON page_contents BEGIN
+            INSERT INTO pages_fts(rowid, title, text)
+            SELECT new.rowid, title, new.text FROM pages WHERE id = new.page_id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS page_contents_fts_update
+        AFTER UPDATE OF text ON page_contents BEGIN
+            INSERT INTO pages_fts(pages_fts, rowid, title, text)
+            SELECT 'delete', old.rowid, title, old.text
+            FROM pages WHERE id = old.page_id;
+            INSERT INTO pages_fts(rowid, title, text)
+            SELECT new.rowid, title, new.text FROM pages WHERE id = new.page_id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS pages_fts_title
+        AFTER UPDATE OF title ON pages
+        WHEN old.title IS NOT new.title BEGIN
+            INSERT INTO pages_fts(pages_fts, rowid, title, text)
+            SELECT 'delete', rowid, old.title, text
+            FROM page_contents WHERE page_id = new.id;
+            INSERT INTO pages_fts(rowid, title, text)
+            SELECT rowid, new.title, text FROM page_contents WHERE page_id = new.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS page_contents_delete AFTER DELETE ON pages BEGIN
+            INSERT INTO pages_fts(pages_fts, rowid, title, text)
+            SELECT 'delete', rowid, old.title, text
+            FROM page_contents WHERE page_id = old.id;
+            DELETE FROM page_contents WHERE page_id = old.id;
+        END;
+
+        INSERT INTO pages_fts(pages_fts) VALUES ('rebuild');
+        """
+    )
+
+
+def _migrate_v7(adapter: Gom.Adapter):
+    """
+    Drop orphaned pages.
+
+    Deleting a workspace used to leave its pages behind. Workspaces now
+    take their pages with them, so the leftovers are removed once here.
+    The delete triggers clean up page_closure, page_contents and the
+    full-text index.
+    """
+    adapter.execute_sql(
+        """
+        DELETE FROM pages
+        WHERE NOT EXISTS (
+            SELECT 1 FROM workspaces WHERE workspaces.id = pages."workspace-id"
+        );
+        """
+    )
+
+
+def _migrate_v8(adapter: Gom.Adapter):
+    """
+    Full-text index keyed by a declared rowid alias.
+
+    page_contents gets an explicit ``doc_id INTEGER PRIMARY KEY``. VACUUM
+    may renumber implicit rowids, which would point search hits at the
+    wrong page, while an INTEGER PRIMARY KEY never changes. The table is
+    rebuilt with its rows keeping their current rowids, and the index is
+    rebuilt over the new key.
+
+    The version 3 triggers keyed by the implicit rowid of pages are dropped
+    as well, in case a database still has them, so no index entry outlives
+    this version with an unstable key.
+    """
+    adapter.execute_sql(
+        """
+        DROP TRIGGER IF EXISTS pages_fts_insert;
+        DROP TRIGGER IF EXISTS pages_fts_delete;
+        DROP TRIGGER IF EXISTS pages_fts_update;
+        DROP TRIGGER IF EXISTS pages_fts_title;
+        DROP TRIGGER IF EXISTS page_contents_delete;
+        DROP TABLE IF EXISTS pages_fts;
+        DROP VIEW IF EXISTS pages_fts_source;
+
+        CREATE TABLE page_contents_v8 (
+            doc_id INTEGER PRIMARY KEY,
+            page_id TEXT NOT NULL UNIQUE,
+            text TEXT,
+            content BLOB,
+            tag_table TEXT
+        );
+
+        INSERT INTO page_contents_v8 (doc_id, page_id, text, content, tag_table)
+        SELECT rowid, page_id, text, content, tag_table FROM page_contents;
+
+        DROP TABLE page_contents;
+        ALTER TABLE page_contents_v8 RENAME TO page_contents;
+
+        CREATE VIEW pages_fts_source AS
+        SELECT c.doc_id AS doc_id, p.title AS title, c.text AS text
+        FROM page_contents AS c
+        JOIN pages AS p ON p.id = c.page_id;
+
+        CREATE VIRTUAL TABLE pages_fts USING fts5(
+            title,
+            text,
+            content='pages_fts_source',
+            content_rowid='doc_id',
+            tokenize='unicode61 remove_diacritics 2'
+        );
+
+        CREATE TRIGGER page_contents_fts_insert
+        AFTER INSERT ON page_contents BEGIN
+            INSERT INTO pages_fts(rowid, title, text)
+            SELECT new.doc_id, title, new.text FROM pages WHERE id = new.page_id;
+        END;
+
+        CREATE TRIGGER page_contents_fts_update
+        AFTER UPDATE OF text ON page_contents BEGIN
+            INSERT INTO pages_fts(pages_fts, rowid, title, text)
+            SELECT 'delete', old.doc_id, title, old.text
+            FROM pages WHERE id = old.page_id;
+            INSERT INTO pages_fts(rowid, title, text)
+            SELECT new.doc_id, title, new.text FROM pages WHERE id = new.page_id;
+        END;
+
+        CREATE TRIGGER pages_fts_title
+        AFTER UPDATE OF title ON pages
+        WHEN old.title IS NOT new.title BEGIN
+            INSERT INTO pages_fts(pages_fts, rowid, title, text)
+            SELECT 'delete', doc_id, old.title, text
+            FROM page_contents WHERE page_id = new.id;
+            INSERT INTO pages_fts(rowid, title, text)
+            SELECT doc_id, new.title, text FROM page_contents WHERE page_id = new.id;
+        END;
+
+        CREATE TRIGGER page_contents_delete AFTER DELETE ON pages BEGIN
+            INSERT INTO pages_fts(pages_fts, rowid, title, text)
+            SELECT 'delete', doc_id, old.title, text
+            FROM page_contents WHERE page_id = old.id;
+            DELETE FROM page_contents WHERE page_id = old.id;
+        END;
+
+        INSERT INTO pages_fts(pages_fts) VALUES ('rebuild');
+        """
+    )
+
+
+def _migrate_v9(adapter: Gom.Adapter):
+    """
+    Sibling index ending in the tree order.
+
+    Counting the siblings sorted before a page compares ("sort-order",
+    title) as a row value, which only stays within the siblings when the
+    title is part of the index. The new index replaces the one without it.
+    """
+    adapter.execute_sql(
+        """
+        CREATE INDEX IF NOT EXISTS pages_workspace_parent_sort_title
+            ON pages ("workspace-id", "parent-page-id", "sort-order", title);
+        DROP INDEX IF EXISTS pages_workspace_parent_sort;
+        """
+    )
+
+
+MIGRATIONS: Dict[int, Callable[[Gom.Adapter], None]] = {
+    3: _migrate_v3,
+    4: _migrate_v4,
+    5: _migrate_v5,
+    6: _migrate_v6,
+    7: _migrate_v7,
+    8: _migrate_v8,
+    9: _migrate_v9,
+}
+
+# Steps applied before the migration of a version
+PREPARATIONS: Dict[int, Callable[[Gom.Adapter], None]] = {
+    3: _add_page_body_columns,
+}
+
+
+def migrate(repository: Gom.Repository, adapter: Gom.Adapter, version: int, *_args):
+    """
+    Gom.RepositoryMigrator applying a single schema version.
+
+    Args:
+        repository: Repository being migrated
+        adapter: Adapter to run the statements on
+        version: Schema version to migrate to
+
+    Returns:
+        True if the migration succeeded
+    """
+    migration = MIGRATIONS.get(version)
+    if migration is None:
+        return True
+
+    logger.info("Migrating database schema to version {}", version)
+    try:
+        if preparation := PREPARATIONS.get(version):
+            preparation(adapter)
+        migration(adapter)
+    except Exception as e:
+        logger.error("Migration to version {} failed: {}", version, e)
+        return False
+
+    return True
@@ -22,6 +22,7 @@
 #
 # SPDX-License-Identifier: MIT
 
+import json
 from datetime import datetime
 from typing import List, Optional
 
@@ -29,6 +30,15 @@ import nanoid
 from gi.repository import GLib, GObject, Gom
 from gi.types import GObjectMeta
 
+from norka.models.change_tracking import ChangeTracking
+from norka.models.tag_table import TagRanges, decode_tag_table, encode_tag_table
+
+
+# Signals that need the property change handlers of a page
+PAGE_CHANGE_SIGNALS = ("page-changed", "page-favorite-changed", "page-accessed")
+# Properties stored in the page_contents table instead of pages
+PAGE_BODY_PROPERTIES = ("text", "content", "tag_table")
+
 
 class PageResourceMeta(GObjectMeta):
     def __init__(self, name, bases, dct):
@@ -37,9 +47,12 @@ class PageResourceMeta(GObjectMeta):
         self.set_primary_key("id")
         self.set_notnull("workspace_id")
         self.set_notnull("title")
+        # Bodies live in the page_contents table and are read by PageService
+        for name in PAGE_BODY_PROPERTIES:
+            self.set_property_set_mapped(name, False)
 
 
-class Page(Gom.Resource, metaclass=PageResourceMeta):
+class Page(ChangeTracking, Gom.Resource, metaclass=PageResourceMeta):
     """
     Page model representing a document within a workspace.
 
@@ -80,8 +93,41 @@ class Page(Gom.Resource, metaclass=PageResourceMeta):
     # Display order for sorting within parent
     sort_order: int = GObject.Property(type=int, default=0)
 
+    # Whether the property change handlers are connected
+    _tracking: bool = False
+
+    tracked_properties = frozenset(
+        {
+            "workspace_id",
+            "title",
+            "text",
+            "content",
+            "tag_table",
+            "icon",
+            "cover",
+            "parent_page_id",
+            "created_at",
+            "updated_at",
+            "last_accessed",
+            "is_favorite",
+            "is_archived",
+            "is_published",
+            "sort_order",
+        }
+    )
+
     def __init__(self, **kwargs):
-        """Initialize a new page."""
+        """
+        Initialize a page.
+
+        Gom creates pages without arguments when it loads rows and assigns
+        the columns right after. Those pages skip the defaults and the
+        change handlers, see track_changes().
+        """
+        if not kwargs:
+            super().__init__()
+            return
+
         super().__init__(repository=kwargs.get("repository", None))
 
         self.id = kwargs.get("id", nanoid.generate())
@@ -115,16 +161,32 @@ class Page(Gom.Resource, metaclass=PageResourceMeta):
         self.sort_order = kwargs.get("sort_order", 0)
 
         self._signal_handlers = {}
-        self._setup_signals()
+        self.track_changes()
 
-    def _setup_signals(self):
-        """Setup GObject signals for the page."""
-        # Connect to property change signals
+    def track_changes(self):
+        """
+        Start reacting to property changes.
+
+        Connects the handlers that stamp updated_at and emit the page
+        signals. Pages loaded from the database start without them, so
+        loading a workspace does not connect handlers to every page and
+        Gom assigning the columns does not count as an edit. Tracking
+        starts with the first edit through the page methods, or when
+        anything connects to the page signals.
+        """
+        if self._tracking:
+            return
+        self._tracking = True
         self.connect("notify::title", self._on_property_changed)
         self.connect("notify::text", self._on_property_changed)
         self.connect("notify::is-favorite", self._on_favorite_changed)
         self.connect("notify::last-accessed", self._on_accessed)
 
+    def connect(self, detailed_signal: str, *args, **kwargs) -> int:
+        if detailed_signal.split("::")[0] in PAGE_CHANGE_SIGNALS:
+            self.track_changes()
+        return super().connect(detailed_signal, *args, **kwargs)
+
     def _on_property_changed(self, obj, pspec):
         """Handle property changes."""
         self.updated_at = int(datetime.now().timestamp())
@@ -138,6 +200,80 @@ class Page(Gom.Resource, metaclass=PageResourceMeta):
         """Handle page access updates."""
         self.emit("page-accessed")
 
+    def load_body(
+        self,
+        text: Optional[str],
+        content: Optional[GLib.Bytes],
+        tag_table: Optional[str],
+    ):
+        """
+        Set the page body as read from storage.
+
+        Unlike assigning the properties, this does not mark the page as
+        changed.
+
+        Args:
+            text: Page text
+            content: Serialized page content
+            tag_table: Serialized tag table
+        """
+        # Handlers are only connected once the page tracks changes
+        tracking = self._tracking
+        if tracking:
+            self.handler_block_by_func(self._on_property_changed)
+        try:
+            self.text = text
+            self.content = content
+            self.tag_table = tag_table
+            self.discard_changes("text", "content", "tag_table")
+        finally:
+            if tracking:
+                self.handler_unblock_by_func(self._on_property_changed)
+
+    def get_tag_ranges(self) -> TagRanges:
+        """
+        Get the tags applied to the page text.
+
+        The binary table in content is preferred, pages saved before it
+        existed fall back to the JSON tag_table. The decoded table is kept
+        until the stored one changes, callers must not modify it.
+
+        Returns:
+            Tag names mapped to lists of (start, end) offsets
+        """
+        if self.content is not None and self.content.get_size():
+            source = self.content.get_data()
+        else:
+            source = self.tag_table or None
+
+        decoded = getattr(self, "_decoded_tags", None)
+        if decoded is not None and decoded[0] == source:
+            return decoded[1]
+
+        if isinstance(source, bytes):
+            tag_ranges = decode_tag_table(source)
+        elif source:
+            tag_ranges = {
+                name: [tuple(tag_range) for tag_range in ranges]
+                for name, ranges in json.loads(source).items()
+            }
+        else:
+            tag_ranges = {}
+        self._decoded_tags = (source, tag_ranges)
+        return tag_ranges
+
+    def set_tag_ranges(self, tag_ranges: TagRanges):
+        """
+        Store the tags applied to the page text in the binary format.
+
+        Replaces the legacy JSON tag_table.
+
+        Args:
+            tag_ranges: Tag names mapped to lists of (start, end) offsets
+        """
+        self.content = GLib.Bytes.new(encode_tag_table(tag_ranges))
+        self.tag_table = None
+
     @property
     def last_accessed_dt(self) -> datetime:
         return datetime.fromtimestamp(self.last_accessed)
@@ -319,25 +455,6 @@ class Page(Gom.Resource, metaclass=PageResourceMeta):
             return session.query(Page).filter(Page.id == self.parent_page_id).first()
         return None
 
-    def get_ancestors(self, session) -> List["Page"]:
-        """
-        Get all ancestor pages (breadcrumb path).
-
-        Args:
-            session: Database session
-
-        Returns:
-            List of ancestor pages from root to immediate parent
-        """
-        ancestors = []
-        current_page = self.get_parent(session)
-
-        while current_page:
-            ancestors.insert(0, current_page)  # Insert at beginning for correct order
-            current_page = current_page.get_parent(session)
-
-        return ancestors
-
     def move_to_parent(self, session, new_parent_id: Optional[str]):
         """
         Move this page to a new parent.
@@ -352,21 +469,25 @@ class Page(Gom.Resource, metaclass=PageResourceMeta):
 
     def archive(self):
         """Archive this page."""
+        self.track_changes()
         self.is_archived = True
         self.updated_at = int(datetime.now().timestamp())
 
     def unarchive(self):
         """Unarchive this page."""
+        self.track_changes()
         self.is_archived = False
         self.updated_at = int(datetime.now().timestamp())
 
     def toggle_favorite(self):
         """Toggle the favorite status of this page."""
+        self.track_changes()
         self.is_favorite = not self.is_favorite
         self.updated_at = int(datetime.now().timestamp())
 
     def update_access_time(self):
         """Update the last accessed time."""
+        self.track_changes()
         self.last_accessed = int(datetime.now().timestamp())
 
     def update_content(
@@ -379,13 +500,16 @@ class Page(Gom.Resource, metaclass=PageResourceMeta):
             title: New title (optional)
             text: New text content (optional)
         """
+        self.track_changes()
         if title is not None:
             self.title = title
         if text is not None:
             self.text = text
         if tag_table is not None:
             self.tag_table = tag_table
-        self.updated_at = int(datetime.now().timestamp())
+        # Saving an unchanged page is not an update
+        if self.changed_properties - {"updated_at", "last_accessed"}:
+            self.updated_at = int(datetime.now().timestamp())
 
     def to_dict(self) -> dict:
         """
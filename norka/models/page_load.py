@@ -0,0 +1,91 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Order of the steps that load a page into a text buffer.
+
+A large page is loaded over several main loop iterations, so the text is
+inserted chunk by chunk and the tags follow as their text arrives.
+"""
+
+from bisect import bisect_left
+from operator import itemgetter
+from typing import Iterable, Iterator, NamedTuple, Sequence, Tuple, TypeVar
+
+# Characters of page text inserted per page load step
+LOAD_CHUNK_CHARS = 8192
+# Tag ranges applied per page load step
+LOAD_TAG_BATCH = 64
+
+T = TypeVar("T")
+
+
+class PageLoadStep(NamedTuple):
+    """One step of a page load, either a chunk of text or a batch of tags."""
+
+    # Text to append at the end of the buffer
+    text: str = ""
+    # (start, end, tag) ranges to apply
+    ranges: Sequence[Tuple[int, int, T]] = ()
+
+
+def plan_page_load(
+    text: str,
+    ranges: Iterable[Tuple[int, int, T]],
+    chunk_chars: int = LOAD_CHUNK_CHARS,
+    tag_batch: int = LOAD_TAG_BATCH,
+) -> Iterator[PageLoadStep]:
+    """
+    Split loading a page into text chunks and batches of tag ranges.
+
+    A range is applied once the text past its end is loaded, otherwise
+    text appended right after it would take the tag as well. Ranges are
+    applied in order of their end, and all of them once the text is done.
+
+    Args:
+        text: Page text
+        ranges: (start, end, tag) ranges to apply to the text
+        chunk_chars: Characters of text per step
+        tag_batch: Tag ranges per step
+
+    Yields:
+        Steps to run in order
+    """
+    ranges = sorted(ranges, key=itemgetter(1))
+
+    applied = 0
+    loaded = 0
+    while loaded < len(text):
+        chunk = text[loaded : loaded + chunk_chars]
+        loaded += len(chunk)
+        yield PageLoadStep(text=chunk)
+
+        if loaded < len(text):
+            ready = bisect_left(ranges, loaded, key=itemgetter(1))
+        else:
+            ready = len(ranges)
+        while applied < ready:
+            batch = ranges[applied : min(applied + tag_batch, ready)]
+            applied += len(batch)
+            yield PageLoadStep(ranges=batch)
@@ -1,6 +1,8 @@
-from typing import List, Optional
+from bisect import insort
+from typing import Dict, Iterable, List, Optional, Union
 
 from norka.models import Page
+from norka.models.page_summary import PageSummary
 
 # MIT License
 #
@@ -27,6 +29,10 @@ from norka.models import Page
 # SPDX-License-Identifier: MIT
 
 
+def _sort_key(node: "PageNode"):
+    return node.page.sort_order, node.page.title
+
+
 class PageNode:
     """
     Represents a page node in a tree structure.
@@ -35,30 +41,83 @@ class PageNode:
     structure of pages within a workspace.
     """
 
-    def __init__(self, page: Page):
+    __slots__ = ("page", "children", "_parent", "_depth")
+
+    def __init__(self, page: Union[Page, PageSummary]):
         self.page = page
         self.children: List[PageNode] = []
-        self.parent: Optional[PageNode] = None
+        self._parent: Optional[PageNode] = None
+        self._depth: Optional[int] = 0
+
+    @classmethod
+    def build_tree(
+        cls, pages: Iterable[Union[Page, PageSummary]]
+    ) -> List["PageNode"]:
+        """
+        Build page trees from a flat list of pages.
+
+        Each group of siblings is sorted once after all nodes are linked,
+        so building is O(n log n) regardless of the tree shape.
+
+        Args:
+            pages: Pages of a workspace in any order
+
+        Returns:
+            List of root nodes with children populated
+        """
+        node_map: Dict[str, PageNode] = {page.id: cls(page) for page in pages}
+
+        root_nodes = []
+        for node in node_map.values():
+            parent_node = node_map.get(node.page.parent_page_id)
+            if parent_node is not None:
+                node._parent = parent_node
+                node._depth = None
+                parent_node.children.append(node)
+            else:
+                # Pages without a parent, or with a parent outside the list
+                root_nodes.append(node)
+
+        for node in node_map.values():
+            if len(node.children) > 1:
+                node.children.sort(key=_sort_key)
+        root_nodes.sort(key=_sort_key)
+
+        return root_nodes
+
+    @property
+    def parent(self) -> Optional["PageNode"]:
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: Optional["PageNode"]):
+        self._parent = parent
+        self._invalidate_depth()
+
+    def _invalidate_depth(self):
+        self._depth = None
+        for child in self.children:
+            if child._depth is not None:
+                child._invalidate_depth()
 
     def add_child(self, child_node: "PageNode"):
-        """Add a child node to this page node."""
+        """Add a child node to this page node, keeping children sorted."""
         child_node.parent = self
-        self.children.append(child_node)
         # Sort children by sort_order and then by title
-        self.children.sort(key=lambda x: (x.page.sort_order, x.page.title))
+        insort(self.children, child_node, key=_sort_key)
 
     def get_depth(self) -> int:
         """Get the depth of this node in the tree (root = 0)."""
-        depth = 0
-        current = self.parent
-        while current:
-            depth += 1
-            current = current.parent
-        return depth
+        if self._depth is None:
+            self._depth = 0 if self._parent is None else self._parent.get_depth() + 1
+        return self._depth
 
     def to_dict(self, include_children: bool = True) -> dict:
         """Convert node to dictionary representation."""
-        result = self.page.to_dict()
+        if isinstance(self.page, PageSummary):
+            result = self.page._asdict()
+        else:
+            result = self.page.to_dict()
         result["depth"] = self.get_depth()
 
         if include_children:
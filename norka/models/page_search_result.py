@@ -0,0 +1,46 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+from typing import NamedTuple, Optional
+
+# Markers wrapped around matched terms in PageSearchResult.snippet. Control
+# characters never occur in page text, so callers can escape the snippet for
+# markup first and then swap the markers for highlighting tags.
+SNIPPET_MATCH_START = "\x02"
+SNIPPET_MATCH_END = "\x03"
+
+
+class PageSearchResult(NamedTuple):
+    """
+    A single full-text search hit.
+
+    Results are returned best match first, so rank is only meaningful for
+    comparing hits of the same query (lower is better).
+    """
+
+    page_id: str
+    title: str
+    icon: Optional[str]
+    snippet: str
+    rank: float
@@ -0,0 +1,53 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+from enum import StrEnum
+from typing import NamedTuple, Optional
+
+from .page import Page
+
+
+class PageTreeChangeKind(StrEnum):
+    INSERTED = "inserted"
+    REMOVED = "removed"
+    MOVED = "moved"
+    RETITLED = "retitled"
+
+
+class PageTreeChange(NamedTuple):
+    """
+    A single structural change of a workspace page tree.
+
+    Positions are indices among the siblings ordered by sort order and
+    title, the same order the sidebar tree uses. For REMOVED the parent and
+    position describe where the page was, for every other kind where it is
+    now; MOVED additionally carries where it came from.
+    """
+
+    kind: PageTreeChangeKind
+    page: Page
+    parent_id: Optional[str]
+    position: int
+    old_parent_id: Optional[str] = None
+    old_position: int = -1
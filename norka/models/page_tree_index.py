@@ -0,0 +1,275 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+import sys
+from array import array
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from norka.models.page_summary import PageSummary
+
+# Link value for "no node"
+NONE = -1
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+class PageTreeIndex:
+    """
+    Compact page hierarchy for very large workspaces.
+
+    Every page is a slot number. Parent, first-child and next-sibling links,
+    child counts and sort orders live in flat arrays, titles and icons in
+    lists of interned strings. No Page, PageNode or PageTreeItem objects are
+    kept, so a 100k-page tree costs a few arrays instead of hundreds of
+    thousands of GObjects.
+
+    Siblings are kept ordered by sort order and title. Slots of removed pages
+    are not reused, so items still holding a slot can never show another
+    page.
+    """
+
+    def __init__(self):
+        self._ids: List[str] = []
+        self._slots: Dict[str, int] = {}
+        self._titles: List[str] = []
+        self._icons: List[Optional[str]] = []
+        self._parent = array("i")
+        self._first_child = array("i")
+        self._next_sibling = array("i")
+        self._child_count = array("i")
+        self._sort_order = array("q")
+        self._first_root = NONE
+        self._root_count = 0
+
+    @classmethod
+    def build(cls, pages: Iterable[PageSummary]) -> "PageTreeIndex":
+        """
+        Build an index from page metadata.
+
+        Pages are sorted once; pages whose parent is not in the list
+        become roots.
+
+        Args:
+            pages: Page summaries of a workspace in any order
+
+        Returns:
+            Populated index
+        """
+        index = cls()
+        pages = sorted(pages, key=lambda page: (page.sort_order, page.title))
+        for page in pages:
+            index._allocate(page.id, page.title, page.icon, page.sort_order)
+
+        # Prepend in reverse order, so every sibling list ends up sorted
+        for slot in range(len(pages) - 1, -1, -1):
+            parent_slot = index._slots.get(pages[slot].parent_page_id, NONE)
+            if parent_slot == slot:
+                parent_slot = NONE
+            index._link_first(slot, parent_slot)
+
+        return index
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, page_id: str) -> bool:
+        return page_id in self._slots
+
+    # Accessors
+
+    def slot(self, page_id: str) -> int:
+        """Get the slot of a page, or NONE if it is not in the index."""
+        return self._slots.get(page_id, NONE)
+
+    def page_id(self, slot: int) -> str:
+        return self._ids[slot]
+
+    def title(self, slot: int) -> str:
+        return self._titles[slot]
+
+    def icon(self, slot: int) -> Optional[str]:
+        return self._icons[slot]
+
+    def parent(self, slot: int) -> int:
+        return self._parent[slot]
+
+    def child_count(self, slot: int) -> int:
+        return self._child_count[slot] if slot != NONE else self._root_count
+
+    def children(self, slot: int = NONE) -> Iterator[int]:
+        """Iterate over the child slots of a page, or over the roots."""
+        child = self._first_child[slot] if slot != NONE else self._first_root
+        while child != NONE:
+            yield child
+            child = self._next_sibling[child]
+
+    def position(self, slot: int) -> int:
+        """Get the index of a page among its siblings."""
+        for position, sibling in enumerate(self.children(self._parent[slot])):
+            if sibling == slot:
+                return position
+        raise KeyError(self._ids[slot])
+
+    def neighbours(self, slot: int, limit: int) -> List[int]:
+        """
+        Get the pages most likely to be opened after the given one.
+
+        Its first children come first, then its siblings from the nearest
+        outwards.
+
+        Args:
+            slot: Slot of the page
+            limit: Maximum number of slots to return
+
+        Returns:
+            Slots of the neighbouring pages
+        """
+        neighbours = list(islice(self.children(slot), limit // 2))
+        siblings = list(self.children(self._parent[slot]))
+        position = siblings.index(slot)
+        for distance in range(1, len(siblings)):
+            if len(neighbours) >= limit:
+                break
+            for sibling in (position + distance, position - distance):
+                if 0 <= sibling < len(siblings) and len(neighbours) < limit:
+                    neighbours.append(siblings[sibling])
+        return neighbours
+
+    # Mutations
+
+    def insert(
+        self,
+        page_id: str,
+        parent_id: Optional[str],
+        title: str,
+        icon: Optional[str],
+        sort_order: int,
+        position: int,
+    ) -> int:
+        """
+        Add a page at a position among its new siblings.
+
+        Returns:
+            Slot of the page
+        """
+        slot = self._allocate(page_id, title, icon, sort_order)
+        self._link_at(slot, self.slot(parent_id) if parent_id else NONE, position)
+        return slot
+
+    def move(self, slot: int, parent_id: Optional[str], position: int):
+        """Move a page with its subtree under a new parent."""
+        self._unlink(slot)
+        self._link_at(slot, self.slot(parent_id) if parent_id else NONE, position)
+
+    def update(self, slot: int, title: str, icon: Optional[str], sort_order: int):
+        """Update the displayed metadata of a page."""
+        self._titles[slot] = _intern(title)
+        self._icons[slot] = _intern(icon)
+        self._sort_order[slot] = sort_order
+
+    def remove(self, slot: int):
+        """Remove a page with its subtree."""
+        self._unlink(slot)
+        pending = [slot]
+        while pending:
+            current = pending.pop()
+            pending.extend(self.children(current))
+            del self._slots[self._ids[current]]
+
+    # Internals
+
+    def _allocate(
+        self, page_id: str, title: str, icon: Optional[str], sort_order: int
+    ) -> int:
+        slot = len(self._ids)
+        self._ids.append(page_id)
+        self._slots[page_id] = slot
+        self._titles.append(_intern(title))
+        self._icons.append(_intern(icon))
+        self._parent.append(NONE)
+        self._first_child.append(NONE)
+        self._next_sibling.append(NONE)
+        self._child_count.append(0)
+        self._sort_order.append(sort_order)
+        return slot
+
+    def _link_first(self, slot: int, parent_slot: int):
+        self._parent[slot] = parent_slot
+        if parent_slot == NONE:
+            self._next_sibling[slot] = self._first_root
+            self._first_root = slot
+            self._root_count += 1
+        else:
+            self._next_sibling[slot] = self._first_child[parent_slot]
+            self._first_child[parent_slot] = slot
+            self._child_count[parent_slot] += 1
+
+    def _link_at(self, slot: int, parent_slot: int, position: int):
+        if position <= 0:
+            self._link_first(slot, parent_slot)
+            return
+
+        previous = NONE
+        for i, sibling in enumerate(self.children(parent_slot)):
+            if i == position:
+                break
+            previous = sibling
+
+        if previous == NONE:
+            self._link_first(slot, parent_slot)
+            return
+
+        self._parent[slot] = parent_slot
+        self._next_sibling[slot] = self._next_sibling[previous]
+        self._next_sibling[previous] = slot
+        if parent_slot == NONE:
+            self._root_count += 1
+        else:
+            self._child_count[parent_slot] += 1
+
+    def _unlink(self, slot: int):
+        parent_slot = self._parent[slot]
+        following = self._next_sibling[slot]
+
+        first = self._first_child[parent_slot] if parent_slot != NONE else self._first_root
+        if first == slot:
+            if parent_slot == NONE:
+                self._first_root = following
+            else:
+                self._first_child[parent_slot] = following
+        else:
+            previous = first
+            while self._next_sibling[previous] != slot:
+                previous = self._next_sibling[previous]
+            self._next_sibling[previous] = following
+
+        if parent_slot == NONE:
+            self._root_count -= 1
+        else:
+            self._child_count[parent_slot] -= 1
+        self._parent[slot] = NONE
+        self._next_sibling[slot] = NONE
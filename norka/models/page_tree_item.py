@@ -24,35 +24,43 @@
 
 from gi.repository import GObject
 
-from norka.models.page_node import PageNode
+from norka.models.page_tree_index import PageTreeIndex
 
 
 class PageTreeItem(GObject.Object):
     """
-    Wrapper class for PageNode to work with Gtk.TreeListModel.
+    Wrapper for a PageTreeIndex slot to work with Gtk.TreeListModel.
     This represents a single item in the tree structure.
+
+    Items are only created for rows of expanded nodes, and they read
+    everything they show straight from the index.
     """
 
-    def __init__(self, page_node: PageNode):
+    def __init__(self, index: PageTreeIndex, slot: int):
         super().__init__()
-        self._page_node = page_node
+        self._index = index
+        self._slot = slot
+
+    @property
+    def slot(self) -> int:
+        return self._slot
 
     @GObject.Property
-    def page_node(self) -> PageNode:
-        return self._page_node
+    def page_id(self) -> str:
+        return self._index.page_id(self._slot)
 
     @GObject.Property
     def title(self) -> str:
-        return self._page_node.page.title
+        return self._index.title(self._slot)
 
     @GObject.Property
     def icon(self) -> str:
-        return self._page_node.page.icon or "📄"
+        return self._index.icon(self._slot) or "📄"
 
     @GObject.Property
     def has_children(self) -> bool:
-        return len(self._page_node.children) > 0
+        return self._index.child_count(self._slot) > 0
 
     @GObject.Property
     def children_count(self) -> int:
-        return len(self._page_node.children)
+        return self._index.child_count(self._slot)
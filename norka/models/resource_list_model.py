@@ -0,0 +1,204 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from gi.repository import Gio, GLib, GObject, Gom
+from loguru import logger
+
+# Rows fetched from the database at once
+RESOURCE_WINDOW_SIZE = 50
+# Fetched windows kept in memory, least recently used are dropped first
+RESOURCE_WINDOW_LIMIT = 8
+
+
+class ResourceListModel(GObject.Object, Gio.ListModel):
+    """
+    List model over the rows of a Gom query, fetched as they are shown.
+
+    Only the number of rows is known upfront. The rows themselves are
+    fetched in windows with ``Gom.ResourceGroup.fetch_async()`` the first
+    time a list view asks for one of them. Until its window arrives, a
+    position holds an empty placeholder resource, which is replaced with
+    the real one through ``items-changed``.
+
+    A resource group keeps every row it has fetched, so once as many
+    windows as the LRU holds went through it, the group is queried again
+    and the old one is dropped together with the evicted windows. Queries
+    run on the database worker, never while a list view asks for an item;
+    windows asked for meanwhile are fetched from the new group.
+    """
+
+    __gtype_name__ = "NorkaResourceListModel"
+
+    def __init__(
+        self,
+        resource_type: type,
+        query: Callable[[], Gom.ResourceGroup],
+        submit: Callable[[Callable], Future],
+        share: Callable[[List[Gom.Resource]], List[Gom.Resource]] = None,
+        window_size: int = RESOURCE_WINDOW_SIZE,
+        window_limit: int = RESOURCE_WINDOW_LIMIT,
+    ):
+        """
+        Args:
+            resource_type: Gom.Resource subclass of the rows
+            query: Callable running the query and returning its resource group
+            submit: Callable running a function on the database worker, like
+                DatabaseManager.submit()
+            share: Callable swapping fetched resources for the live ones
+            window_size: Number of rows fetched at once
+            window_limit: Number of fetched windows kept in memory
+        """
+        super().__init__()
+        self._resource_type = resource_type
+        self._query = query
+        self._submit = submit
+        self._share = share or list
+        self._window_size = window_size
+        self._window_limit = window_limit
+
+        self._group: Gom.ResourceGroup = query()
+        self._n_items = self._group.get_count()
+        # Windows fetched through the current group
+        self._group_windows = 0
+        self._windows: OrderedDict[int, List[Gom.Resource]] = OrderedDict()
+        self._pending: Set[int] = set()
+        self._placeholders: Dict[int, Gom.Resource] = {}
+        # Windows to fetch once the query running again completes
+        self._requested: Set[int] = set()
+        self._requerying = False
+        self._replace = False
+
+    def do_get_item_type(self) -> GObject.GType:
+        return self._resource_type.__gtype__
+
+    def do_get_n_items(self) -> int:
+        return self._n_items
+
+    def do_get_item(self, position: int) -> Optional[Gom.Resource]:
+        if position >= self._n_items:
+            return None
+
+        index = position // self._window_size
+        if (window := self._windows.get(index)) is not None:
+            self._windows.move_to_end(index)
+            return window[position % self._window_size]
+
+        self._fetch(index)
+        if (placeholder := self._placeholders.get(position)) is None:
+            # Gom resources built without properties skip their setup
+            placeholder = self._placeholders[position] = self._resource_type()
+        return placeholder
+
+    def is_loaded(self, position: int) -> bool:
+        """Whether the row at a position has been fetched."""
+        return position // self._window_size in self._windows
+
+    def reload(self):
+        """Run the query again on the database worker and replace every row."""
+        self._replace = True
+        self._requery()
+
+    def _requery(self):
+        if self._requerying:
+            return
+        self._requerying = True
+
+        def run() -> Tuple[Gom.ResourceGroup, int]:
+            group = self._query()
+            return group, group.get_count()
+
+        def on_done(future: Future):
+            GLib.idle_add(self._on_requeried, future)
+
+        self._submit(run).add_done_callback(on_done)
+
+    def _on_requeried(self, future: Future) -> bool:
+        self._requerying = False
+        replace, self._replace = self._replace, False
+        # Fetches of the previous group are ignored when they complete
+        refetch = self._requested | self._pending
+        self._requested.clear()
+        self._pending.clear()
+        try:
+            group, n_items = future.result()
+        except Exception:
+            # Already logged by the database worker
+            return GLib.SOURCE_REMOVE
+
+        self._group = group
+        self._group_windows = 0
+        if replace or n_items != self._n_items:
+            # Rows were added or removed since the last query, so the
+            # fetched windows no longer line up with the positions
+            removed = self._n_items
+            self._n_items = n_items
+            self._windows.clear()
+            self._placeholders.clear()
+            self.items_changed(0, removed, n_items)
+        else:
+            for index in sorted(refetch):
+                self._fetch(index)
+        return GLib.SOURCE_REMOVE
+
+    def _fetch(self, index: int):
+        if index in self._pending or index in self._requested:
+            return
+
+        if self._requerying or self._group_windows >= self._window_limit:
+            self._requested.add(index)
+            self._requery()
+            return
+
+        start = index * self._window_size
+        count = min(self._window_size, self._n_items - start)
+        self._pending.add(index)
+        self._group_windows += 1
+        self._group.fetch_async(start, count, self._on_fetched, (self._group, index))
+
+    def _on_fetched(self, group: Gom.ResourceGroup, result: Gio.AsyncResult, data):
+        fetched_group, index = data
+        if fetched_group is not self._group or index not in self._pending:
+            return
+        self._pending.discard(index)
+
+        try:
+            group.fetch_finish(result)
+        except GLib.Error as e:
+            logger.error("Failed to fetch rows of window {}: {}", index, e)
+            return
+
+        start = index * self._window_size
+        count = min(self._window_size, self._n_items - start)
+        window = self._share([group.get_index(start + i) for i in range(count)])
+
+        self._windows[index] = window
+        while len(self._windows) > self._window_limit:
+            self._windows.popitem(last=False)
+        for position in range(start, start + count):
+            self._placeholders.pop(position, None)
+
+        self.items_changed(start, count, count)
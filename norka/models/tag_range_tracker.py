@@ -0,0 +1,179 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, List
+
+from norka.models.tag_table import TagRanges
+
+
+class _Ranges:
+    """Sorted, disjoint and non-touching [start, end) ranges of one tag."""
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self):
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+
+    def add(self, start: int, end: int):
+        # Ranges overlapping or touching [start, end) are merged into it
+        i = bisect_left(self.ends, start)
+        j = bisect_right(self.starts, end)
+        if i < j:
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[j - 1])
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+
+    def remove(self, start: int, end: int):
+        i = bisect_right(self.ends, start)
+        j = bisect_left(self.starts, end)
+        if i >= j:
+            return
+
+        starts, ends = [], []
+        if self.starts[i] < start:
+            starts.append(self.starts[i])
+            ends.append(start)
+        if self.ends[j - 1] > end:
+            starts.append(end)
+            ends.append(self.ends[j - 1])
+        self.starts[i:j] = starts
+        self.ends[i:j] = ends
+
+    def insert(self, offset: int, length: int):
+        # Text typed inside a range or right at its end takes the tag, text
+        # typed at its start does not, the same as in GtkTextBuffer
+        i = bisect_left(self.ends, offset)
+        if i < len(self.starts) and self.starts[i] < offset:
+            self.ends[i] += length
+            i += 1
+        self.starts[i:] = [start + length for start in self.starts[i:]]
+        self.ends[i:] = [end + length for end in self.ends[i:]]
+
+    def delete(self, start: int, end: int):
+        length = end - start
+
+        def shift(offset: int) -> int:
+            if offset <= start:
+                return offset
+            return start if offset < end else offset - length
+
+        # The range before the deletion may now touch the ones after it
+        i = max(bisect_right(self.ends, start) - 1, 0)
+        starts: List[int] = []
+        ends: List[int] = []
+        for range_start, range_end in zip(self.starts[i:], self.ends[i:]):
+            range_start, range_end = shift(range_start), shift(range_end)
+            if range_start == range_end:
+                continue
+            if ends and ends[-1] >= range_start:
+                ends[-1] = max(ends[-1], range_end)
+            else:
+                starts.append(range_start)
+                ends.append(range_end)
+        self.starts[i:] = starts
+        self.ends[i:] = ends
+
+
+class TagRangeTracker:
+    """
+    Live tag ranges of a text buffer.
+
+    Kept up to date from the buffer's apply-tag, remove-tag, insert-text
+    and delete-range signals, so serializing the tags does not have to walk
+    the whole buffer. Offsets are in characters.
+    """
+
+    def __init__(self):
+        self._tags: Dict[str, _Ranges] = {}
+
+    def clear(self):
+        """Forget all ranges."""
+        self._tags.clear()
+
+    def add(self, name: str, start: int, end: int):
+        """
+        Record a tag applied to [start, end).
+
+        Args:
+            name: Tag name
+            start: Start offset
+            end: End offset
+        """
+        if start >= end:
+            return
+        if name not in self._tags:
+            self._tags[name] = _Ranges()
+        self._tags[name].add(start, end)
+
+    def remove(self, name: str, start: int, end: int):
+        """
+        Record a tag removed from [start, end).
+
+        Args:
+            name: Tag name
+            start: Start offset
+            end: End offset
+        """
+        if (ranges := self._tags.get(name)) and start < end:
+            ranges.remove(start, end)
+
+    def insert(self, offset: int, length: int):
+        """
+        Shift the ranges for text inserted at offset.
+
+        Args:
+            offset: Insert position
+            length: Number of characters inserted
+        """
+        if length > 0:
+            for ranges in self._tags.values():
+                ranges.insert(offset, length)
+
+    def delete(self, start: int, end: int):
+        """
+        Shrink and shift the ranges for text deleted from [start, end).
+
+        Args:
+            start: Start offset
+            end: End offset
+        """
+        if start < end:
+            for ranges in self._tags.values():
+                ranges.delete(start, end)
+
+    def to_dict(self) -> TagRanges:
+        """
+        Get the current ranges.
+
+        Returns:
+            Tag names mapped to lists of (start, end) offsets
+        """
+        return {
+            name: list(zip(ranges.starts, ranges.ends))
+            for name, ranges in self._tags.items()
+            if ranges.starts
+        }
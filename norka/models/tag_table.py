@@ -0,0 +1,139 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Binary encoding of editor tag tables.
+
+A tag table maps tag names to the [start, end) character offsets the tag
+is applied to. The encoding is:
+
+    magic   b"NTT"
+    version u8
+    count   varint                  number of tags
+    then, for every tag:
+        name    varint length + UTF-8 bytes
+        ranges  varint count
+        then, for every range sorted by start:
+            varint  start - previous start
+            varint  end - start
+
+Varints are unsigned LEB128. Tag names are stored once per table and
+interned when decoded, so a heavily formatted page costs a couple of
+bytes per range instead of a JSON list.
+"""
+
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+TagRanges = Dict[str, List[Tuple[int, int]]]
+
+TAG_TABLE_MAGIC = b"NTT"
+TAG_TABLE_VERSION = 1
+
+
+def _write_varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        try:
+            byte = data[pos]
+        except IndexError:
+            raise ValueError("Truncated tag table") from None
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def encode_tag_table(tag_table: Dict[str, Sequence[Sequence[int]]]) -> bytes:
+    """
+    Encode a tag table.
+
+    Args:
+        tag_table: Tag names mapped to (start, end) offset pairs
+
+    Returns:
+        Encoded tag table
+    """
+    out = bytearray(TAG_TABLE_MAGIC)
+    out.append(TAG_TABLE_VERSION)
+    _write_varint(out, len(tag_table))
+    for name, ranges in tag_table.items():
+        encoded_name = name.encode()
+        _write_varint(out, len(encoded_name))
+        out += encoded_name
+
+        _write_varint(out, len(ranges))
+        previous = 0
+        for start, end in sorted(ranges):
+            _write_varint(out, start - previous)
+            _write_varint(out, max(end - start, 0))
+            previous = start
+    return bytes(out)
+
+
+def decode_tag_table(data: bytes) -> TagRanges:
+    """
+    Decode a tag table produced by encode_tag_table().
+
+    Args:
+        data: Encoded tag table
+
+    Returns:
+        Tag names mapped to lists of (start, end) offset pairs
+
+    Raises:
+        ValueError: If data is not an encoded tag table or is truncated
+    """
+    header = len(TAG_TABLE_MAGIC)
+    if data[:header] != TAG_TABLE_MAGIC or len(data) <= header:
+        raise ValueError("Not an encoded tag table")
+    if data[header] != TAG_TABLE_VERSION:
+        raise ValueError(f"Unsupported tag table version {data[header]}")
+
+    tag_table: TagRanges = {}
+    count, pos = _read_varint(data, header + 1)
+    for _ in range(count):
+        length, pos = _read_varint(data, pos)
+        name = sys.intern(data[pos:pos + length].decode())
+        pos += length
+
+        range_count, pos = _read_varint(data, pos)
+        ranges = []
+        start = 0
+        for _ in range(range_count):
+            delta, pos = _read_varint(data, pos)
+            length, pos = _read_varint(data, pos)
+            start += delta
+            ranges.append((start, start + length))
+        tag_table[name] = ranges
+    return tag_table
@@ -30,6 +30,17 @@ import nanoid
 from gi.repository import GObject, Gom
 from gi.types import GObjectMeta
 
+from norka.models.change_tracking import ChangeTracking
+
+
+# Signals that need the property change handlers of a workspace
+WORKSPACE_CHANGE_SIGNALS = (
+    "workspace-changed",
+    "workspace-activated",
+    "workspace-deactivated",
+    "workspace-accessed",
+)
+
 
 class WorkspaceResourceMeta(GObjectMeta):
     def __init__(self, name, bases, dct):
@@ -39,7 +50,7 @@ class WorkspaceResourceMeta(GObjectMeta):
         self.set_notnull("name")
 
 
-class Workspace(Gom.Resource, metaclass=WorkspaceResourceMeta):
+class Workspace(ChangeTracking, Gom.Resource, metaclass=WorkspaceResourceMeta):
     """
     Workspace model representing a collection of documents and settings.
 
@@ -63,8 +74,35 @@ class Workspace(Gom.Resource, metaclass=WorkspaceResourceMeta):
     is_active: bool = GObject.Property(type=bool, default=True)
     is_favorite: bool = GObject.Property(type=bool, default=False)
 
+    # Whether the property change handlers are connected
+    _tracking: bool = False
+
+    tracked_properties = frozenset(
+        {
+            "name",
+            "description",
+            "path",
+            "icon",
+            "cover",
+            "created_at",
+            "updated_at",
+            "last_accessed",
+            "is_active",
+            "is_favorite",
+        }
+    )
+
     def __init__(self, **kwargs):
-        """Initialize a new workspace."""
+        """
+        Initialize a workspace.
+
+        Workspaces created by Gom while loading rows skip the defaults and
+        the change handlers, see track_changes().
+        """
+        if not kwargs:
+            super().__init__()
+            return
+
         super().__init__(repository=kwargs.get("repository", None))
 
         self.id = kwargs.get("id", nanoid.generate())
@@ -88,15 +126,29 @@ class Workspace(Gom.Resource, metaclass=WorkspaceResourceMeta):
         self.is_favorite = kwargs.get("is_favorite", False)
 
         self._signal_handlers = {}
-        self._setup_signals()
+        self.track_changes()
 
-    def _setup_signals(self):
-        """Setup GObject signals for the workspace."""
-        # Connect to property change signals
+    def track_changes(self):
+        """
+        Start reacting to property changes.
+
+        Loaded workspaces start without the handlers, so Gom assigning
+        is_active does not stamp a fresh access time. Tracking starts with
+        the first edit through the workspace methods, or when anything
+        connects to the workspace signals.
+        """
+        if self._tracking:
+            return
+        self._tracking = True
         self.connect("notify::name", self._on_property_changed)
         self.connect("notify::is-active", self._on_active_changed)
         self.connect("notify::last-accessed", self._on_accessed)
 
+    def connect(self, detailed_signal: str, *args, **kwargs) -> int:
+        if detailed_signal.split("::")[0] in WORKSPACE_CHANGE_SIGNALS:
+            self.track_changes()
+        return super().connect(detailed_signal, *args, **kwargs)
+
     def _on_property_changed(self, obj, pspec):
         """Handle property changes."""
         self.updated_at = int(datetime.now().timestamp())
@@ -214,14 +266,17 @@ class Workspace(Gom.Resource, metaclass=WorkspaceResourceMeta):
 
     def deactivate(self):
         """Deactivate this workspace."""
+        self.track_changes()
         self.is_active = False
 
     def toggle_favorite(self):
         """Toggle the favorite status of this workspace."""
+        self.track_changes()
         self.is_favorite = not self.is_favorite
 
     def update_access_time(self):
         """Update the last accessed time."""
+        self.track_changes()
         self.last_accessed = int(datetime.now().timestamp())
 
     def get_path(self) -> Optional[Path]:
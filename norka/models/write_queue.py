@@ -0,0 +1,254 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+from gi.repository import GLib, Gom
+from loguru import logger
+
+if TYPE_CHECKING:
+    from .database import DatabaseManager
+
+# Delay between the first queued write and the flush, in milliseconds
+FLUSH_INTERVAL_MS = 500
+# Number of pending rows that triggers an immediate flush
+MAX_PENDING_WRITES = 64
+# Failed flushes a row's write may cause before it is dropped
+MAX_WRITE_ATTEMPTS = 3
+
+# Writes return a function marking what they stored as unsaved again, which
+# is called when the transaction they ran in is rolled back
+Restore = Callable[[], None]
+Write = Callable[[Gom.Adapter], Optional[Restore]]
+
+
+class WriteQueue:
+    """
+    Write-behind queue merging repeated writes to the same row.
+
+    Services queue a write function per row key. A later write for the same
+    key replaces the earlier one, which is fine as long as the function
+    reads the live object when it runs. Pending writes are committed in a
+    single transaction on a short timer, when the queue grows past a
+    threshold, and before any other database access, so readers never see
+    stale rows.
+
+    When one write fails, the whole transaction is rolled back. The writes
+    that already ran restore what they consumed, and every write of the
+    batch is queued again unless a newer one for its row is pending. A row
+    whose write fails MAX_WRITE_ATTEMPTS flushes in a row is dropped, so
+    one bad write cannot block every later flush.
+    """
+
+    def __init__(
+        self,
+        database: "DatabaseManager",
+        interval: int = FLUSH_INTERVAL_MS,
+        max_pending: int = MAX_PENDING_WRITES,
+    ):
+        """
+        Args:
+            database: Database the writes go to
+            interval: Flush delay in milliseconds
+            max_pending: Number of pending rows that triggers a flush
+        """
+        self._database = database
+        self._interval = interval
+        self._max_pending = max_pending
+        self._pending: OrderedDict[Hashable, Write] = OrderedDict()
+        # Failed flushes caused by a row's write, reset when it succeeds
+        self._failures: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        # Held for a whole flush, so flushes commit in the order they started
+        self._flush_lock = threading.Lock()
+        # Keys queued inside recording(), per thread
+        self._recorded = threading.local()
+        self._timer_id = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def enqueue(self, key: Hashable, write: Write):
+        """
+        Queue a write for a row.
+
+        Args:
+            key: Row key, e.g. a (table, id) tuple
+            write: Function writing the row on the adapter thread
+        """
+        if (recorded := getattr(self._recorded, "keys", None)) is not None:
+            recorded.append(key)
+
+        with self._lock:
+            self._pending.pop(key, None)
+            self._pending[key] = write
+            full = len(self._pending) >= self._max_pending
+            if not full and not self._timer_id:
+                self._timer_id = GLib.timeout_add(self._interval, self._on_timeout)
+
+        if full:
+            self.flush()
+
+    def discard(self, keys: Iterable[Hashable]):
+        """Drop pending writes, e.g. for rows that are being deleted."""
+        with self._lock:
+            for key in keys:
+                self._pending.pop(key, None)
+
+    def clear(self):
+        """Drop all pending writes."""
+        with self._lock:
+            self._pending.clear()
+
+    @contextmanager
+    def recording(self) -> Iterator[List[Hashable]]:
+        """
+        Collect the keys the current thread queues inside the block.
+
+        Nested recordings also add their keys to the outer one.
+        """
+        outer = getattr(self._recorded, "keys", None)
+        keys: List[Hashable] = []
+        self._recorded.keys = keys
+        try:
+            yield keys
+        finally:
+            self._recorded.keys = outer
+            if outer is not None:
+                outer.extend(keys)
+
+    def flush(self) -> int:
+        """
+        Commit all pending writes in one transaction.
+
+        Returns:
+            Number of rows written
+        """
+        # Waits for a transaction open on another thread to end
+        with self._database.transaction_lock, self._flush_lock:
+            with self._lock:
+                writes = list(self._pending.items())
+                self._pending.clear()
+            if not writes:
+                return 0
+
+            restores: List[Restore] = []
+            failed: List[Hashable] = []
+
+            def commit(adapter: Gom.Adapter):
+                # A savepoint commits on release, or joins the transaction
+                # of DatabaseManager.transaction() when one is open
+                adapter.execute_sql("SAVEPOINT write_queue")
+                try:
+                    for key, write in writes:
+                        failed[:] = [key]
+                        if restore := write(adapter):
+                            restores.append(restore)
+                    failed.clear()
+                except Exception:
+                    adapter.execute_sql("ROLLBACK TO write_queue; RELEASE write_queue")
+                    raise
+                adapter.execute_sql("RELEASE write_queue")
+
+            try:
+                self._database.run_in_adapter(commit)
+            except Exception as e:
+                for restore in restores:
+                    restore()
+                self._requeue(writes, failed[0] if failed else None, e)
+                raise
+
+            for key, _write in writes:
+                self._failures.pop(key, None)
+            logger.debug("Flushed {} queued writes", len(writes))
+            return len(writes)
+
+    def flush_logged(self) -> int:
+        """
+        Commit all pending writes, logging a failure instead of raising it.
+
+        Used before reads, which should not fail because of an unrelated
+        write; the writes of a failed flush stay queued.
+
+        Returns:
+            Number of rows written
+        """
+        try:
+            return self.flush()
+        except Exception as e:
+            logger.error("Failed to flush queued writes: {}", e)
+            return 0
+
+    def _requeue(
+        self, writes: List[tuple], failed_key: Optional[Hashable], error: Exception
+    ):
+        """Put back the writes of a rolled back flush, before newer ones."""
+        if failed_key is not None:
+            attempts = self._failures.get(failed_key, 0) + 1
+            if attempts >= MAX_WRITE_ATTEMPTS:
+                logger.error(
+                    "Dropping queued write for {} after {} failed attempts: {}",
+                    failed_key,
+                    attempts,
+                    error,
+                )
+                self._failures.pop(failed_key, None)
+                writes = [(key, write) for key, write in writes if key != failed_key]
+            else:
+                self._failures[failed_key] = attempts
+
+        with self._lock:
+            pending = OrderedDict(
+                (key, write) for key, write in writes if key not in self._pending
+            )
+            pending.update(self._pending)
+            self._pending = pending
+            if not self._timer_id:
+                self._timer_id = GLib.timeout_add(self._interval, self._on_timeout)
+
+    def close(self):
+        """Stop the timer and commit what is still pending."""
+        with self._lock:
+            if self._timer_id:
+                GLib.source_remove(self._timer_id)
+                self._timer_id = 0
+        self.flush()
+
+    def _on_timeout(self) -> bool:
+        with self._lock:
+            self._timer_id = 0
+        self._database.submit(self.flush_logged)
+        return GLib.SOURCE_REMOVE
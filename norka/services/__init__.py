@@ -22,11 +22,14 @@
 #
 # SPDX-License-Identifier: MIT
 
+from .page_open_metrics import PageOpenMetrics, PageOpenTrace
 from .page_service import PageNode, PageService
 from .workspace_service import WorkspaceService
 
 __all__ = [
     "PageService",
     "PageNode",
+    "PageOpenMetrics",
+    "PageOpenTrace",
     "WorkspaceService",
 ]
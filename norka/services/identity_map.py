@@ -0,0 +1,150 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable, Generic, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class IdentityMap(Generic[T]):
+    """
+    Bounded cache handing out one live object per database row.
+
+    Objects are keyed by their primary key. The estimated size of all
+    entries is kept under a memory budget by evicting the least recently
+    used entries first. Evicting an object only drops the map's reference:
+    as long as something else, like the open editor, still holds it, it
+    stays the live object for its key and is handed out again instead of
+    a second instance. The map is shared by the main thread and the
+    database worker, so every operation takes a lock.
+    """
+
+    def __init__(self, budget: int, sizeof: Callable[[T], int]):
+        """
+        Args:
+            budget: Maximum estimated size of all entries in bytes
+            sizeof: Function estimating the memory held by one object
+        """
+        self._budget = budget
+        self._sizeof = sizeof
+        self._entries: OrderedDict[str, tuple[T, int]] = OrderedDict()
+        # Every live object, including evicted ones still referenced elsewhere
+        self._live: weakref.WeakValueDictionary[str, T] = weakref.WeakValueDictionary()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or key in self._live
+
+    @property
+    def size(self) -> int:
+        """Estimated size of all entries in bytes."""
+        return self._size
+
+    def get(self, key: str) -> Optional[T]:
+        """Get the live object for a key and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+            if (obj := self._live.get(key)) is not None:
+                self._add(key, obj)
+            return obj
+
+    def put(self, key: str, obj: T) -> T:
+        """
+        Remember an object, or re-estimate its size if it is already known.
+
+        Args:
+            key: Primary key of the object
+            obj: Object loaded or created by the service
+
+        Returns:
+            The live object for the key, which may be an earlier instance
+        """
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                obj = entry[0]
+                self._size -= entry[1]
+            elif (live := self._live.get(key)) is not None:
+                obj = live
+            self._add(key, obj)
+            return obj
+
+    def share(self, objects: Iterable[T], key: Callable[[T], str]) -> list[T]:
+        """
+        Replace loaded objects with the live ones already in the map.
+
+        Objects that are not in the map are returned as they are and are
+        not added.
+        """
+        with self._lock:
+            return [
+                entry[0]
+                if (entry := self._entries.get(key(obj)))
+                else self._live.get(key(obj), obj)
+                for obj in objects
+            ]
+
+    def discard(self, key: str):
+        """Forget the object for a key."""
+        with self._lock:
+            self._live.pop(key, None)
+            if (entry := self._entries.pop(key, None)) is not None:
+                self._size -= entry[1]
+
+    def discard_many(self, keys: Iterable[str]):
+        """Forget the objects for several keys."""
+        with self._lock:
+            for key in keys:
+                self._live.pop(key, None)
+                if (entry := self._entries.pop(key, None)) is not None:
+                    self._size -= entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._live.clear()
+            self._size = 0
+
+    def _add(self, key: str, obj: T):
+        size = self._sizeof(obj)
+        self._entries[key] = (obj, size)
+        self._entries.move_to_end(key)
+        self._live[key] = obj
+        self._size += size
+        self._evict()
+
+    def _evict(self):
+        # Always keep the most recent entry, even if it alone is over budget
+        while self._size > self._budget and len(self._entries) > 1:
+            _key, (_obj, size) = self._entries.popitem(last=False)
+            self._size -= size
@@ -0,0 +1,193 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrey Maksimov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+import statistics
+import time
+from collections import deque
+from typing import Dict, List, Optional, Self
+
+from gi.repository import GObject
+from loguru import logger
+
+# Number of page opens kept for the statistics
+PAGE_OPEN_HISTORY = 256
+# Upper bounds of the page size buckets, in characters
+PAGE_SIZE_BUCKETS = (4 * 1024, 64 * 1024, 1024 * 1024)
+
+
+def _size_bucket(size: int) -> str:
+    for bound in PAGE_SIZE_BUCKETS:
+        if size < bound:
+            return f"<{bound // 1024}K"
+    return f">={PAGE_SIZE_BUCKETS[-1] // 1024}K"
+
+
+class PageOpenTrace:
+    """
+    Timings of a single page open.
+
+    Every mark() records the time spent since the previous mark under the
+    name of the stage that just completed.
+    """
+
+    def __init__(self, page_id: str):
+        self.page_id = page_id
+        # Length of the page text in characters, once known
+        self.size = 0
+        self.stages: Dict[str, float] = {}
+        self.finished = False
+        self.cancelled = False
+        self._started = time.perf_counter()
+        self._last = self._started
+
+    @property
+    def done(self) -> bool:
+        return self.finished or self.cancelled
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Time from the start of the open to the last mark."""
+        return (self._last - self._started) * 1000
+
+    def mark(self, stage: str):
+        """
+        Record the time spent in a stage.
+
+        Marks after the trace is finished or cancelled are ignored.
+
+        Args:
+            stage: Name of the stage that just completed
+        """
+        if self.done:
+            return
+        now = time.perf_counter()
+        self.stages[stage] = (now - self._last) * 1000
+        self._last = now
+
+
+class PageOpenMetrics(GObject.Object):
+    """
+    Collects the timings of recent page opens.
+
+    A page open starts when the user picks a page and finishes when the
+    editor becomes editable. Opens superseded by a newer one are counted
+    as cancelled and kept out of the statistics.
+    """
+
+    __gtype_name__ = "PageOpenMetrics"
+
+    __gsignals__ = {
+        "page-opened": (GObject.SIGNAL_RUN_FIRST, None, (object,)),
+    }
+
+    _metrics: Optional[Self] = None
+
+    def __init__(self, history: int = PAGE_OPEN_HISTORY):
+        super().__init__()
+        self._traces: deque[PageOpenTrace] = deque(maxlen=history)
+        self.cancelled = 0
+
+    @classmethod
+    def get_default(cls) -> Self:
+        if cls._metrics is None:
+            cls._metrics = cls()
+        return cls._metrics
+
+    @property
+    def traces(self) -> List[PageOpenTrace]:
+        """Finished page opens, oldest first."""
+        return list(self._traces)
+
+    def start(self, page_id: str) -> PageOpenTrace:
+        """
+        Start timing a page open.
+
+        Args:
+            page_id: ID of the page being opened
+
+        Returns:
+            Trace to mark the stages on
+        """
+        return PageOpenTrace(page_id)
+
+    def finish(self, trace: PageOpenTrace):
+        """
+        Record a completed page open.
+
+        Args:
+            trace: Trace of the page open
+        """
+        if trace.done:
+            return
+        trace.finished = True
+        self._traces.append(trace)
+        logger.debug(
+            "Opened page {} ({} chars) in {:.1f} ms: {}",
+            trace.page_id,
+            trace.size,
+            trace.elapsed_ms,
+            ", ".join(f"{stage} {ms:.1f} ms" for stage, ms in trace.stages.items()),
+        )
+        self.emit("page-opened", trace)
+
+    def cancel(self, trace: Optional[PageOpenTrace]):
+        """
+        Drop a page open that was superseded before it completed.
+
+        Args:
+            trace: Trace of the page open, or None
+        """
+        if trace is None or trace.done:
+            return
+        trace.cancelled = True
+        self.cancelled += 1
+
+    def time_to_editable(self) -> Dict[str, float]:
+        """
+        Median time from picking a page to an editable editor.
+
+        Returns:
+            Page size buckets mapped to the median time in milliseconds
+        """
+        by_size: Dict[str, List[float]] = {}
+        for trace in self._traces:
+            by_size.setdefault(_size_bucket(trace.size), []).append(trace.elapsed_ms)
+        return {
+            bucket: statistics.median(elapsed) for bucket, elapsed in by_size.items()
+        }
+
+    def stage_medians(self) -> Dict[str, float]:
+        """
+        Median time spent in every stage.
+
+        Returns:
+            Stage names mapped to the median time in milliseconds
+        """
+        by_stage: Dict[str, List[float]] = {}
+        for trace in self._traces:
+            for stage, elapsed in trace.stages.items():
+                by_stage.setdefault(stage, []).append(elapsed)
+        return {
+            stage: statistics.median(elapsed) for stage, elapsed in by_stage.items()
+        }
@@ -22,12 +22,77 @@
 #
 # SPDX-License-Identifier: MIT
 
-from typing import Dict, List, Optional, Self
+import asyncio
+import functools
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Self, Sequence, Tuple
 
 from gi.repository import GLib, GObject, Gom
 from loguru import logger
 
-from norka.models import DatabaseManager, Page, PageNode, get_database_manager
+from norka.models import (
+    DatabaseManager,
+    Page,
+    PageBreadcrumb,
+    PageNode,
+    PageSearchResult,
+    PageSummary,
+    PageTreeChange,
+    PageTreeChangeKind,
+    PageTreeIndex,
+    encode_tag_table,
+    get_database_manager,
+)
+from norka.models.database import execute_sql, update_row
+from norka.models.page_search_result import SNIPPET_MATCH_END, SNIPPET_MATCH_START
+from norka.services.identity_map import IdentityMap
+
+SEARCH_RESULTS_LIMIT = 50
+SEARCH_SNIPPET_TOKENS = 12
+BREADCRUMB_CACHE_SIZE = 1024
+# Memory budget of the live page objects kept by PageService, in bytes
+PAGE_CACHE_BUDGET = 32 * 1024 * 1024
+# Rough per-object overhead of a Page GObject and its GValues
+PAGE_BASE_SIZE = 2048
+# Page properties stored in the pages table, by column
+PAGE_COLUMNS = {
+    "title": "title",
+    "icon": "icon",
+    "cover": "cover",
+    "parent_page_id": "parent-page-id",
+    "updated_at": "updated-at",
+    "last_accessed": "last-accessed",
+    "is_favorite": "is-favorite",
+    "is_archived": "is-archived",
+    "is_published": "is-published",
+    "sort_order": "sort-order",
+}
+# Page properties stored in the page_contents table, by column
+PAGE_BODY_COLUMNS = {"text": "text", "content": "content", "tag_table": "tag_table"}
+# Metadata of the pages matching a WHERE clause, see PageSummary
+PAGE_SUMMARY_QUERY = """
+    SELECT id, "workspace-id", "parent-page-id", title, icon,
+           "sort-order", "is-favorite", "is-archived"
+    FROM pages WHERE {where}
+    ORDER BY "sort-order"
+"""
+# Bytes of pages a prefetch round may load into the cache
+PREFETCH_BUDGET = 4 * 1024 * 1024
+# Tree neighbours and recent pages warmed after a page opens
+PREFETCH_NEIGHBOURS = 8
+PREFETCH_RECENT_PAGES = 5
+
+
+def _page_size(page: Page) -> int:
+    size = PAGE_BASE_SIZE + len(page.title or "") + len(page.tag_table or "")
+    # Python strings use up to 4 bytes per character
+    size += 4 * len(page.text or "")
+    if page.content is not None:
+        size += page.content.get_size()
+    return size
 
 
 class PageService(GObject.Object):
@@ -38,18 +103,42 @@ class PageService(GObject.Object):
     __gsignals__ = {
         "page-created": (GObject.SIGNAL_RUN_FIRST, None, (Page,)),
         "page-updated": (GObject.SIGNAL_RUN_FIRST, None, (Page,)),
-        "page-deleted": (GObject.SIGNAL_RUN_FIRST, None, (Page, bool)),
         "page-moved": (
             GObject.SIGNAL_RUN_FIRST,
             None,
             (Page, str, str),
         ),  # page, old_parent_id, new_parent_id
         "page-tree-changed": (GObject.SIGNAL_RUN_FIRST, None, (str,)),  # workspace_id
+        "pages-deleted": (
+            GObject.SIGNAL_RUN_FIRST,
+            None,
+            (str, object),
+        ),  # workspace_id, list of deleted page IDs
+        "page-tree-delta": (
+            GObject.SIGNAL_RUN_FIRST,
+            None,
+            (str, object),
+        ),  # workspace_id, list of PageTreeChange
     }
 
-    def __init__(self, database: DatabaseManager, **kwargs):
+    def __init__(
+        self,
+        database: DatabaseManager,
+        cache_budget: int = PAGE_CACHE_BUDGET,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self._database = database
+        # One live Page per row, shared by every caller
+        self._pages: IdentityMap[Page] = IdentityMap(cache_budget, _page_size)
+        # Signals held back by batch(), per thread
+        self._batch = threading.local()
+        self._breadcrumbs: OrderedDict[str, Tuple[PageBreadcrumb, ...]] = OrderedDict()
+        # Pages waiting to be prefetched, only touched on the main thread
+        self._prefetch_queue: deque[str] = deque()
+        self._prefetch_workspace: Optional[str] = None
+        self._prefetch_spent = 0
+        self._prefetch_running = False
         logger.debug(
             "PageService initialized with database at {}", database.database_path
         )
@@ -60,6 +149,107 @@ class PageService(GObject.Object):
             cls._service = cls(database=get_database_manager())
         return cls._service
 
+    def _emit(self, signal_name: str, *args):
+        """
+        Emit a signal on the main thread.
+
+        Service methods may run on the database worker thread, while signal
+        handlers are expected to run where the widgets live. Inside batch()
+        signals are collected and emitted when the batch commits.
+        """
+        signals = getattr(self._batch, "signals", None)
+        if signals is not None:
+            signals.append((signal_name, args))
+            return
+
+        if threading.current_thread() is threading.main_thread():
+            self.emit(signal_name, *args)
+        else:
+            GLib.idle_add(self._emit_idle, signal_name, args)
+
+    def _emit_idle(self, signal_name: str, args: tuple) -> bool:
+        self.emit(signal_name, *args)
+        return GLib.SOURCE_REMOVE
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group page operations into one transaction and one notification burst.
+
+        Everything called inside the block commits together and is rolled
+        back when the block raises. Signals are held back until the commit:
+        tree deltas are merged into one page-tree-delta per workspace,
+        page-tree-changed fires once per workspace and page-updated once per
+        page. Nested batches join the outer one. Like every transaction, a
+        batch runs on the database worker thread.
+
+        Example:
+            def create_pages():
+                with page_service.batch():
+                    for title in titles:
+                        page_service.create_page(workspace_id, title)
+
+            database.submit(create_pages)
+        """
+        if getattr(self._batch, "signals", None) is not None:
+            yield
+            return
+
+        signals: List[Tuple[str, tuple]] = []
+        self._batch.signals = signals
+        try:
+            with self._database.transaction():
+                yield
+        except BaseException:
+            self._batch.signals = None
+            self._forget_batch(signals)
+            raise
+
+        self._batch.signals = None
+        self._emit_batch(signals)
+
+    def _emit_batch(self, signals: List[Tuple[str, tuple]]):
+        deltas: Dict[str, List[PageTreeChange]] = {}
+        deleted: Dict[str, List[str]] = {}
+        changed_workspaces: Dict[str, None] = {}
+        updated_pages = set()
+        for signal_name, args in signals:
+            match signal_name:
+                case "page-tree-delta":
+                    workspace_id, changes = args
+                    deltas.setdefault(workspace_id, []).extend(changes)
+                case "pages-deleted":
+                    workspace_id, page_ids = args
+                    deleted.setdefault(workspace_id, []).extend(page_ids)
+                case "page-tree-changed":
+                    changed_workspaces[args[0]] = None
+                case "page-updated":
+                    if args[0].id not in updated_pages:
+                        updated_pages.add(args[0].id)
+                        self._emit(signal_name, *args)
+                case _:
+                    self._emit(signal_name, *args)
+
+        for workspace_id, changes in deltas.items():
+            self._emit_tree_delta(workspace_id, changes)
+        for workspace_id, page_ids in deleted.items():
+            self._emit("pages-deleted", workspace_id, page_ids)
+        for workspace_id in changed_workspaces:
+            self._emit("page-tree-changed", workspace_id)
+
+    def _forget_batch(self, signals: List[Tuple[str, tuple]]):
+        """Drop cached state a rolled back batch may have changed."""
+        page_ids = set()
+        for signal_name, args in signals:
+            if signal_name == "page-tree-delta":
+                page_ids.update(change.page.id for change in args[1])
+            elif signal_name == "pages-deleted":
+                page_ids.update(args[1])
+            elif args and isinstance(args[0], Page):
+                page_ids.add(args[0].id)
+        self._pages.discard_many(page_ids)
+        self._breadcrumbs.clear()
+
     # CRUD Operations
 
     def create_page(
@@ -94,23 +284,41 @@ class PageService(GObject.Object):
             cover=cover,
             repository=self._database.repository,
         )
-        page.save_sync()
-        self.emit("page-created", page)
-        self.emit("page-tree-changed", workspace_id)
+        self._database.write_queue.flush_logged()
+        self._database.run_in_adapter(functools.partial(self._insert_page, page))
+        self._pages.put(page.id, page)
+        self._emit("page-created", page)
+        self._emit_tree_delta(
+            workspace_id,
+            [
+                PageTreeChange(
+                    PageTreeChangeKind.INSERTED,
+                    page,
+                    parent_page_id,
+                    self._get_tree_position(page),
+                )
+            ],
+        )
+        self._emit("page-tree-changed", workspace_id)
         return page
 
     def get_page(self, page_id: str) -> Optional[Page]:
         """
         Get page by ID.
 
+        Pages already in memory are returned without a query.
+
         Args:
             page_id: Page ID
 
         Returns:
             Page or None if not found
         """
+        if page := self._pages.get(page_id):
+            return page
+
         _filter = Gom.Filter.new_eq(Page, "id", page_id)
-        return self._database.repository.find_one_sync(Page, _filter)
+        return self._remember(self._database.repository.find_one_sync(Page, _filter))
 
     def get_page_by_title(self, workspace_id: str, title: str) -> Optional[Page]:
         """
@@ -126,7 +334,9 @@ class PageService(GObject.Object):
         title_filter = Gom.Filter.new_eq(Page, "title", title)
         workspace_filter = Gom.Filter.new_eq(Page, "workspace_id", workspace_id)
         combined_filter = Gom.Filter.new_and(title_filter, workspace_filter)
-        return self._database.repository.find_one_sync(Page, combined_filter)
+        return self._remember(
+            self._database.repository.find_one_sync(Page, combined_filter)
+        )
 
     def update_page(
         self,
@@ -136,6 +346,7 @@ class PageService(GObject.Object):
         tag_table: str = None,
         icon: str = None,
         cover: str = None,
+        content: GLib.Bytes = None,
     ) -> Optional[Page]:
         """
         Update page content.
@@ -144,9 +355,10 @@ class PageService(GObject.Object):
             page_id: Page ID
             title: New title (optional)
             text: New text content (optional)
-            tag_table: Tag table in bytes
+            tag_table: Legacy JSON tag table (optional)
             icon: New icon (optional)
             cover: New cover (optional)
+            content: Binary tag table, replaces tag_table (optional)
 
         Returns:
             Updated page or None if not found
@@ -155,6 +367,13 @@ class PageService(GObject.Object):
         if not page:
             return None
 
+        retitled = (title is not None and title != page.title) or (
+            icon is not None and icon != page.icon
+        )
+        body_changed = (
+            text is not None or tag_table is not None or content is not None
+        )
+
         if title is not None:
             page.title = title
         if text is not None:
@@ -165,21 +384,208 @@ class PageService(GObject.Object):
             page.cover = cover
         if tag_table is not None:
             page.tag_table = tag_table
+        if content is not None:
+            page.content = content
+            page.tag_table = None
+
+        page.update_content(title, text, page.tag_table)
+        self._save_later(page)
+        if body_changed:
+            # Re-estimate the size of the edited body
+            self._pages.put(page.id, page)
+        self._emit("page-updated", page)
+        if retitled:
+            self._invalidate_breadcrumbs(page_id)
+            self._emit_tree_delta(
+                page.workspace_id,
+                [
+                    PageTreeChange(
+                        PageTreeChangeKind.RETITLED,
+                        page,
+                        page.parent_page_id,
+                        self._get_tree_position(page),
+                    )
+                ],
+            )
+        return page
+
+    def _remember(self, page: Optional[Page]) -> Optional[Page]:
+        """
+        Swap a page loaded by Gom for its live object.
+
+        Pages seen for the first time get their body loaded and are added
+        to the identity map.
+
+        Args:
+            page: Page loaded by Gom, or None
 
-        page.update_content(title, text, tag_table)
-        page.save_sync()
-        self.emit("page-updated", page)
+        Returns:
+            The live page, or None
+        """
+        if page is None:
+            return None
+        if live := self._pages.get(page.id):
+            return live
+        return self._pages.put(page.id, self._load_body(page))
+
+    def _share(self, pages) -> List[Page]:
+        """Replace listed pages with the live objects already in memory."""
+        return self._pages.share(pages, lambda page: page.id)
+
+    def _load_body(self, page: Optional[Page]) -> Optional[Page]:
+        """
+        Read the text, content and tag table of a page from page_contents.
+
+        Args:
+            page: Page loaded by Gom, or None
+
+        Returns:
+            The same page
+        """
+        if page is None:
+            return None
+
+        rows = self._database.query(
+            "SELECT text, content, tag_table FROM page_contents WHERE page_id = ?",
+            (page.id,),
+            columns=(str, GLib.Bytes, str),
+        )
+        if rows:
+            page.load_body(*rows[0])
+            if page.content is None and page.tag_table:
+                self._migrate_tag_table(page)
         return page
 
-    def delete_page(self, page_id: str) -> bool:
+    def _migrate_tag_table(self, page: Page):
+        """
+        Convert the JSON tag table of a page to the binary format.
+
+        Pages are migrated one by one as they are opened, the write goes
+        through the write queue like any other edit.
+
+        Args:
+            page: Page with a JSON tag table and no binary content
+        """
+        try:
+            tag_ranges = page.get_tag_ranges()
+        except ValueError as e:
+            logger.warning("Cannot migrate tag table of page {}: {}", page.id, e)
+            return
+
+        page.load_body(
+            page.text, GLib.Bytes.new(encode_tag_table(tag_ranges)), None
+        )
+        page.mark_changed("content", "tag_table")
+        self._save_later(page)
+        logger.debug("Migrated tag table of page {}", page.id)
+
+    @classmethod
+    def _insert_page(cls, page: Page, adapter: Gom.Adapter):
+        # Raw statements rather than save_sync(), which opens its own
+        # transaction and cannot run inside batch()
+        execute_sql(
+            adapter,
+            """
+            INSERT INTO pages (
+                id, "workspace-id", title, icon, cover, "parent-page-id",
+                "created-at", "updated-at", "last-accessed", "is-favorite",
+                "is-archived", "is-published", "sort-order"
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                page.id,
+                page.workspace_id,
+                page.title,
+                page.icon,
+                page.cover,
+                page.parent_page_id,
+                page.created_at,
+                page.updated_at,
+                page.last_accessed,
+                page.is_favorite,
+                page.is_archived,
+                page.is_published,
+                page.sort_order,
+            ),
+        )
+        cls._write_body(
+            adapter,
+            page.id,
+            {column: getattr(page, name) for name, column in PAGE_BODY_COLUMNS.items()},
+        )
+        # The new row holds every property
+        page.take_changes()
+
+    def _save_later(self, page: Page):
+        """
+        Queue a page for the next grouped write.
+
+        Repeated saves of the same page before the flush are merged. The
+        queued write stores the properties changed by the time it runs,
+        and nothing at all if none were.
+
+        Args:
+            page: Live page from the identity map
+        """
+        self._database.write_queue.enqueue(
+            ("pages", page.id), functools.partial(self._write_changes, page)
+        )
+
+    @classmethod
+    def _write_changes(cls, page: Page, adapter: Gom.Adapter):
+        changes = page.take_changes()
+        if not changes:
+            logger.debug("Page {} is unchanged, skipping write", page.id)
+            return
+
+        try:
+            if columns := {
+                column: getattr(page, name)
+                for name, column in PAGE_COLUMNS.items()
+                if name in changes
+            }:
+                update_row(adapter, "pages", page.id, columns)
+            if body := {
+                column: getattr(page, name)
+                for name, column in PAGE_BODY_COLUMNS.items()
+                if name in changes
+            }:
+                cls._write_body(adapter, page.id, body)
+        except Exception:
+            # Written again with the next save
+            page.mark_changed(*changes)
+            raise
+        return functools.partial(page.mark_changed, *changes)
+
+    @staticmethod
+    def _write_body(adapter: Gom.Adapter, page_id: str, values: Dict[str, object]):
+        columns = ", ".join(values)
+        placeholders = ", ".join("?" for _ in values)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in values)
+        execute_sql(
+            adapter,
+            f"""
+            INSERT INTO page_contents (page_id, {columns})
+            VALUES (?, {placeholders})
+            ON CONFLICT (page_id) DO UPDATE SET {updates}
+            """,
+            (page_id, *values.values()),
+        )
+
+    def delete_page(self, page_id: str) -> List[str]:
         """
         Delete a page and all its children.
 
+        The subtree is deleted with a single statement over the closure
+        table, in one transaction. Listeners get one pages-deleted signal
+        with every deleted ID and one page-tree-delta removing the page.
+
         Args:
             page_id: Page ID to delete
 
         Returns:
-            True if successful, False otherwise
+            IDs of the deleted pages, the page itself first; empty if
+            nothing was deleted
         """
         logger.debug("delete_page({})", page_id)
         try:
@@ -187,23 +593,91 @@ class PageService(GObject.Object):
         except GLib.Error as e:
             logger.error("Error: ", e.domain)
             logger.error(e)
-            return False
+            return []
 
-        if page:
-            workspace_id = page.workspace_id
+        if not page:
+            return []
+
+        workspace_id = page.workspace_id
+        logger.debug("Found page to delete: {}", page)
+        position = self._get_tree_position(page)
+        try:
+            with self._database.transaction():
+                rows = self._database.query(
+                    """
+                    SELECT descendant_id FROM page_closure WHERE ancestor_id = ?
+                    """,
+                    (page_id,),
+                )
+                self._database.execute(
+                    """
+                    DELETE FROM pages WHERE id IN (
+                        SELECT descendant_id FROM page_closure WHERE ancestor_id = ?
+                    )
+                    """,
+                    (page_id,),
+                )
+            # The page itself first, the order of the rest does not matter
+            deleted = [row[0] for row in rows]
+            deleted.sort(key=lambda row_id: row_id != page_id)
+        except GLib.Error as e:
+            logger.error("Error: ", e.domain)
+            logger.error(e)
+            deleted = []
+
+        self._invalidate_breadcrumbs(page_id)
+        if deleted:
+            self._forget_pages(deleted)
+            self._emit("pages-deleted", workspace_id, deleted)
+            self._emit_tree_delta(
+                workspace_id,
+                [
+                    PageTreeChange(
+                        PageTreeChangeKind.REMOVED,
+                        page,
+                        page.parent_page_id,
+                        position,
+                    )
+                ],
+            )
+        return deleted
 
-            # First delete all child pages recursively
-            children = self.get_child_pages(page_id)
-            for child in children:
-                self.delete_page(child.id)
+    def delete_workspace_pages(self, workspace_id: str) -> List[str]:
+        """
+        Delete every page of a workspace with a single statement.
 
-            logger.debug("Found page to delete: {}", page)
-            result = page.delete_sync()
-            self.emit("page-deleted", page, result)
-            self.emit("page-tree-changed", workspace_id)
-            return result
+        Meant to run inside batch() together with the deletion of the
+        workspace row, see WorkspaceService.delete_workspace().
 
-        return False
+        Args:
+            workspace_id: Workspace ID
+
+        Returns:
+            IDs of the deleted pages
+        """
+        logger.debug("delete_workspace_pages({})", workspace_id)
+        with self._database.transaction():
+            rows = self._database.query(
+                'SELECT id FROM pages WHERE "workspace-id" = ?', (workspace_id,)
+            )
+            self._database.execute(
+                'DELETE FROM pages WHERE "workspace-id" = ?', (workspace_id,)
+            )
+        deleted = [row[0] for row in rows]
+
+        if deleted:
+            self._forget_pages(deleted)
+            self._emit("pages-deleted", workspace_id, deleted)
+        return deleted
+
+    def _forget_pages(self, page_ids: List[str]):
+        """Drop deleted pages from the caches, queued writes and access times."""
+        self._pages.discard_many(page_ids)
+        # A queued body write would bring back the deleted page_contents row
+        self._database.write_queue.discard(("pages", page_id) for page_id in page_ids)
+        self._database.access_tracker.discard("pages", page_ids)
+        for page_id in page_ids:
+            self._breadcrumbs.pop(page_id, None)
 
     # Tree Structure Operations
 
@@ -211,6 +685,8 @@ class PageService(GObject.Object):
         """
         Get all pages in a workspace.
 
+        Page bodies are not loaded, use get_page() to read them.
+
         Args:
             workspace_id: Workspace ID
 
@@ -224,7 +700,7 @@ class PageService(GObject.Object):
         )
         count = len(group)
         group.fetch_sync(0, count)
-        return list(group)
+        return self._share(group)
 
     def get_root_pages(self, workspace_id: str) -> List[Page]:
         """
@@ -246,7 +722,7 @@ class PageService(GObject.Object):
         )
         count = len(group)
         group.fetch_sync(0, count)
-        return list(group)
+        return self._share(group)
 
     def get_child_pages(self, parent_page_id: str) -> List[Page]:
         """
@@ -264,7 +740,56 @@ class PageService(GObject.Object):
         group = self._database.repository.find_sorted_sync(Page, parent_filter, sorting)
         count = len(group)
         group.fetch_sync(0, count)
-        return list(group)
+        return self._share(group)
+
+    def get_workspace_page_summaries(self, workspace_id: str) -> List[PageSummary]:
+        """
+        Get the metadata of all pages in a workspace.
+
+        Unlike get_workspace_pages(), the text, content and tag table
+        columns are not read.
+
+        Args:
+            workspace_id: Workspace ID
+
+        Returns:
+            List of page summaries sorted by sort order
+        """
+        return self._query_summaries('"workspace-id" = ?', (workspace_id,))
+
+    def get_root_page_summaries(self, workspace_id: str) -> List[PageSummary]:
+        """
+        Get the metadata of root pages in a workspace.
+
+        Args:
+            workspace_id: Workspace ID
+
+        Returns:
+            List of root page summaries sorted by sort order
+        """
+        return self._query_summaries(
+            '"workspace-id" = ? AND "parent-page-id" IS NULL', (workspace_id,)
+        )
+
+    def get_child_page_summaries(self, parent_page_id: str) -> List[PageSummary]:
+        """
+        Get the metadata of direct child pages of a parent page.
+
+        Args:
+            parent_page_id: Parent page ID
+
+        Returns:
+            List of child page summaries sorted by sort order
+        """
+        return self._query_summaries('"parent-page-id" = ?', (parent_page_id,))
+
+    def _query_summaries(self, where: str, params: tuple) -> List[PageSummary]:
+        rows = self._database.query(
+            PAGE_SUMMARY_QUERY.format(where=where),
+            params,
+            columns=(str, str, str, str, str, int, bool, bool),
+        )
+        return [PageSummary(*row) for row in rows]
 
     def get_page_tree(self, workspace_id: str) -> List[PageNode]:
         """
@@ -274,33 +799,24 @@ class PageService(GObject.Object):
             workspace_id: Workspace ID
 
         Returns:
-            List of root PageNode objects with children populated
+            List of root PageNode objects holding page summaries
         """
-        # Get all pages in the workspace
-        all_pages = self.get_workspace_pages(workspace_id)
+        return PageNode.build_tree(self.get_workspace_page_summaries(workspace_id))
 
-        # Create a map of page_id -> PageNode
-        node_map: Dict[str, PageNode] = {}
-        for page in all_pages:
-            node_map[page.id] = PageNode(page)
-
-        # Build the tree structure
-        root_nodes = []
-        for page in all_pages:
-            node = node_map[page.id]
+    def get_page_tree_index(self, workspace_id: str) -> PageTreeIndex:
+        """
+        Get the page hierarchy of a workspace as a compact index.
 
-            if page.parent_page_id and page.parent_page_id in node_map:
-                # This page has a parent, add it as a child
-                parent_node = node_map[page.parent_page_id]
-                parent_node.add_child(node)
-            else:
-                # This is a root page
-                root_nodes.append(node)
+        Only page summaries are read and no Page objects are created, so
+        this scales to very large workspaces.
 
-        # Sort root nodes by sort_order and title
-        root_nodes.sort(key=lambda x: (x.page.sort_order, x.page.title))
+        Args:
+            workspace_id: Workspace ID
 
-        return root_nodes
+        Returns:
+            PageTreeIndex of the workspace pages
+        """
+        return PageTreeIndex.build(self.get_workspace_page_summaries(workspace_id))
 
     def get_page_ancestors(self, page_id: str) -> List[Page]:
         """
@@ -312,23 +828,65 @@ class PageService(GObject.Object):
         Returns:
             List of ancestor pages from root to immediate parent
         """
-        page = self.get_page(page_id)
-        if not page:
+        ancestor_ids = [crumb.page_id for crumb in self.get_page_breadcrumbs(page_id)]
+        if not ancestor_ids:
             return []
 
-        ancestors = []
-        current_page = page
+        _filter = Gom.Filter.new_eq(Page, "id", ancestor_ids[0])
+        for ancestor_id in ancestor_ids[1:]:
+            _filter = Gom.Filter.new_or(
+                _filter, Gom.Filter.new_eq(Page, "id", ancestor_id)
+            )
+        group = self._database.repository.find_sync(Page, _filter)
+        count = len(group)
+        group.fetch_sync(0, count)
+
+        pages = {page.id: page for page in self._share(group)}
+        return [pages[key] for key in ancestor_ids if key in pages]
+
+    def get_page_breadcrumbs(self, page_id: str) -> Tuple[PageBreadcrumb, ...]:
+        """
+        Get the breadcrumb path of a page.
+
+        The whole chain comes from a single closure table query and is
+        cached until one of its pages is moved, renamed or deleted.
 
-        # Get parent chain
-        while current_page and current_page.parent_page_id:
-            parent = self.get_page(current_page.parent_page_id)
-            if parent:
-                ancestors.insert(0, parent)  # Insert at beginning for correct order
-                current_page = parent
-            else:
-                break
+        Args:
+            page_id: Page ID
 
-        return ancestors
+        Returns:
+            Breadcrumbs from root to immediate parent
+        """
+        if (breadcrumbs := self._breadcrumbs.get(page_id)) is not None:
+            self._breadcrumbs.move_to_end(page_id)
+            return breadcrumbs
+
+        rows = self._database.query(
+            """
+            SELECT p.id, p.title, p.icon
+            FROM page_closure AS c
+            JOIN pages AS p ON p.id = c.ancestor_id
+            WHERE c.descendant_id = ? AND c.depth > 0
+            ORDER BY c.depth DESC
+            """,
+            (page_id,),
+        )
+        breadcrumbs = tuple(PageBreadcrumb(*row) for row in rows)
+
+        self._breadcrumbs[page_id] = breadcrumbs
+        if len(self._breadcrumbs) > BREADCRUMB_CACHE_SIZE:
+            self._breadcrumbs.popitem(last=False)
+        return breadcrumbs
+
+    def _invalidate_breadcrumbs(self, page_id: str):
+        """Forget cached breadcrumbs of a page and of every path through it."""
+        stale = [
+            key
+            for key, breadcrumbs in self._breadcrumbs.items()
+            if key == page_id or any(crumb.page_id == page_id for crumb in breadcrumbs)
+        ]
+        for key in stale:
+            del self._breadcrumbs[key]
 
     def move_page(self, page_id: str, new_parent_id: Optional[str]) -> bool:
         """
@@ -346,19 +904,34 @@ class PageService(GObject.Object):
             return False
 
         # Prevent moving a page to be a child of itself or its descendants
-        if new_parent_id and self._is_descendant(new_parent_id, page_id):
+        if new_parent_id and self._is_descendant(page_id, new_parent_id):
             logger.warning(
                 "Cannot move page {} to its descendant {}", page_id, new_parent_id
             )
             return False
 
         old_parent_id = page.parent_page_id
+        old_position = self._get_tree_position(page)
         page.parent_page_id = new_parent_id
         page.update_access_time()
-        page.save_sync()
-
-        self.emit("page-moved", page, old_parent_id or "", new_parent_id or "")
-        self.emit("page-tree-changed", page.workspace_id)
+        self._save_later(page)
+        self._invalidate_breadcrumbs(page_id)
+
+        self._emit("page-moved", page, old_parent_id or "", new_parent_id or "")
+        self._emit_tree_delta(
+            page.workspace_id,
+            [
+                PageTreeChange(
+                    PageTreeChangeKind.MOVED,
+                    page,
+                    new_parent_id,
+                    self._get_tree_position(page),
+                    old_parent_id,
+                    old_position,
+                )
+            ],
+        )
+        self._emit("page-tree-changed", page.workspace_id)
         return True
 
     def _is_descendant(self, potential_ancestor_id: str, page_id: str) -> bool:
@@ -370,30 +943,43 @@ class PageService(GObject.Object):
             page_id: ID of the page to check
 
         Returns:
-            True if page_id is a descendant of potential_ancestor_id
+            True if page_id is potential_ancestor_id or one of its descendants
         """
-        descendants = self._get_all_descendants(potential_ancestor_id)
-        return page_id in descendants
+        rows = self._database.query(
+            "SELECT 1 FROM page_closure WHERE ancestor_id = ? AND descendant_id = ?",
+            (potential_ancestor_id, page_id),
+        )
+        return bool(rows)
 
-    def _get_all_descendants(self, page_id: str) -> set:
+    def _get_tree_position(self, page: Page) -> int:
         """
-        Get all descendant page IDs for a given page.
+        Get the index of a page among its siblings in tree order.
 
         Args:
-            page_id: Page ID
+            page: Page as currently stored
 
         Returns:
-            Set of descendant page IDs
+            Number of siblings sorted before the page
         """
-        descendants = set()
-        children = self.get_child_pages(page_id)
-
-        for child in children:
-            descendants.add(child.id)
-            # Recursively get descendants
-            descendants.update(self._get_all_descendants(child.id))
+        rows = self._database.query(
+            """
+            SELECT COUNT(*) FROM pages
+            WHERE "workspace-id" = ? AND "parent-page-id" IS ? AND id != ?
+            AND ("sort-order", title) < (?, ?)
+            """,
+            (
+                page.workspace_id,
+                page.parent_page_id,
+                page.id,
+                page.sort_order,
+                page.title,
+            ),
+            columns=(int,),
+        )
+        return rows[0][0] if rows else 0
 
-        return descendants
+    def _emit_tree_delta(self, workspace_id: str, changes: List[PageTreeChange]):
+        self._emit("page-tree-delta", workspace_id, changes)
 
     # Utility Methods
 
@@ -417,12 +1003,15 @@ class PageService(GObject.Object):
         )
         count = len(group)
         group.fetch_sync(0, count)
-        return list(group)
+        return self._share(group)
 
     def get_recent_pages(self, workspace_id: str, limit: int = 10) -> List[Page]:
         """
         Get recently accessed pages in a workspace.
 
+        Access times not yet written by the access tracker are taken into
+        account.
+
         Args:
             workspace_id: Workspace ID
             limit: Maximum number of pages to return
@@ -440,32 +1029,208 @@ class PageService(GObject.Object):
         )
         count = min(len(group), limit)
         group.fetch_sync(0, count)
-        return list(group)[:limit]
+        pages = {page.id: page for page in self._share(group)[:limit]}
+
+        # Pages opened since the last flush may not be in the stored top
+        accessed = self._database.access_tracker.pending("pages")
+        for page_id in accessed.keys() - pages.keys():
+            page = self.get_page(page_id)
+            if page and page.workspace_id == workspace_id and not page.is_archived:
+                pages[page_id] = page
+
+        def last_accessed(page: Page) -> int:
+            return max(page.last_accessed, accessed.get(page.id, 0))
 
-    def search_pages(self, workspace_id: str, query: str) -> List[Page]:
+        return sorted(pages.values(), key=last_accessed, reverse=True)[:limit]
+
+    def record_access(self, page: Page):
+        """
+        Record that a page was opened.
+
+        The access time is kept in memory and written in the next batch of
+        the access tracker, not with the page row, so the page does not
+        record it as a change.
+
+        Must be called on the main thread.
+
+        Args:
+            page: Opened page
+        """
+        timestamp = self._database.access_tracker.touch("pages", page.id)
+        page.set_untracked("last_accessed", timestamp)
+
+    def prefetch(self, page_ids: Sequence[str], workspace_id: Optional[str] = None):
+        """
+        Load pages the user is likely to open next into the page cache.
+
+        Pages are loaded one at a time: each load is handed to the database
+        worker from a low priority idle callback once the previous one has
+        finished, so prefetching never holds up more than one user request.
+        Their tag tables are decoded too. A new call replaces the pages
+        still waiting, and a round stops after loading PREFETCH_BUDGET
+        bytes of pages.
+
+        Must be called on the main thread.
+
+        Args:
+            page_ids: Pages to load, most likely first
+            workspace_id: Also load the most recent pages of this workspace
+        """
+        self._prefetch_queue = deque(page_ids)
+        self._prefetch_workspace = workspace_id
+        self._prefetch_spent = 0
+        if not self._prefetch_running:
+            self._prefetch_running = True
+            GLib.idle_add(self._on_prefetch_idle, priority=GLib.PRIORITY_LOW)
+
+    def _on_prefetch_idle(self) -> bool:
+        queue = self._prefetch_queue
+        if workspace_id := self._prefetch_workspace:
+            self._prefetch_workspace = None
+            self._prefetch_step(
+                self._recent_page_ids, workspace_id, on_done=queue.extend
+            )
+            return GLib.SOURCE_REMOVE
+
+        # Pages in memory already need no trip to the worker
+        while queue and self._pages.get(queue[0]):
+            queue.popleft()
+        if queue and self._prefetch_spent < PREFETCH_BUDGET:
+            self._prefetch_step(
+                self._prefetch_page, queue.popleft(), on_done=self._on_page_prefetched
+            )
+        else:
+            self._prefetch_running = False
+        return GLib.SOURCE_REMOVE
+
+    def _prefetch_step(self, func: Callable, arg: str, on_done: Callable):
+        def on_result(future: Future):
+            GLib.idle_add(self._on_prefetch_done, future, on_done)
+
+        self._database.submit(func, arg).add_done_callback(on_result)
+
+    def _on_prefetch_done(self, future: Future, on_done: Callable) -> bool:
+        try:
+            on_done(future.result())
+        except Exception as e:
+            logger.warning("Page prefetch failed: {}", e)
+        GLib.idle_add(self._on_prefetch_idle, priority=GLib.PRIORITY_LOW)
+        return GLib.SOURCE_REMOVE
+
+    def _on_page_prefetched(self, size: int):
+        self._prefetch_spent += size
+
+    def _prefetch_page(self, page_id: str) -> int:
+        """
+        Load a page and decode its tag table.
+
+        Returns:
+            Estimated size of the page in bytes
+        """
+        page = self.get_page(page_id)
+        if page is None:
+            return 0
+        try:
+            page.get_tag_ranges()
+        except ValueError as e:
+            logger.warning("Cannot decode tag table of page {}: {}", page_id, e)
+        return _page_size(page)
+
+    def _recent_page_ids(self, workspace_id: str) -> List[str]:
+        """
+        Get the IDs of the recently accessed pages in a workspace.
+
+        Like get_recent_pages(), access times not yet written by the access
+        tracker are taken into account, but no page is loaded.
+
+        Returns:
+            Page IDs, most recent first
+        """
+        rows = self._database.query(
+            """
+            SELECT id, "last-accessed" FROM pages
+            WHERE "workspace-id" = ? AND "is-archived" = 0
+            ORDER BY "last-accessed" DESC
+            LIMIT ?
+            """,
+            (workspace_id, PREFETCH_RECENT_PAGES),
+            columns=(str, int),
+        )
+        last_accessed = dict(rows)
+
+        # Pages opened since the last flush may not be in the stored top
+        accessed = self._database.access_tracker.pending("pages")
+        if unstored := list(accessed.keys() - last_accessed.keys()):
+            placeholders = ", ".join("?" * len(unstored))
+            rows = self._database.query(
+                f"""
+                SELECT id, "last-accessed" FROM pages
+                WHERE id IN ({placeholders})
+                  AND "workspace-id" = ? AND "is-archived" = 0
+                """,
+                (*unstored, workspace_id),
+                columns=(str, int),
+            )
+            last_accessed.update(rows)
+
+        def recency(page_id: str) -> int:
+            return max(last_accessed[page_id], accessed.get(page_id, 0))
+
+        recent = sorted(last_accessed, key=recency, reverse=True)
+        return recent[:PREFETCH_RECENT_PAGES]
+
+    def search_pages(
+        self, workspace_id: str, query: str, limit: int = SEARCH_RESULTS_LIMIT
+    ) -> List[PageSearchResult]:
         """
         Search pages by title and content in a workspace.
 
+        Every word of the query is matched as a prefix, so results update
+        while the user is still typing. Title matches rank higher than
+        matches in the page text.
+
         Args:
             workspace_id: Workspace ID
             query: Search query
+            limit: Maximum number of results
 
         Returns:
-            List of matching pages
+            List of search results, best match first
         """
-        # This is a simple implementation. For better search,
-        # you might want to use full-text search capabilities
-        all_pages = self.get_workspace_pages(workspace_id)
-        query_lower = query.lower()
+        match = self._build_match_query(query)
+        if not match:
+            return []
+
+        rows = self._database.query(
+            f"""
+            SELECT p.id, p.title, p.icon,
+                   snippet(pages_fts, -1, ?, ?, '…', {SEARCH_SNIPPET_TOKENS}),
+                   bm25(pages_fts, 10.0, 1.0) AS rank
+            FROM pages_fts
+            JOIN page_contents AS c ON c.doc_id = pages_fts.rowid
+            JOIN pages AS p ON p.id = c.page_id
+            WHERE pages_fts MATCH ? AND p."workspace-id" = ?
+            ORDER BY rank
+            LIMIT ?
+            """,
+            (SNIPPET_MATCH_START, SNIPPET_MATCH_END, match, workspace_id, limit),
+            columns=(str, str, str, str, float),
+        )
+        return [PageSearchResult(*row) for row in rows]
 
-        matching_pages = []
-        for page in all_pages:
-            if query_lower in page.title.lower() or (
-                page.text and query_lower in page.text.lower()
-            ):
-                matching_pages.append(page)
+    @staticmethod
+    def _build_match_query(query: str) -> str:
+        """
+        Turn free text into an FTS5 MATCH expression.
 
-        return matching_pages
+        Each word is quoted, so FTS5 operators typed by the user are searched
+        literally, and marked as a prefix term.
+        """
+        terms = []
+        for word in query.split():
+            word = word.replace('"', '""')
+            terms.append(f'"{word}"*')
+        return " ".join(terms)
 
     def toggle_page_favorite(self, page_id: str) -> Optional[Page]:
         """
@@ -480,8 +1245,8 @@ class PageService(GObject.Object):
         page = self.get_page(page_id)
         if page:
             page.toggle_favorite()
-            page.save_sync()
-            self.emit("page-updated", page)
+            self._save_later(page)
+            self._emit("page-updated", page)
             return page
         return None
 
@@ -498,8 +1263,8 @@ class PageService(GObject.Object):
         page = self.get_page(page_id)
         if page:
             page.archive()
-            page.save_sync()
-            self.emit("page-updated", page)
+            self._save_later(page)
+            self._emit("page-updated", page)
             return page
         return None
 
@@ -516,7 +1281,68 @@ class PageService(GObject.Object):
         page = self.get_page(page_id)
         if page:
             page.unarchive()
-            page.save_sync()
-            self.emit("page-updated", page)
+            self._save_later(page)
+            self._emit("page-updated", page)
             return page
         return None
+
+    # Async API
+    #
+    # These methods run the blocking calls above on the database worker thread
+    # and return futures, so they can be awaited on the GLib event loop or
+    # scheduled without waiting for the result.
+
+    def create_page_async(
+        self,
+        workspace_id: str,
+        title: str,
+        text: str = "",
+        parent_page_id: str = None,
+        icon: str = None,
+        cover: str = None,
+    ) -> asyncio.Future:
+        return self._database.run_async(
+            self.create_page, workspace_id, title, text, parent_page_id, icon, cover
+        )
+
+    def get_page_async(self, page_id: str) -> asyncio.Future:
+        return self._database.run_async(self.get_page, page_id)
+
+    def update_page_async(
+        self,
+        page_id: str,
+        title: str = None,
+        text: str = None,
+        tag_table: str = None,
+        icon: str = None,
+        cover: str = None,
+        content: GLib.Bytes = None,
+    ) -> asyncio.Future:
+        return self._database.run_async(
+            self.update_page, page_id, title, text, tag_table, icon, cover, content
+        )
+
+    def delete_page_async(self, page_id: str) -> asyncio.Future:
+        return self._database.run_async(self.delete_page, page_id)
+
+    def move_page_async(
+        self, page_id: str, new_parent_id: Optional[str]
+    ) -> asyncio.Future:
+        return self._database.run_async(self.move_page, page_id, new_parent_id)
+
+    def get_workspace_page_summaries_async(self, workspace_id: str) -> asyncio.Future:
+        return self._database.run_async(self.get_workspace_page_summaries, workspace_id)
+
+    def get_page_tree_async(self, workspace_id: str) -> asyncio.Future:
+        return self._database.run_async(self.get_page_tree, workspace_id)
+
+    def get_page_tree_index_async(self, workspace_id: str) -> asyncio.Future:
+        return self._database.run_async(self.get_page_tree_index, workspace_id)
+
+    def get_page_breadcrumbs_async(self, page_id: str) -> asyncio.Future:
+        return self._database.run_async(self.get_page_breadcrumbs, page_id)
+
+    def search_pages_async(
+        self, workspace_id: str, query: str, limit: int = SEARCH_RESULTS_LIMIT
+    ) -> asyncio.Future:
+        return self._database.run_async(self.search_pages, workspace_id, query, limit)
@@ -21,18 +21,55 @@
 # SOFTWARE.
 #
 # SPDX-License-Identifier: MIT
+import asyncio
 import datetime
-from typing import Optional, Self
+import functools
+import threading
+from typing import List, Optional, Self
 
 from gi.repository import GLib, GObject, Gom
 from loguru import logger
 
-from norka.models import DatabaseManager, Workspace, get_database_manager
+from norka.models import (
+    DatabaseManager,
+    ResourceListModel,
+    Workspace,
+    get_database_manager,
+)
+from norka.models.database import update_row
+from norka.services.identity_map import IdentityMap
+from norka.services.page_service import PageService
+
+# Memory budget of the live workspace objects kept by WorkspaceService, in bytes
+WORKSPACE_CACHE_BUDGET = 1024 * 1024
+# Rough per-object overhead of a Workspace GObject and its GValues
+WORKSPACE_BASE_SIZE = 1024
+# Workspace properties stored in the workspaces table, by column
+WORKSPACE_COLUMNS = {
+    "name": "name",
+    "description": "description",
+    "path": "path",
+    "icon": "icon",
+    "cover": "cover",
+    "updated_at": "updated-at",
+    "last_accessed": "last-accessed",
+    "is_active": "is-active",
+    "is_favorite": "is-favorite",
+}
 
 # Global database manager instance
 _db_manager: DatabaseManager | None = None
 
 
+def _workspace_size(workspace: Workspace) -> int:
+    return (
+        WORKSPACE_BASE_SIZE
+        + len(workspace.name or "")
+        + len(workspace.description or "")
+        + len(workspace.path or "")
+    )
+
+
 class WorkspaceService(GObject.Object):
     __gtype_name__ = "WorkspaceService"
 
@@ -45,9 +82,18 @@ class WorkspaceService(GObject.Object):
         "workspace-activated": (GObject.SIGNAL_RUN_FIRST, None, (Workspace,)),
     }
 
-    def __init__(self, database: DatabaseManager, **kwargs):
+    def __init__(
+        self,
+        database: DatabaseManager,
+        cache_budget: int = WORKSPACE_CACHE_BUDGET,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self._database = database
+        # One live Workspace per row, shared by every caller
+        self._workspaces: IdentityMap[Workspace] = IdentityMap(
+            cache_budget, _workspace_size
+        )
         logger.debug(
             "WorkspaceService initialized with database at {}", database.database_path
         )
@@ -58,6 +104,22 @@ class WorkspaceService(GObject.Object):
             cls._service = cls(database=get_database_manager())
         return cls._service
 
+    def _emit(self, signal_name: str, *args):
+        """
+        Emit a signal on the main thread.
+
+        Service methods may run on the database worker thread, while signal
+        handlers are expected to run where the widgets live.
+        """
+        if threading.current_thread() is threading.main_thread():
+            self.emit(signal_name, *args)
+        else:
+            GLib.idle_add(self._emit_idle, signal_name, args)
+
+    def _emit_idle(self, signal_name: str, args: tuple) -> bool:
+        self.emit(signal_name, *args)
+        return GLib.SOURCE_REMOVE
+
     def create_workspace(
         self, name: str, description: str = None, cover: str = None, icon: str = None
     ) -> Workspace:
@@ -77,7 +139,10 @@ class WorkspaceService(GObject.Object):
             name, description, cover, icon, repository=self._database.repository
         )
         workspace.save_sync()
-        self.emit("workspace-created", workspace)
+        # The new row holds every property
+        workspace.take_changes()
+        self._workspaces.put(workspace.id, workspace)
+        self._emit("workspace-created", workspace)
         return workspace
 
     def get_workspace(self, workspace_id: str) -> Optional[Workspace]:
@@ -90,8 +155,14 @@ class WorkspaceService(GObject.Object):
         Returns:
             Workspace or None if not found
         """
+        if workspace := self._workspaces.get(workspace_id):
+            return workspace
+
         _filter = Gom.Filter.new_eq(Workspace, "id", workspace_id)
-        return self._database.repository.find_one_sync(Workspace, _filter)
+        workspace = self._database.repository.find_one_sync(Workspace, _filter)
+        if workspace is None:
+            return None
+        return self._workspaces.put(workspace.id, workspace)
 
     def get_workspace_by_name(self, name: str) -> Optional[Workspace]:
         """
@@ -124,7 +195,14 @@ class WorkspaceService(GObject.Object):
         Returns:
             List of recent workspaces
         """
-        return Workspace.get_recent(self._session, limit)
+        # Activations since the last flush are only in the access tracker
+        accessed = self._database.access_tracker.pending("workspaces")
+
+        def last_accessed(workspace: Workspace) -> int:
+            return max(workspace.last_accessed, accessed.get(workspace.id, 0))
+
+        workspaces = self.get_all_workspaces()
+        return sorted(workspaces, key=last_accessed, reverse=True)[:limit]
 
     def get_favorite_workspaces(self):
         """
@@ -146,33 +224,118 @@ class WorkspaceService(GObject.Object):
         group = self._database.repository.find_sorted_sync(Workspace, None, sorting)
         count = len(group)
         group.fetch_sync(0, count)
-        return list(group)
+        # Workspace rows are small, so every listed workspace becomes live
+        return [self._workspaces.put(workspace.id, workspace) for workspace in group]
+
+    def get_workspaces_model(self) -> ResourceListModel:
+        """
+        Get all workspaces as a list model fetching them as they are shown.
+
+        Returns:
+            List model of workspaces, sorted like get_all_workspaces()
+        """
+
+        def query() -> Gom.ResourceGroup:
+            sorting = Gom.Sorting(Workspace, "name", Gom.SortingMode.DESCENDING)
+            return self._database.repository.find_sorted_sync(
+                Workspace, None, sorting
+            )
+
+        def share(workspaces):
+            return [self._workspaces.put(ws.id, ws) for ws in workspaces]
+
+        return ResourceListModel(Workspace, query, self._database.submit, share)
 
     def update_workspace(self, workspace: Workspace) -> bool:
         """
         Update a workspace.
 
         Args:
-            workspace: Workspace to update
+            workspace: Workspace to update, the live object or a copy of it
+
+        Returns:
+            True if the update was queued, False otherwise
         """
-        try:
-            workspace.updated_at = int(datetime.datetime.now().timestamp())
-            workspace.update_access_time()
-            workspace.save_sync()
-            self.emit("workspace-updated", workspace)
+        return self._store_update(self._apply_edit(workspace))
+
+    def _apply_edit(self, workspace: Workspace) -> Workspace:
+        """
+        Move the edits of a workspace onto its live object.
+
+        The stored properties of a copy are assigned to the live workspace,
+        which only records the ones that differ. The modification and
+        access times are bumped as well.
 
+        Returns:
+            The live workspace
+        """
+        live = self._workspaces.put(workspace.id, workspace)
+        if live is not workspace:
+            for name in WORKSPACE_COLUMNS:
+                setattr(live, name, getattr(workspace, name))
+
+        live.updated_at = int(datetime.datetime.now().timestamp())
+        live.update_access_time()
+        return live
+
+    def _store_update(self, workspace: Workspace) -> bool:
+        try:
+            self._save_later(workspace)
+            self._workspaces.put(workspace.id, workspace)
         except GLib.Error as e:
             logger.error("Error: ", e.domain)
             logger.error(e)
+            return False
+
+        self._emit("workspace-updated", workspace)
+        return True
+
+    def _save_later(self, workspace: Workspace):
+        """
+        Queue a workspace for the next grouped write.
 
-        return False
+        Repeated saves before the flush are merged. The queued write stores
+        the properties changed by the time it runs, and nothing at all if
+        none were.
+        """
+        self._database.write_queue.enqueue(
+            ("workspaces", workspace.id),
+            functools.partial(self._write_workspace, workspace),
+        )
 
-    def delete_workspace(self, workspace_id: str) -> bool:
+    @staticmethod
+    def _write_workspace(workspace: Workspace, adapter: Gom.Adapter):
+        changes = workspace.take_changes()
+        columns = {
+            column: getattr(workspace, name)
+            for name, column in WORKSPACE_COLUMNS.items()
+            if name in changes
+        }
+        if not columns:
+            logger.debug("Workspace {} is unchanged, skipping write", workspace.id)
+            return
+
+        try:
+            update_row(adapter, "workspaces", workspace.id, columns)
+        except Exception:
+            # Written again with the next save
+            workspace.mark_changed(*changes)
+            raise
+        return functools.partial(workspace.mark_changed, *changes)
+
+    def delete_workspace(self, workspace_id: str) -> List[str]:
         """
-        Delete a workspace.
+        Delete a workspace together with all its pages.
+
+        The pages and the workspace row are deleted in one transaction.
+        Page listeners get one pages-deleted signal for the whole workspace.
 
         Args:
             workspace_id: Workspace ID to delete
+
+        Returns:
+            IDs of the deleted rows, the workspace first and then its pages;
+            empty if nothing was deleted
         """
         logger.debug("delete_workspace({})", workspace_id)
         try:
@@ -180,20 +343,39 @@ class WorkspaceService(GObject.Object):
         except GLib.Error as e:
             logger.error("Error: ", e.domain)
             logger.error(e)
-            return False
+            return []
 
-        if workspace:
-            logger.debug("Found workspace to delete: {}", workspace)
-            result = workspace.delete_sync()
-            self.emit("workspace-deleted", workspace, result)
-            return result
+        if not workspace:
+            return []
+
+        logger.debug("Found workspace to delete: {}", workspace)
+        try:
+            with PageService.get_default().batch():
+                page_ids = PageService.get_default().delete_workspace_pages(
+                    workspace_id
+                )
+                self._database.execute(
+                    "DELETE FROM workspaces WHERE id = ?", (workspace_id,)
+                )
+            deleted = [workspace_id, *page_ids]
+        except GLib.Error as e:
+            logger.error("Error: ", e.domain)
+            logger.error(e)
+            deleted = []
 
-        return False
+        if deleted:
+            self._workspaces.discard(workspace_id)
+            self._database.access_tracker.discard("workspaces", [workspace_id])
+        self._emit("workspace-deleted", workspace, bool(deleted))
+        return deleted
 
     def activate_workspace(self, workspace_id: str):
         """
         Activate a workspace.
 
+        Must be called on the main thread, where the workspace is bound by
+        widgets.
+
         Args:
             workspace_id: Workspace ID to activate
         """
@@ -204,8 +386,55 @@ class WorkspaceService(GObject.Object):
             logger.error(e)
             return False
 
-        workspace.update_access_time()
-        workspace.save_sync()
-        self.emit("workspace-activated", workspace)
-
+        if workspace:
+            self._activate(workspace)
         return None
+
+    def _activate(self, workspace: Workspace):
+        # Only the access time changes, the access tracker writes it later
+        timestamp = self._database.access_tracker.touch("workspaces", workspace.id)
+        workspace.set_untracked("last_accessed", timestamp)
+        self._emit("workspace-activated", workspace)
+
+    # Async API
+    #
+    # These methods run the blocking calls above on the database worker thread
+    # and return futures, so they can be awaited on the GLib event loop or
+    # scheduled without waiting for the result.
+
+    def create_workspace_async(
+        self, name: str, description: str = None, cover: str = None, icon: str = None
+    ) -> asyncio.Future:
+        return self._database.run_async(
+            self.create_workspace, name, description, cover, icon
+        )
+
+    def get_workspace_async(self, workspace_id: str) -> asyncio.Future:
+        return self._database.run_async(self.get_workspace, workspace_id)
+
+    def get_all_workspaces_async(self) -> asyncio.Future:
+        return self._database.run_async(self.get_all_workspaces)
+
+    def get_workspaces_model_async(self) -> asyncio.Future:
+        return self._database.run_async(self.get_workspaces_model)
+
+    def update_workspace_async(self, workspace: Workspace) -> asyncio.Future:
+        # The workspace is bound by widgets, so it is changed on this thread
+        live = self._apply_edit(workspace)
+        return self._database.run_async(self._store_update, live)
+
+    def delete_workspace_async(self, workspace_id: str) -> asyncio.Future:
+        return self._database.run_async(self.delete_workspace, workspace_id)
+
+    def activate_workspace_async(self, workspace_id: str) -> asyncio.Future:
+        # Only the lookup runs on the worker, the workspace is changed here
+        return asyncio.ensure_future(self._activate_workspace(workspace_id))
+
+    async def _activate_workspace(self, workspace_id: str):
+        try:
+            workspace = await self.get_workspace_async(workspace_id)
+        except GLib.Error:
+            # Already logged by the database worker
+            return
+        if workspace:
+            self._activate(workspace)
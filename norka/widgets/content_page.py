@@ -22,13 +22,19 @@
 #
 # SPDX-License-Identifier: MIT
 
+import asyncio
 from gettext import gettext as _
 
 from gi.repository import Adw, GLib, GObject, Gtk
 from loguru import logger
 
 from norka.models import Page, Workspace
-from norka.services import PageService, WorkspaceService
+from norka.services import (
+    PageOpenMetrics,
+    PageOpenTrace,
+    PageService,
+    WorkspaceService,
+)
 from norka.widgets.content_view import ContentView
 from norka.widgets.sidebar import Sidebar
 
@@ -38,6 +44,8 @@ class ContentPage(Adw.BreakpointBin):
     __gtype_name__ = "ContentPage"
 
     _workspace: Workspace | None = None
+    _open_task: asyncio.Task | None = None
+    _open_trace: PageOpenTrace | None = None
 
     split_view: Adw.OverlaySplitView = Gtk.Template.Child()
     sidebar_container: Adw.NavigationPage = Gtk.Template.Child()
@@ -49,8 +57,10 @@ class ContentPage(Adw.BreakpointBin):
 
         self._workspace_service = WorkspaceService.get_default()
         self._page_service = PageService.get_default()
+        self._open_metrics = PageOpenMetrics.get_default()
 
         self.content_view.connect("save-page", self._on_save_page)
+        self.content_view.editor_view.connect("page-loaded", self._on_page_loaded)
 
         self.split_view.bind_property(
             "show-sidebar",
@@ -89,37 +99,50 @@ class ContentPage(Adw.BreakpointBin):
         logger.debug("New page action activated")
 
         if self._workspace and self._page_service:
-            GLib.idle_add(self._create_page)
+            self._page_service.create_page_async(self._workspace.id, _("Untitled"), "")
 
     def _on_open_page_action(
         self, _sender: Gtk.Widget, _action: str, page_id: GLib.Variant = None
     ):
         logger.debug("Open page action activated: {}", page_id.get_string())
-        GLib.idle_add(self._open_page, page_id.get_string())
-
-    def _create_page(self):
-        self._page_service.create_page(self._workspace.id, _("Untitled"), "")
-        return False
-
-    def _open_page(self, page_id: str):
-        if page := self._page_service.get_page(page_id):
-            self.content_view.open_page(page)
-
-        return False
+        # A newer open supersedes the one in progress, whatever its stage
+        if self._open_task and not self._open_task.done():
+            self._open_task.cancel()
+        self._open_metrics.cancel(self._open_trace)
+        self._open_trace = self._open_metrics.start(page_id.get_string())
+        self._open_task = asyncio.create_task(
+            self._open_page(page_id.get_string(), self._open_trace)
+        )
 
-    def _on_save_page(self, _sender, page: Page):
-        logger.debug("Saving page: {}", page.text)
-        GLib.idle_add(self._save_page_async, page)
-        return False
+    async def _open_page(self, page_id: str, trace: PageOpenTrace):
+        page = await self._page_service.get_page_async(page_id)
+        trace.mark("fetch")
+        if not page:
+            self._open_metrics.cancel(trace)
+            return
 
-    def _save_page_async(self, page: Page):
-        self._page_service.update_page(
-            page.id,
-            page.title,
-            page.text,
-            page.tag_table,
-            page.icon,
-            page.cover,
-        )
-        # Remove source from Loop
+        trace.size = len(page.text or "")
+        self._page_service.record_access(page)
+        # The editor styles the view and shows the start of the page here,
+        # the rest is formatted in idle time and page-loaded, which always
+        # comes from the main loop afterwards, finishes the trace
+        self.content_view.open_page(page)
+        trace.mark("display")
+
+        breadcrumbs = await self._page_service.get_page_breadcrumbs_async(page_id)
+        self.content_view.set_breadcrumbs(breadcrumbs)
+
+    def _on_page_loaded(self, _sender, page: Page):
+        trace = self._open_trace
+        if trace and trace.page_id == page.id:
+            trace.mark("format")
+            self._open_metrics.finish(trace)
+
+    def save_now(self):
+        """Save the open page if it has edits waiting for the autosave."""
+        self.content_view.editor_view.save_now()
+
+    def _on_save_page(self, _sender, page: Page, text: str, content: GLib.Bytes):
+        logger.debug("Saving page: {}", page.id)
+        self._page_service.update_page_async(page.id, text=text, content=content)
         return False
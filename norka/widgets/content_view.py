@@ -22,9 +22,11 @@
 #
 # SPDX-License-Identifier: MIT
 
-from gi.repository import Adw, GObject, Gtk
+from typing import Sequence
 
-from norka.models import Page
+from gi.repository import Adw, GLib, GObject, Gtk
+
+from norka.models import Page, PageBreadcrumb
 from norka.widgets.editor_view import EditorView
 
 EMPTY_STACK_PAGE = "empty-view"
@@ -36,10 +38,12 @@ class ContentView(Adw.Bin):
     __gtype_name__ = "ContentView"
 
     __gsignals__ = {
-        "save-page": (GObject.SIGNAL_RUN_FIRST, None, (Page,)),
+        # page, text, binary tag table
+        "save-page": (GObject.SIGNAL_RUN_FIRST, None, (Page, str, GLib.Bytes)),
     }
 
     toggle_sidebar_btn: Gtk.Button = Gtk.Template.Child()
+    page_title: Adw.WindowTitle = Gtk.Template.Child()
     view_stack: Adw.ViewStack = Gtk.Template.Child()
     editor_view: EditorView = Gtk.Template.Child()
 
@@ -53,12 +57,24 @@ class ContentView(Adw.Bin):
             return
 
         self.view_stack.set_visible_child_name(EDITOR_STACK_PAGE)
+        self.page_title.set_title(page.title_with_icon.strip())
+        self.page_title.set_subtitle("")
         self.editor_view.page = page
         self.editor_view.grab_focus()
 
+    def set_breadcrumbs(self, breadcrumbs: Sequence[PageBreadcrumb]):
+        self.page_title.set_subtitle(
+            " / ".join(
+                f"{crumb.icon} {crumb.title}" if crumb.icon else crumb.title
+                for crumb in breadcrumbs
+            )
+        )
+
     def close_page(self):
         self.view_stack.set_visible_child_name(EMPTY_STACK_PAGE)
+        self.page_title.set_title("")
+        self.page_title.set_subtitle("")
         self.editor_view.page = None
 
-    def _save_page(self, sender, page: Page):
-        self.emit("save-page", page)
+    def _save_page(self, sender, page: Page, text: str, content: GLib.Bytes):
+        self.emit("save-page", page, text, content)
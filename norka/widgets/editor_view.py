@@ -21,17 +21,28 @@
 # SOFTWARE.
 #
 # SPDX-License-Identifier: MIT
-import json
-from typing import Dict, List, Tuple
+import hashlib
+import time
+from typing import Iterator
 
 from gi.overrides.Gtk import TextIter
 from gi.repository import Adw, Gdk, GLib, GObject, Gtk, GtkSource, Pango
 from loguru import logger
 
-from norka.models import Page
+from norka.models import (
+    Page,
+    TagRanges,
+    TagRangeTracker,
+    encode_tag_table,
+    plan_page_load,
+)
 from norka.widgets.editor_actions_popover import EditorActionsPopover
 
 PAGE_MIME_TYPE = "application/octet-stream"
+# Pause in editing after which the page is saved, in milliseconds
+AUTOSAVE_DELAY_MS = 1000
+# Time a page load may take per main loop iteration, in seconds
+LOAD_FRAME_BUDGET = 0.008
 
 
 @Gtk.Template(resource_path="/com/tenderowl/norka/ui/editor_view.ui")
@@ -39,7 +50,10 @@ class EditorView(Gtk.Box):
     __gtype_name__ = "EditorView"
 
     __gsignals__ = {
-        "save-page": (GObject.SIGNAL_RUN_FIRST, None, (Page,)),
+        # page, text, binary tag table
+        "save-page": (GObject.SIGNAL_RUN_FIRST, None, (Page, str, GLib.Bytes)),
+        # The page is fully loaded and can be edited
+        "page-loaded": (GObject.SIGNAL_RUN_FIRST, None, (Page,)),
     }
 
     text_view: GtkSource.View = Gtk.Template.Child()
@@ -48,8 +62,13 @@ class EditorView(Gtk.Box):
     action_popover: EditorActionsPopover
     gesture_click: Gtk.GestureClick = Gtk.Template.Child()
 
-    _page: Page | None
+    _page: Page | None = None
     _save_timer: int | None = None
+    # Digest of the text and tag table last handed over for saving
+    _saved_digest: bytes | None = None
+    # Idle source of the page load in progress
+    _load_source: int | None = None
+    _loading: bool = False
     _is_action_popover_open: bool = False
 
     def __init__(self, **kwargs):
@@ -59,6 +78,9 @@ class EditorView(Gtk.Box):
         language = language_manager.get_language("markdown")
 
         self._buffer.set_language(language)
+        # Autosave after a pause in typing or formatting, see also
+        # _on_tag_applied() and _on_tag_removed()
+        self._buffer.connect("changed", self._on_buffer_changed)
         self.gesture_click.connect("released", self._on_mouse_button_released)
         self.gesture_click.connect(
             "unpaired-release", self._on_mouse_button_unpaired_released
@@ -139,31 +161,138 @@ class EditorView(Gtk.Box):
         self.action_popover = EditorActionsPopover()
         self.action_popover.set_parent(self.text_view)
 
+        # Only the formatting tags created above are saved with the page,
+        # not the ones GtkSource adds for syntax highlighting nor the search
+        # highlight
+        self._format_tags = set()
+        self._buffer.get_tag_table().foreach(
+            lambda tag: self._format_tags.add(tag.props.name)
+        )
+        self._format_tags.discard(self.tag_found.props.name)
+        self._tag_ranges = TagRangeTracker()
+        self._buffer.connect("apply-tag", self._on_tag_applied)
+        self._buffer.connect("remove-tag", self._on_tag_removed)
+        self._buffer.connect("insert-text", self._on_text_inserted)
+        self._buffer.connect("delete-range", self._on_range_deleted)
+
     @GObject.Property
     def page(self) -> Page | None:
         return self._page
 
     @page.setter
     def page(self, page: Page | None):
+        # Keep the edits made to the previous page right before switching
+        self.save_now()
+        self._cancel_load()
         self._page = page
 
-        # Stop the save timer
-        if self._save_timer:
-            GLib.source_remove(self._save_timer)
-            self._save_timer = None
-
         if not page:
             return
 
-        # Set the page content
-        self._buffer.set_text(page.text or "")
-        self._apply_tags(json.loads(page.tag_table or "{}"))
-        logger.debug("Loaded page tag table: {}", json.loads(page.tag_table))
-        # And start the save timer for automatic saving
-        # self._save_timer = GLib.timeout_add_seconds(5, self._save_page)
-        logger.info("Autosaving disabled")
-
         self._apply_styling()
+        self._start_load(page)
+
+    def _start_load(self, page: Page):
+        """
+        Load the page into the buffer progressively.
+
+        The start of the page, which is what the view shows first, is
+        loaded right away. The rest of the text and tags follow in idle
+        time, a few milliseconds per main loop iteration, so large pages
+        show up before they are fully formatted. The buffer stays read-only
+        until the load completes. page-loaded is emitted from the main loop
+        even when the whole page fits in the first step, never from here.
+
+        Args:
+            page: Page to load
+        """
+        self._loading = True
+        self.text_view.set_editable(False)
+        # Loading the page is not an edit
+        self._cancel_autosave()
+        self._buffer.begin_irreversible_action()
+        self._buffer.set_text("")
+        self._tag_ranges.clear()
+
+        steps = self._load_steps(page.text or "", page.get_tag_ranges())
+        self._run_load_steps(steps)
+        # Text appended later lands past the cursor and leaves it in place
+        self._buffer.place_cursor(self._buffer.get_start_iter())
+        self._load_source = GLib.idle_add(
+            self._on_load_idle, steps, priority=GLib.PRIORITY_DEFAULT_IDLE
+        )
+
+    def _load_steps(self, text: str, tag_table: TagRanges) -> Iterator[None]:
+        """
+        Insert the text chunk by chunk, applying tags as their text arrives.
+
+        A range is applied once the text past its end is loaded, otherwise
+        text appended right after it would take the tag as well.
+
+        Args:
+            text: Page text
+            tag_table: Tags to apply to the text
+
+        Yields:
+            After every chunk of text and every batch of tag ranges
+        """
+        tags = self._buffer.get_tag_table()
+        ranges = [
+            (start, end, tag)
+            for name, tag_ranges in tag_table.items()
+            if (tag := tags.lookup(name)) is not None
+            for start, end in tag_ranges
+        ]
+
+        for step in plan_page_load(text, ranges):
+            if step.text:
+                self._buffer.insert(self._buffer.get_end_iter(), step.text)
+            for start, end, tag in step.ranges:
+                self._buffer.apply_tag(
+                    tag,
+                    self._buffer.get_iter_at_offset(start),
+                    self._buffer.get_iter_at_offset(end),
+                )
+            yield
+
+    def _run_load_steps(self, steps: Iterator[None]) -> bool:
+        """
+        Run page load steps until the frame budget is used up.
+
+        Returns:
+            True if the load has steps left
+        """
+        deadline = time.monotonic() + LOAD_FRAME_BUDGET
+        for _ in steps:
+            if time.monotonic() >= deadline:
+                return True
+        return False
+
+    def _on_load_idle(self, steps: Iterator[None]) -> bool:
+        if self._run_load_steps(steps):
+            return GLib.SOURCE_CONTINUE
+        self._load_source = None
+        self._finish_load()
+        return GLib.SOURCE_REMOVE
+
+    def _finish_load(self):
+        self._buffer.end_irreversible_action()
+        self._loading = False
+        self.text_view.set_editable(True)
+        self._saved_digest = self._digest(
+            self._get_text(), encode_tag_table(self._get_tag_table())
+        )
+        self.emit("page-loaded", self._page)
+
+    def _cancel_load(self):
+        """Stop the page load in progress, if any."""
+        if self._load_source:
+            GLib.source_remove(self._load_source)
+            self._load_source = None
+        if self._loading:
+            self._buffer.end_irreversible_action()
+            self._loading = False
+            self.text_view.set_editable(True)
 
     def _apply_styling(self) -> None:
         style_manager = Adw.StyleManager.get_default()
@@ -176,21 +305,6 @@ class EditorView(Gtk.Box):
         scheme = style_scheme_manager.get_scheme(scheme_id)
         self._buffer.set_style_scheme(scheme)
 
-    def _apply_tags(self, tag_table: Dict[str, List[Tuple[int, int]]]) -> None:
-        """
-        Applies tags to the editor view buffer from a tag table.
-
-        :param tag_table: A dictionary of tag names to lists of tag ranges.
-            Each tag range is a tuple of two integers representing the start
-            and end offsets of the tag in the buffer.
-        """
-        tag_table = tag_table
-        for tag_name in tag_table:
-            for tag_range in tag_table[tag_name]:
-                start_iter = self._buffer.get_iter_at_offset(tag_range[0])
-                end_iter = self._buffer.get_iter_at_offset(tag_range[1])
-                self._buffer.apply_tag_by_name(tag_name, start_iter, end_iter)
-
     @Gtk.Template.Callback
     def _on_key_pressed(
         self,
@@ -210,11 +324,61 @@ class EditorView(Gtk.Box):
             self._buffer.get_start_iter(), self._buffer.get_end_iter(), True
         ).strip()
 
+    def _on_buffer_changed(self, *_args):
+        if not self._page or self._loading:
+            return
+
+        # Restart the countdown on every edit, the save runs once typing pauses
+        self._cancel_autosave()
+        self._save_timer = GLib.timeout_add(
+            AUTOSAVE_DELAY_MS, self._on_autosave_timeout, priority=GLib.PRIORITY_LOW
+        )
+
+    def _on_autosave_timeout(self) -> bool:
+        self._save_timer = None
+        self._save_page()
+        return GLib.SOURCE_REMOVE
+
+    def _cancel_autosave(self):
+        if self._save_timer:
+            GLib.source_remove(self._save_timer)
+            self._save_timer = None
+
+    def save_now(self):
+        """Save pending edits right away instead of waiting for the autosave."""
+        if self._save_timer:
+            self._cancel_autosave()
+            self._save_page()
+
+    @staticmethod
+    def _digest(text: str, tag_table: bytes) -> bytes:
+        content = hashlib.blake2b(text.encode(), digest_size=16)
+        content.update(b"\0")
+        content.update(tag_table)
+        return content.digest()
+
     def _save_page(self):
+        """
+        Hand the page over for saving if its text or tags changed.
+
+        Only the buffer is read here. The page itself is left alone: its
+        new text and tags go out as values, and the service applies them
+        to the page on the database worker thread, which writes it.
+        """
+        # A partly loaded buffer must never overwrite the page
+        if not self._page or self._loading:
+            return
+
+        text = self._get_text()
+        tag_table = encode_tag_table(self._get_tag_table())
+        digest = self._digest(text, tag_table)
+        if digest == self._saved_digest:
+            logger.debug("Page {} is unchanged, skipping save", self._page.id)
+            return
+
         logger.debug("Saving page: {}", self._page)
-        self._page.text = self._get_text()
-        self.emit("save-page", self._page)
-        return True
+        self._saved_digest = digest
+        self.emit("save-page", self._page, text, GLib.Bytes.new(tag_table))
 
     def do_grab_focus(self):
         self.text_view.grab_focus()
@@ -225,6 +389,8 @@ class EditorView(Gtk.Box):
         self.apply_tag(tag_name.get_string())
 
     def apply_tag(self, tag_name: str):
+        if self._loading:
+            return
         bounds: tuple[Gtk.TextIter, Gtk.TextIter] = self._buffer.get_selection_bounds()
         if len(bounds) == 0:
             # If no text is selected, create a placeholder
@@ -247,41 +413,45 @@ class EditorView(Gtk.Box):
 
     @Gtk.Template.Callback()
     def _on_button_save_clicked(self, button):
-        bounds = self._buffer.get_bounds()
-        if len(bounds) == 0:
-            return
-
         logger.info("Begin saving page")
+        self._cancel_autosave()
+        self._save_page()
+
+    def _get_tag_table(self) -> TagRanges:
+        """
+        Get the tags applied to the buffer.
+
+        Returns:
+            Tag names mapped to lists of (start, end) offsets
+        """
+        return self._tag_ranges.to_dict()
+
+    # Tag ranges are tracked as the buffer changes. The handlers run before
+    # the default ones, so the iters still point into the unchanged text.
+
+    def _on_tag_applied(
+        self, _buffer, tag: Gtk.TextTag, start: TextIter, end: TextIter
+    ):
+        if tag.props.name in self._format_tags:
+            self._tag_ranges.add(tag.props.name, start.get_offset(), end.get_offset())
+            self._on_buffer_changed()
+
+    def _on_tag_removed(
+        self, _buffer, tag: Gtk.TextTag, start: TextIter, end: TextIter
+    ):
+        if tag.props.name in self._format_tags:
+            self._tag_ranges.remove(
+                tag.props.name, start.get_offset(), end.get_offset()
+            )
+            self._on_buffer_changed()
+
+    def _on_text_inserted(
+        self, _buffer, location: TextIter, text: str, _length: int
+    ):
+        self._tag_ranges.insert(location.get_offset(), len(text))
 
-        text_iter = self._buffer.get_start_iter()
-        # Tag table contains all tags applied to the text and their start and end positions
-        tag_table: Dict[str, Tuple[int, int]]() = {}
-        while text_iter.forward_to_tag_toggle():
-            # Get all tags toggled on the current position
-            # If the tag is not in the tag table, add it and set the start position
-            tags = text_iter.get_toggled_tags(toggled_on=True)
-            for tag in tags:
-                tag_name = tag.props.name
-                if tag_name not in tag_table:
-                    tag_table[tag_name] = []
-
-                tag_table[tag_name].append([text_iter.get_offset(), 0])
-
-            # Get all tags toggled off the current position
-            # If the tag is in the tag table, set the end position
-            tags = text_iter.get_toggled_tags(toggled_on=False)
-            for tag in tags:
-                tag_name = tag.props.name
-                if tag_name in tag_table:
-                    if tag_ranges := tag_table[tag_name]:
-                        tag_ranges[-1][1] = text_iter.get_offset()
-                        tag_table[tag_name] = tag_ranges
-
-        logger.info("Tag table: {}", tag_table)
-
-        self._page.tag_table = json.dumps(tag_table)
-        self._page.text = self._get_text()
-        self.emit("save-page", self._page)
+    def _on_range_deleted(self, _buffer, start: TextIter, end: TextIter):
+        self._tag_ranges.delete(start.get_offset(), end.get_offset())
 
     def on_text_changed(self, text_buffer):
         selection = text_buffer.get_selection_bounds()
@@ -22,12 +22,17 @@
 #
 # SPDX-License-Identifier: MIT
 
-from typing import Optional
+from typing import Dict, List, Optional
 
 from gi.repository import Gdk, Gio, GLib, GObject, Gtk
 from loguru import logger
 
-from norka.models import Page, PageNode, PageTreeItem
+from norka.models import (
+    PageTreeChange,
+    PageTreeChangeKind,
+    PageTreeIndex,
+    PageTreeItem,
+)
 from norka.services import PageService
 from norka.widgets.pages_tree_row import PagesTreeRow
 
@@ -41,13 +46,16 @@ class PagesTree(Gtk.Box):
     factory: Gtk.SignalListItemFactory = Gtk.Template.Child()
 
     __gsignals__ = {
-        "page-selected": (GObject.SIGNAL_RUN_FIRST, None, (Page,)),
+        "page-selected": (GObject.SIGNAL_RUN_FIRST, None, (str,)),
     }
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._tree_model: Optional[Gtk.TreeListModel] = None
         self._root_model: Optional[Gio.ListStore] = None
+        # Tree state kept to apply incremental changes
+        self._index: Optional[PageTreeIndex] = None
+        self._child_models: Dict[int, Gio.ListStore] = {}
 
         # Setup the factory callbacks for TreeExpander items
         self.factory.connect("setup", self._on_item_setup)
@@ -64,22 +72,28 @@ class PagesTree(Gtk.Box):
         self.install_action("page.change-workspace", "s", self._on_page_change_workspace)
         self.install_action("page.delete", "s", self._on_page_delete)
 
-    def populate_tree(self, page_nodes: list[PageNode]):
+    def populate_tree(self, index: PageTreeIndex):
         """
-        Populate the tree with PageNode objects from PageService.get_page_tree().
+        Populate the tree from PageService.get_page_tree_index().
+
+        Only the root rows get a PageTreeItem here, the rows of other
+        pages are created when their parent is expanded.
 
         Args:
-            page_nodes: List of root PageNode objects from PageService.get_page_tree()
+            index: Page hierarchy of the workspace
         """
-        logger.debug("Populating tree with {} root nodes", len(page_nodes))
+        logger.debug(
+            "Populating tree with {} root pages", index.child_count(-1)
+        )
+
+        self._index = index
+        self._child_models = {}
 
         # Create the root model with PageTreeItem objects
         self._root_model = Gio.ListStore.new(PageTreeItem)
-
-        # Add all root nodes to the model
-        for node in page_nodes:
-            tree_item = PageTreeItem(node)
-            self._root_model.append(tree_item)
+        self._root_model.splice(
+            0, 0, [PageTreeItem(index, slot) for slot in index.children()]
+        )
 
         # Create TreeListModel with a function to create child models
         self._tree_model = Gtk.TreeListModel.new(
@@ -107,27 +121,159 @@ class PagesTree(Gtk.Box):
         Returns:
             Gio.ListStore containing child PageTreeItem objects, or None if no children
         """
-        page_node = item.page_node
-
-        if not page_node.children:
+        index = self._index
+        if index is None or not index.child_count(item.slot):
             return None
 
         # Create a ListStore for the children
         child_model = Gio.ListStore.new(PageTreeItem)
-
-        # Add all child nodes
-        for child_node in page_node.children:
-            child_item = PageTreeItem(child_node)
-            child_model.append(child_item)
+        child_model.splice(
+            0, 0, [PageTreeItem(index, slot) for slot in index.children(item.slot)]
+        )
 
         logger.debug(
             "Created child model with {} items for '{}'",
-            len(page_node.children),
-            page_node.page.title,
+            child_model.get_n_items(),
+            item.title,
         )
 
+        self._child_models[item.slot] = child_model
         return child_model
 
+    def apply_changes(self, changes: list[PageTreeChange]):
+        """
+        Apply incremental changes from PageService to the populated tree.
+
+        Only the index links and the sibling stores of the affected pages
+        are touched, so the cost depends on the number of siblings rather
+        than on the size of the workspace, and expanded rows stay expanded.
+
+        Args:
+            changes: Changes in the order they happened
+        """
+        index = self._index
+        if not self._root_model or index is None:
+            return
+
+        for change in changes:
+            page = change.page
+            slot = index.slot(page.id)
+            match change.kind:
+                case PageTreeChangeKind.INSERTED:
+                    if slot == -1 and self._has_parent(change.parent_id):
+                        slot = index.insert(
+                            page.id,
+                            change.parent_id,
+                            page.title,
+                            page.icon,
+                            page.sort_order,
+                            change.position,
+                        )
+                        self._show_row(slot)
+                case PageTreeChangeKind.REMOVED:
+                    if slot != -1:
+                        parent_slot = self._hide_row(slot)
+                        self._forget_subtree(slot)
+                        index.remove(slot)
+                        self._update_expander(parent_slot)
+                case PageTreeChangeKind.RETITLED if self._keeps_place(slot, change):
+                    # Same place among its siblings, keep the row with its
+                    # expanded subtree and the selection
+                    index.update(slot, page.title, page.icon, page.sort_order)
+                    self._notify_row(slot)
+                case PageTreeChangeKind.MOVED | PageTreeChangeKind.RETITLED:
+                    # Moves, and renames that reorder the siblings
+                    if slot == -1:
+                        continue
+                    parent_slot = self._hide_row(slot)
+                    index.update(slot, page.title, page.icon, page.sort_order)
+                    if self._has_parent(change.parent_id):
+                        index.move(slot, change.parent_id, change.position)
+                        self._update_expander(parent_slot)
+                        self._show_row(slot)
+                    else:
+                        # Moved to a parent outside of this tree
+                        self._forget_subtree(slot)
+                        index.remove(slot)
+                        self._update_expander(parent_slot)
+
+    def _keeps_place(self, slot: int, change: PageTreeChange) -> bool:
+        """Whether a page stays at its row among the same siblings."""
+        if slot == -1:
+            return False
+        index = self._index
+        parent_slot = index.slot(change.parent_id) if change.parent_id else -1
+        return (
+            index.parent(slot) == parent_slot
+            and index.position(slot) == change.position
+        )
+
+    def _has_parent(self, parent_id: Optional[str]) -> bool:
+        return not parent_id or parent_id in self._index
+
+    def _forget_subtree(self, slot: int):
+        """Drop the child stores of a subtree that leaves the tree."""
+        pending = [slot]
+        while pending:
+            current = pending.pop()
+            if self._child_models.pop(current, None) is not None:
+                pending.extend(self._index.children(current))
+
+    def _model_for(self, parent_slot: int) -> Optional[Gio.ListStore]:
+        """Get the list store showing the children of a page, if it exists."""
+        if parent_slot == -1:
+            return self._root_model
+        return self._child_models.get(parent_slot)
+
+    def _show_row(self, slot: int):
+        """Add the row of a page that was just linked into the index."""
+        index = self._index
+        parent_slot = index.parent(slot)
+        if (model := self._model_for(parent_slot)) is not None:
+            model.insert(index.position(slot), PageTreeItem(index, slot))
+        elif index.child_count(parent_slot) == 1:
+            # A leaf got its first child and has to become expandable
+            self._refresh_row(parent_slot)
+
+    def _hide_row(self, slot: int) -> int:
+        """
+        Remove the row of a page that is about to be unlinked.
+
+        Returns:
+            Slot of the parent page
+        """
+        index = self._index
+        parent_slot = index.parent(slot)
+        if (model := self._model_for(parent_slot)) is not None:
+            model.remove(index.position(slot))
+        return parent_slot
+
+    def _update_expander(self, parent_slot: int):
+        """Drop the expander of a page whose last child is gone."""
+        if parent_slot != -1 and not self._index.child_count(parent_slot):
+            self._child_models.pop(parent_slot, None)
+            self._refresh_row(parent_slot)
+
+    def _notify_row(self, slot: int):
+        """Let the row of a page show its new title and icon."""
+        index = self._index
+        model = self._model_for(index.parent(slot))
+        if model is None:
+            return
+
+        item: PageTreeItem = model.get_item(index.position(slot))
+        item.notify("title")
+        item.notify("icon")
+
+    def _refresh_row(self, slot: int):
+        """Replace the item of a page so the tree re-evaluates its children."""
+        index = self._index
+        model = self._model_for(index.parent(slot))
+        if model is None:
+            return
+
+        model.splice(index.position(slot), 1, [PageTreeItem(index, slot)])
+
     def _on_item_setup(
             self, _factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem
     ):
@@ -174,8 +320,15 @@ class PagesTree(Gtk.Box):
         child.expander.set_list_row(tree_list_row)
 
         # Bind the data to the UI elements
-        child.icon_label.set_text(page_tree_item.icon)
-        child.title_label.set_text(page_tree_item.title)
+        # Renames notify the item, the labels follow without a rebind
+        child.bindings = [
+            page_tree_item.bind_property(
+                "icon", child.icon_label, "label", GObject.BindingFlags.SYNC_CREATE
+            ),
+            page_tree_item.bind_property(
+                "title", child.title_label, "label", GObject.BindingFlags.SYNC_CREATE
+            ),
+        ]
         child.item = page_tree_item
 
         # Add CSS classes for styling
@@ -196,6 +349,10 @@ class PagesTree(Gtk.Box):
             # Clear the list row reference
             child.expander.set_list_row(None)
 
+            for binding in child.bindings:
+                binding.unbind()
+            child.bindings = []
+
             # Remove CSS classes
             child.remove_css_class("tree-item-expandable")
             child.remove_css_class("tree-item-leaf")
@@ -207,9 +364,8 @@ class PagesTree(Gtk.Box):
         try:
             widget = ev_drag.get_widget()
             item: PageTreeItem = widget.item
-            page = item.page_node.page
-            logger.debug("Dragging page: {}", page)
-            return Gdk.ContentProvider.new_for_value(page.id)
+            logger.debug("Dragging page: {}", item.page_id)
+            return Gdk.ContentProvider.new_for_value(item.page_id)
 
         except Exception as e:
             logger.error("Failed to set drag cursor: {}", e)
@@ -234,15 +390,15 @@ class PagesTree(Gtk.Box):
                 logger.debug("DropTarget files list: {}", drop)
             case str():
                 drop_widget = ev_drop.get_widget()
-                page_node: PageTreeItem = drop_widget.item.page_node
+                item: PageTreeItem = drop_widget.item
 
-                if drop == page_node.page.id:
+                if drop == item.page_id:
                     logger.info("Cannot move a page to itself")
                     self.activate_action("win.notify", GLib.Variant.new_string("Cannot move a page to itself"))
                     return False
 
-                logger.debug("Move {} as c child of {}", drop, page_node)
-                PageService.get_default().move_page(drop, page_node.page.id)
+                logger.debug("Move {} as c child of {}", drop, item.page_id)
+                PageService.get_default().move_page_async(drop, item.page_id)
 
         return True
 
@@ -280,13 +436,12 @@ class PagesTree(Gtk.Box):
         if not page_tree_item:
             return
 
-        # Get the actual Page object
-        page = page_tree_item.page_node.page
-
-        logger.debug("Selected page: {} (ID: {})", page.title, page.id)
+        logger.debug(
+            "Selected page: {} (ID: {})", page_tree_item.title, page_tree_item.page_id
+        )
 
-        # Emit signal with the selected page
-        self.emit("page-selected", page)
+        # Emit signal with the selected page id, the page itself is loaded on open
+        self.emit("page-selected", page_tree_item.page_id)
 
     @Gtk.Template.Callback
     def _on_mouse_enter(
@@ -318,12 +473,12 @@ class PagesTree(Gtk.Box):
         """
         self._on_item_bind(factory, list_item)
 
-    def get_selected_page(self) -> Optional[Page]:
+    def get_selected_page_id(self) -> Optional[str]:
         """
-        Get the currently selected page.
+        Get the ID of the currently selected page.
 
         Returns:
-            Selected Page object or None if nothing is selected
+            Selected page ID or None if nothing is selected
         """
         selected_item = self.selection.get_selected_item()
         if not selected_item:
@@ -333,7 +488,25 @@ class PagesTree(Gtk.Box):
         if not page_tree_item:
             return None
 
-        return page_tree_item.page_node.page
+        return page_tree_item.page_id
+
+    def get_neighbour_page_ids(self, page_id: str, limit: int) -> List[str]:
+        """
+        Get the pages next to a page in the tree.
+
+        Args:
+            page_id: Page ID
+            limit: Maximum number of page IDs to return
+
+        Returns:
+            IDs of the page's first children and nearest siblings
+        """
+        if not self._index or (slot := self._index.slot(page_id)) == -1:
+            return []
+        return [
+            self._index.page_id(neighbour)
+            for neighbour in self._index.neighbours(slot, limit)
+        ]
 
     def select_page(self, page_id: str) -> bool:
         """
@@ -358,7 +531,7 @@ class PagesTree(Gtk.Box):
             if not page_tree_item:
                 continue
 
-            if page_tree_item.page_node.page.id == page_id:
+            if page_tree_item.page_id == page_id:
                 self.selection.set_selected(i)
                 return True
 
@@ -41,6 +41,8 @@ class PagesTreeRow(Gtk.Box):
     item: PageTreeItem = GObject.Property(type=GObject.TYPE_PYOBJECT)
 
     popover: Gtk.PopoverMenu
+    # Bindings of the labels to the bound item
+    bindings: list[GObject.Binding]
     _edit_menu: Gio.Menu | None
     _menu_subpages: Gio.MenuItem
     _menu_rename: Gio.MenuItem
@@ -50,6 +52,7 @@ class PagesTreeRow(Gtk.Box):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.bindings = []
 
         self.popover = Gtk.PopoverMenu(position=Gtk.PositionType.RIGHT)
         self.popover.set_parent(self)
@@ -59,31 +62,31 @@ class PagesTreeRow(Gtk.Box):
         self._edit_menu.append_item(
             Gio.MenuItem.new(
                 _("New Subpage"),
-                detailed_action=f"page.add-page('{self.item.page_node.page.id}')",
+                detailed_action=f"page.add-page('{self.item.page_id}')",
             )
         )
         self._edit_menu.append_item(
             Gio.MenuItem.new(
                 _("Rename"),
-                detailed_action=f"page.rename('{self.item.page_node.page.id}')",
+                detailed_action=f"page.rename('{self.item.page_id}')",
             )
         )
         self._edit_menu.append_item(
             Gio.MenuItem.new(
                 _("Duplicate"),
-                detailed_action=f"page.duplicate('{self.item.page_node.page.id}')",
+                detailed_action=f"page.duplicate('{self.item.page_id}')",
             )
         )
 
         self._edit_menu.append_item(
             Gio.MenuItem.new(
                 _("Move to Workspace"),
-                detailed_action=f"page.change-workspace('{self.item.page_node.page.id}')",
+                detailed_action=f"page.change-workspace('{self.item.page_id}')",
             )
         )
         self._menu_delete = Gio.MenuItem.new(
             _("Delete"),
-            detailed_action=f"page.delete('{self.item.page_node.page.id}')",
+            detailed_action=f"page.delete('{self.item.page_id}')",
         )
 
         delete_section = Gio.Menu()
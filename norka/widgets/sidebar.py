@@ -22,11 +22,14 @@
 #
 # SPDX-License-Identifier: MIT
 
+import asyncio
+
 from gi.repository import Adw, GLib, GObject, Gtk
 from loguru import logger
 
-from norka.models import Page, Workspace
+from norka.models import PageTreeChange, Workspace
 from norka.services import PageService
+from norka.services.page_service import PREFETCH_NEIGHBOURS
 from norka.widgets.pages_tree import PagesTree
 
 
@@ -37,18 +40,18 @@ class Sidebar(Adw.Bin):
     pages_tree: PagesTree = Gtk.Template.Child()
 
     _workspace: Workspace | None
+    _tree_task: asyncio.Task | None = None
 
     __gsignals__ = {
-        "page-selected": (GObject.SIGNAL_RUN_FIRST, None, (Page,)),
+        "page-selected": (GObject.SIGNAL_RUN_FIRST, None, (str,)),
     }
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
         self._page_service = PageService.get_default()
-        self._page_service.connect("page-created", self._on_page_created)
-        self._page_service.connect("page-tree-changed", lambda *args: GLib.idle_add(self._get_page_tree))
-        
+        self._page_service.connect("page-tree-delta", self._on_page_tree_delta)
+
         # Connect to pages tree signals
         self.pages_tree.connect("page-selected", self._on_page_selected)
 
@@ -63,24 +66,49 @@ class Sidebar(Adw.Bin):
         if not workspace:
             return
 
-        GLib.idle_add(self._get_page_tree)
-
-    def _get_page_tree(self):
-        page_nodes = self._page_service.get_page_tree(self._workspace.id)
-        
-        logger.debug("Pages Tree: {}", page_nodes)
-        
-        # Populate the tree widget with the page nodes
-        self.pages_tree.populate_tree(page_nodes)
-
-    def _on_page_created(self, sender, page: Page):
-        logger.debug("Page created: {}", page)
-        # Refresh the tree when a new page is created
-        if self._workspace:
-            GLib.idle_add(self._get_page_tree)
-    
-    def _on_page_selected(self, sender, page: Page):
-        logger.debug("Page selected: {}", page)
+        self._reload_page_tree()
+
+    def _reload_page_tree(self):
+        # A newer reload supersedes the one still waiting for the database
+        if self._tree_task and not self._tree_task.done():
+            self._tree_task.cancel()
+        self._tree_task = asyncio.create_task(self._get_page_tree())
+
+    async def _get_page_tree(self):
+        if not self._workspace:
+            return
+
+        workspace_id = self._workspace.id
+        index = await self._page_service.get_page_tree_index_async(workspace_id)
+        if not self._workspace or self._workspace.id != workspace_id:
+            return
+
+        logger.debug("Pages Tree: {} pages", len(index))
+
+        # Populate the tree widget with the page hierarchy
+        self.pages_tree.populate_tree(index)
+
+    def _on_page_tree_delta(
+        self, _sender, workspace_id: str, changes: list[PageTreeChange]
+    ):
+        if not self._workspace or self._workspace.id != workspace_id:
+            return
+
+        if self._tree_task and not self._tree_task.done():
+            # The tree is still loading, take the changes from a fresh copy
+            self._reload_page_tree()
+            return
+
+        logger.debug("Applying {} page tree changes", len(changes))
+        self.pages_tree.apply_changes(changes)
+
+    def _on_page_selected(self, sender, page_id: str):
+        logger.debug("Page selected: {}", page_id)
         # Emit the signal to parent widgets
-        self.emit("page-selected", page)
-        self.activate_action("win.open-page", GLib.Variant.new_string(page.id))
+        self.emit("page-selected", page_id)
+        self.activate_action("win.open-page", GLib.Variant.new_string(page_id))
+        # The next click is usually a page nearby in the tree or a recent one
+        self._page_service.prefetch(
+            self.pages_tree.get_neighbour_page_ids(page_id, PREFETCH_NEIGHBOURS),
+            self._workspace.id if self._workspace else None,
+        )
@@ -21,11 +21,13 @@
 # SOFTWARE.
 #
 # SPDX-License-Identifier: MIT
-from typing import List
+import asyncio
+from typing import Optional
 
-from gi.repository import Gio, GLib, GObject, Gtk
+from gi.repository import GLib, GObject, Gtk
 from loguru import logger
 
+from norka.models import ResourceListModel
 from norka.models.workspace import Workspace
 from norka.services import WorkspaceService
 from norka.widgets.edit_workspace_dialog import EditWorkspaceDialog
@@ -39,16 +41,15 @@ CONTENT_STACK_PAGE = "content-view"
 class WorkspaceView(Gtk.Box):
     __gtype_name__ = "WorkspaceView"
 
-    _workspaces: List[Workspace]
+    _workspaces: Optional[ResourceListModel]
 
     screens: Gtk.Stack = Gtk.Template.Child()
     grid_view: Gtk.GridView = Gtk.Template.Child(name="grid_view")
     selection_model: Gtk.NoSelection = Gtk.Template.Child()
-    workspaces_store: Gio.ListStore = Gtk.Template.Child()
 
-    def __init__(self, workspaces: List[Workspace] = None):
+    def __init__(self, workspaces: ResourceListModel = None):
         super().__init__()
-        self._workspaces = workspaces or []
+        self._workspaces = None
 
         self.grid_view.remove_css_class("view")
 
@@ -56,23 +57,32 @@ class WorkspaceView(Gtk.Box):
         self.install_action("edit-workspace", "s", self._on_edit_workspace)
         self.install_action("delete-workspace", "s", self._on_delete_workspace)
 
+        if workspaces:
+            self.workspaces = workspaces
+
     @GObject.Property
-    def workspaces(self) -> List[Workspace]:
+    def workspaces(self) -> Optional[ResourceListModel]:
         return self._workspaces
 
     @workspaces.setter
-    def workspaces(self, workspaces: List[Workspace]):
+    def workspaces(self, workspaces: ResourceListModel):
+        if self._workspaces:
+            self._workspaces.disconnect_by_func(self._on_workspaces_changed)
         self._workspaces = workspaces
+        self._workspaces.connect("items-changed", self._on_workspaces_changed)
+
+        self.selection_model.set_model(workspaces)
+        self._update_screen()
 
-        if not self._workspaces:
+    def _on_workspaces_changed(self, model, position, removed, added):
+        self._update_screen()
+
+    def _update_screen(self):
+        if not self._workspaces.get_n_items():
             self.screens.set_visible_child_name(EMPTY_STACK_PAGE)
         else:
             self.screens.set_visible_child_name(CONTENT_STACK_PAGE)
 
-        self.workspaces_store.remove_all()
-        for workspace in self._workspaces:
-            self.workspaces_store.append(workspace)
-
     @Gtk.Template.Callback()
     def _on_item_setup(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem):
         list_item.set_child(WorkspaceCard())
@@ -81,17 +91,23 @@ class WorkspaceView(Gtk.Box):
     def _on_item_bind(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem):
         item = list_item.get_item()
         workspace_card = list_item.get_child()
-        workspace_card.workspace = item
+        # Rows still being fetched are bound again once they arrive
+        loaded = self._workspaces.is_loaded(list_item.get_position())
+        workspace_card.set_opacity(1 if loaded else 0)
+        if loaded:
+            workspace_card.workspace = item
 
     @Gtk.Template.Callback()
     def _on_item_activate(self, _sender: Gtk.GridView, position: int):
         logger.debug("Position: {}", position)
-        workspace: Workspace = self.workspaces_store.get_item(position)
+        if not self._workspaces.is_loaded(position):
+            return
+        workspace: Workspace = self._workspaces.get_item(position)
         if not workspace:
             return
         logger.debug("Workspace: {}", workspace)
 
-        GLib.idle_add(WorkspaceService.get_default().activate_workspace, workspace.id)
+        WorkspaceService.get_default().activate_workspace_async(workspace.id)
 
     def _on_delete_workspace(self, sender, action: str, workspace_id: GLib.Variant):
         logger.debug("{}: {}", action, workspace_id.get_string())
@@ -106,13 +122,19 @@ class WorkspaceView(Gtk.Box):
         if not workspace_id:
             return None
 
-        workspace = WorkspaceService.get_default().get_workspace(_workspace_id)
+        asyncio.create_task(self._edit_workspace(_workspace_id))
+        return None
+
+    async def _edit_workspace(self, workspace_id: str):
+        workspace = await WorkspaceService.get_default().get_workspace_async(
+            workspace_id
+        )
         if not workspace:
-            return None
+            return
 
         dialog = EditWorkspaceDialog(workspace=workspace)
         dialog.connect("workspace-updated", self._on_workspace_updated)
-        return dialog.present(self)
+        dialog.present(self)
 
     def _on_favorite_workspace(self, sender, action: str, workspace_id: GLib.Variant):
         logger.debug("{}: {}", action, workspace_id.get_string())
@@ -123,5 +145,5 @@ class WorkspaceView(Gtk.Box):
 
     def _on_workspace_updated(self, sender, workspace: Workspace):
         logger.debug("Workspace: {}", workspace)
-        GLib.idle_add(WorkspaceService.get_default().update_workspace, workspace)
+        WorkspaceService.get_default().update_workspace_async(workspace)
 
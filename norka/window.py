@@ -22,11 +22,13 @@
 #
 # SPDX-License-Identifier: MIT
 
+import asyncio
+
 from gi.repository import Adw, Gio, GLib, Gtk
 from gi.types import GObjectMeta
 from loguru import logger
 
-from norka.models import Workspace
+from norka.models import Workspace, get_database_manager
 from norka.services import WorkspaceService
 from norka.widgets.add_workspace_dialog import AddWorkspaceDialog
 from norka.widgets.content_page import ContentPage
@@ -45,6 +47,8 @@ class NorkaWindow(Adw.ApplicationWindow):
     workspace_view: WorkspaceView = Gtk.Template.Child()
     content_page: ContentPage = Gtk.Template.Child()
 
+    _workspaces_task: asyncio.Task | None = None
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -68,22 +72,31 @@ class NorkaWindow(Adw.ApplicationWindow):
         self.workspace_service = WorkspaceService.get_default()
         self.workspace_service.connect(
             "workspace-created",
-            lambda _, workspace: GLib.idle_add(self._get_workspaces),
+            lambda _, workspace: self._reload_workspaces(),
         )
         self.workspace_service.connect(
             "workspace-updated",
-            lambda _, workspace: GLib.idle_add(self._get_workspaces),
+            lambda _, workspace: self._reload_workspaces(),
         )
         self.workspace_service.connect(
             "workspace-deleted",
-            lambda _, workspace, deleted: GLib.idle_add(self._get_workspaces),
+            lambda _, workspace, deleted: self._reload_workspaces(),
         )
 
         self.workspace_service.connect(
             "workspace-activated", self._on_workspace_activated
         )
 
-        GLib.idle_add(self._get_workspaces)
+        self.connect("close-request", self._on_close_request)
+
+        GLib.idle_add(self._reload_workspaces)
+
+    def _on_close_request(self, _window: Gtk.Window) -> bool:
+        # Don't keep edits waiting for the autosave or in the write queue
+        # once the window is gone
+        self.content_page.save_now()
+        get_database_manager().flush_writes()
+        return False
 
     def _install_actions(self):
         self.install_action(
@@ -105,8 +118,14 @@ class NorkaWindow(Adw.ApplicationWindow):
     def add_toast(self, toast: Adw.Toast):
         self.toast_overlay.add_toast(toast)
 
-    def _get_workspaces(self):
-        workspaces = self.workspace_service.get_all_workspaces()
+    def _reload_workspaces(self):
+        if self._workspaces_task and not self._workspaces_task.done():
+            self._workspaces_task.cancel()
+        self._workspaces_task = asyncio.create_task(self._get_workspaces())
+        return GLib.SOURCE_REMOVE
+
+    async def _get_workspaces(self):
+        workspaces = await self.workspace_service.get_workspaces_model_async()
         self.workspace_view.workspaces = workspaces
 
     @Gtk.Template.Callback()
@@ -117,7 +136,9 @@ class NorkaWindow(Adw.ApplicationWindow):
 
     def _on_workspace_created(self, sender, workspace_name, emoji, cover):
         logger.debug("Workspace created: {} {}", emoji, workspace_name)
-        self.workspace_service.create_workspace(workspace_name, icon=emoji, cover=cover)
+        self.workspace_service.create_workspace_async(
+            workspace_name, icon=emoji, cover=cover
+        )
 
     def _on_workspace_activated(self, _service: WorkspaceService, workspace: Workspace):
         logger.debug("Workspace: {}", workspace)